@@ -8,7 +8,7 @@ les plus rapides entre chaque plateforme régionale.
 from pathlib import Path
 from loader import load_graph_from_file
 from floyd import floyd_warshall
-from output import reconstruct_path
+from path_queries import query_paths
 
 # Fichier de données utilisé pour l'exemple
 GRAPH_FILE = Path("graphs/g14_application.txt")
@@ -54,9 +54,10 @@ def describe_network(n_vertices: int, n_edges: int) -> None:
 def print_sample_paths(L, P) -> None:
     """Affiche quelques plus courts chemins commentés."""
     print("\n=== ITINÉRAIRES OPTIMAUX COMMENTÉS ===")
-    for start, end in OD_QUERIES:
-        path = reconstruct_path(P, start, end)
-        readable_path = " -> ".join(CITY_LABELS.get(p, str(p)) for p in path)
+    # Toutes les paires sont reconstruites en un seul lot
+    batch = query_paths(L, P, OD_QUERIES)
+    for t, (start, end) in enumerate(OD_QUERIES):
+        readable_path = " -> ".join(CITY_LABELS.get(int(p), str(p)) for p in batch.path(t))
         print(f"{CITY_LABELS[start]} → {CITY_LABELS[end]} : {readable_path} (temps cumulé = {L[start][end]} h)")
 
         # Ajoute une brève interprétation métier
@@ -78,12 +79,7 @@ def main() -> None:
 
     graph = load_graph_from_file(str(GRAPH_FILE))
     # Compte des arcs avant modification des matrices par l'algorithme
-    edge_count = sum(
-        1
-        for i in range(graph.n)
-        for j in range(graph.n)
-        if i != j and graph.L[i][j] != float("inf")
-    )
+    edge_count = graph.arc_count()
 
     L, P, has_negative_cycle = floyd_warshall(graph.L, graph.P, verbose=False)
 
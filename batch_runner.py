@@ -0,0 +1,118 @@
+# batch_runner.py
+# Traitement d'un lot de fichiers de graphes par plusieurs processus
+# Délai maximal par graphe, et isolation des plantages : un fichier défectueux n'arrête pas le lot
+
+import time
+from collections import deque
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+
+
+def run_batch(items, job, workers=1, timeout=None):
+    """
+    Applique job(item) à chaque élément de items, dans un groupe de workers processus.
+
+    - job : fonction de niveau module (ou functools.partial d'une telle fonction),
+      pour pouvoir être transmise aux processus
+    - timeout : durée maximale (en secondes) pour un élément ; au-delà, le processus
+      est arrêté et remplacé
+
+    Retourne la liste des résultats, dans l'ordre de items : (True, valeur) si job
+    a réussi, (False, message) en cas d'exception, de délai dépassé ou de plantage
+    du processus (le processus est alors remplacé et le lot continue).
+    """
+    items = list(items)
+    resultats = [None] * len(items)
+    a_faire = deque(range(len(items)))
+    libres = []
+    occupes = {}  # connexion -> (worker, indice, échéance)
+
+    try:
+        while a_faire or occupes:
+            # Distribution : un élément par processus libre (créé au besoin)
+            while a_faire and (libres or len(occupes) < workers):
+                worker = libres.pop() if libres else _Worker(job)
+                indice = a_faire.popleft()
+                worker.conn.send((indice, items[indice]))
+                echeance = None if timeout is None else time.monotonic() + timeout
+                occupes[worker.conn] = (worker, indice, echeance)
+
+            echeances = [e for _, _, e in occupes.values() if e is not None]
+            attente = None if not echeances else max(0, min(echeances) - time.monotonic())
+            prets = wait(list(occupes) + [w.process.sentinel for w, _, _ in occupes.values()], attente)
+
+            for conn, (worker, indice, echeance) in list(occupes.items()):
+                if conn in prets:
+                    try:
+                        _, resultats[indice] = conn.recv()
+                    except (EOFError, OSError):
+                        worker.process.join()
+                        resultats[indice] = (False, f"Processus arrêté brutalement (code {worker.process.exitcode}).")
+                        worker.close()
+                        del occupes[conn]
+                        continue
+                    del occupes[conn]
+                    libres.append(worker)
+                elif worker.process.sentinel in prets or not worker.process.is_alive():
+                    worker.process.join()
+                    resultats[indice] = (False, f"Processus arrêté brutalement (code {worker.process.exitcode}).")
+                    worker.close()
+                    del occupes[conn]
+                elif echeance is not None and time.monotonic() >= echeance:
+                    resultats[indice] = (False, f"Délai dépassé ({timeout} s).")
+                    worker.close()
+                    del occupes[conn]
+    finally:
+        for worker in libres:
+            worker.stop()
+        for worker, _, _ in occupes.values():
+            worker.close()
+
+    return resultats
+
+
+class _Worker:
+    """Processus de calcul : reçoit des (indice, élément), renvoie (indice, résultat)."""
+
+    def __init__(self, job):
+        self.conn, conn_enfant = Pipe()
+        self.process = Process(target=_worker_loop, args=(conn_enfant, job), daemon=True)
+        self.process.start()
+        conn_enfant.close()
+
+    def stop(self):
+        """Arrêt normal : le processus termine sa boucle."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        self.close()
+
+    def close(self):
+        """Arrêt immédiat (délai dépassé, plantage ou fin du lot)."""
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+def _worker_loop(conn, job):
+    """Boucle d'un processus de calcul, jusqu'à la réception de None."""
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        indice, item = message
+        try:
+            resultat = (True, job(item))
+        except Exception as e:
+            resultat = (False, f"{type(e).__name__}: {e}")
+        try:
+            conn.send((indice, resultat))
+        except Exception as e:
+            # Résultat impossible à transmettre (pickle) : signalé comme une erreur du job
+            conn.send((indice, (False, f"Résultat non transmissible : {type(e).__name__}: {e}")))
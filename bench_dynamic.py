@@ -0,0 +1,80 @@
+# bench_dynamic.py
+# Mise à jour incrémentale (dynamic.py) comparée à un recalcul complet par Floyd-Warshall,
+# pour des lots de hausses et de suppressions d'arcs de tailles croissantes
+# Usage : python bench_dynamic.py [--n 300] [--edits 1 10 50 200] [--density 0.05] [--engine numpy]
+
+import argparse
+import random
+import time
+
+from graph import Graph
+from floyd import floyd_warshall, ENGINES, NUMPY_AVAILABLE
+from dynamic import DynamicShortestPaths
+
+
+def random_graph(n, density, rng):
+    """Graphe aléatoire de n sommets : chaque arc existe avec la probabilité density, poids 1 à 100."""
+    g = Graph(n)
+    g.add_arcs((u, v, rng.randint(1, 100))
+               for u in range(n) for v in range(n)
+               if u != v and rng.random() < density)
+    return g
+
+
+def random_edits(dyn, k, rng):
+    """k modifications sur des arcs existants distincts : moitié hausses, moitié suppressions."""
+    arcs = [(u, v) for u in range(dyn.n) for v in dyn.weights[u]]
+    edits = []
+    for u, v in rng.sample(arcs, min(k, len(arcs))):
+        w = dyn.weights[u][v] + rng.randint(1, 100) if rng.random() < 0.5 else None
+        edits.append((u, v, w))
+    return edits
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des mises à jour incrémentales.")
+    parser.add_argument("--n", type=int, default=300, help="nombre de sommets")
+    parser.add_argument("--edits", type=int, nargs="+", default=[1, 10, 50, 200],
+                        help="nombres de modifications par lot")
+    parser.add_argument("--density", type=float, default=0.05,
+                        help="proportion d'arcs parmi les n² paires")
+    parser.add_argument("--engine", choices=ENGINES,
+                        default="numpy" if NUMPY_AVAILABLE else "python",
+                        help="moteur de Floyd-Warshall pour le recalcul complet")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    g = random_graph(args.n, args.density, rng)
+    reference = DynamicShortestPaths(g)
+    print(f"n = {args.n}, {sum(len(s) for s in reference.weights)} arcs, recalcul complet : moteur '{args.engine}'\n")
+
+    print(f"{'modifs':>7} {'incrémental (s)':>16} {'complet (s)':>12} {'accélération':>13}  identiques")
+    print("-" * 64)
+    for k in args.edits:
+        dyn = DynamicShortestPaths(g, [list(l) for l in reference.L], [list(p) for p in reference.P])
+        edits = random_edits(dyn, k, rng)
+
+        debut = time.perf_counter()
+        with dyn.batch():
+            for u, v, w in edits:
+                if w is None:
+                    dyn.remove_arc(u, v)
+                else:
+                    dyn.increase_arc(u, v, w)
+        t_inc = time.perf_counter() - debut
+
+        # Recalcul complet sur le graphe modifié
+        h = Graph(args.n)
+        h.add_arcs((u, v, w) for u in range(args.n) for v, w in dyn.weights[u].items())
+        debut = time.perf_counter()
+        L, _, _ = floyd_warshall(h.L, h.P, verbose=False, engine=args.engine)
+        t_full = time.perf_counter() - debut
+
+        identiques = [list(l) for l in L] == dyn.L
+        print(f"{len(edits):>7} {t_inc:>16.3f} {t_full:>12.3f} {t_full / t_inc:>12.1f}x"
+              f"  {'oui' if identiques else 'NON'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# bench_floyd.py
+# Mesure des performances des moteurs de Floyd-Warshall sur des graphes aléatoires
+# (numpy sert de référence ; blocked et parallel sont comparés à lui)
+# Usage : python bench_floyd.py [--sizes 1000 2000 4000] [--block-size 256] [--workers 8] [--density 0.05]
+
+import argparse
+import os
+import time
+
+from floyd import floyd_warshall, DEFAULT_BLOCK_SIZE, NUMPY_AVAILABLE
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+def random_matrices(n, density, seed=0):
+    """
+    Génère les matrices initiales L (float64) et P (int64, -1 = aucun prédécesseur)
+    d'un graphe aléatoire de n sommets, avec une proportion density d'arcs de poids 1 à 100.
+    """
+    rng = np.random.default_rng(seed)
+    L = np.full((n, n), np.inf)
+    P = np.full((n, n), -1, dtype=np.int64)
+
+    arcs = rng.random((n, n)) < density
+    L[arcs] = rng.integers(1, 101, size=int(arcs.sum()))
+    P[arcs] = np.nonzero(arcs)[0]
+
+    np.fill_diagonal(L, 0)
+    np.fill_diagonal(P, np.arange(n))
+    return L, P
+
+
+def time_engine(L, P, engine, **options):
+    """Exécute floyd_warshall sur une copie de (L, P) ; renvoie (durée en s, L, P)."""
+    L, P = L.copy(), P.copy()
+    debut = time.perf_counter()
+    L, P, _ = floyd_warshall(L, P, verbose=False, engine=engine, **options)
+    return time.perf_counter() - debut, L, P
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des moteurs de Floyd-Warshall.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000],
+                        help="nombres de sommets à tester")
+    parser.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                        help="taille des tuiles du moteur 'blocked'")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus du moteur 'parallel'")
+    parser.add_argument("--density", type=float, default=0.05,
+                        help="proportion d'arcs parmi les n² paires")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("ERREUR : NumPy est nécessaire pour ce benchmark (pip install numpy).")
+        return
+
+    print(f"{'n':>6} {'numpy (s)':>11} {'blocked (s)':>12} {'parallel (s)':>13}"
+          f" {'acc. blocked':>13} {'acc. parallel':>14}  L identiques  P identiques")
+    print("-" * 104)
+    for n in args.sizes:
+        L, P = random_matrices(n, args.density, args.seed)
+        t_numpy, L1, P1 = time_engine(L, P, "numpy")
+        t_blocked, L2, P2 = time_engine(L, P, "blocked", block_size=args.block_size)
+        t_parallel, L3, P3 = time_engine(L, P, "parallel", workers=args.workers)
+        # Entre chemins de même longueur, les moteurs peuvent retenir des prédécesseurs
+        # différents : L doit être identique, P peut légitimement différer
+        memes_L = np.array_equal(L1, L2) and np.array_equal(L1, L3)
+        memes_P = np.array_equal(P1, P2) and np.array_equal(P1, P3)
+        print(f"{n:>6} {t_numpy:>11.2f} {t_blocked:>12.2f} {t_parallel:>13.2f}"
+              f" {t_numpy / t_blocked:>12.2f}x {t_numpy / t_parallel:>13.2f}x"
+              f"  {'oui' if memes_L else 'NON':>12}  {'oui' if memes_P else 'non':>12}")
+
+if __name__ == "__main__":
+    main()
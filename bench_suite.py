@@ -0,0 +1,283 @@
+# bench_suite.py
+# Suite de benchmarks reproductible : graphes aléatoires générés avec une graine, temps
+# de chaque étape (chargement, Floyd-Warshall par moteur, reconstruction des chemins,
+# visualisation), pic mémoire, résultats en JSON, et comparaison de deux exécutions
+#
+# Usage :
+#   python bench_suite.py run [--sizes 50 100 200] [--densities 0.05 0.3] [--engines python numpy]
+#                             [--repeat 3] [--output bench_results.json]
+#   python bench_suite.py compare ancien.json nouveau.json [--threshold 0.1]
+#
+# La comparaison signale une régression quand une étape est plus lente (ou plus gourmande
+# en mémoire) que le seuil relatif ; le code de sortie vaut alors 1.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from loader import load_graph_from_file
+from floyd import floyd_warshall, ENGINES, NUMPY_AVAILABLE
+from output import reconstruct_path
+from visualizer import visualize_graph, PYVIS_AVAILABLE
+
+# Version du format des fichiers de résultats
+RESULTS_FORMAT = 1
+# En dessous de ces écarts absolus, une différence est considérée comme du bruit
+MIN_SECONDS_DELTA = 0.001
+MIN_BYTES_DELTA = 64 * 1024
+
+
+def write_random_graph(path, n, density, negative, seed):
+    """
+    Écrit dans path un graphe aléatoire de n sommets au format de load_graph_from_file :
+    chaque sommet a environ density * (n - 1) successeurs, de poids 1 à 100.
+    Avec negative, les poids sont décalés par un potentiel (w + p[u] - p[v]) : certains
+    deviennent négatifs, mais tout circuit garde un poids positif (pas de cycle absorbant).
+    Retourne le nombre d'arcs.
+    """
+    # Graine textuelle : même graphe pour les mêmes paramètres, d'une machine à l'autre
+    rng = random.Random(f"{seed}-{n}-{density}-{negative}")
+    potentiel = [rng.randint(0, 100) if negative else 0 for _ in range(n)]
+    degre = max(1, round(density * (n - 1))) if n > 1 else 0
+
+    arcs = []
+    for u in range(n):
+        for v in rng.sample(range(n - 1), degre):
+            v += v >= u  # pas de boucle
+            arcs.append(f"{u} {v} {rng.randint(1, 100) + potentiel[u] - potentiel[v]}")
+
+    with open(path, "w") as f:
+        f.write(f"{n}\n{len(arcs)}\n")
+        f.write("\n".join(arcs))
+        f.write("\n")
+    return len(arcs)
+
+
+def measure(fn, prepare=tuple, repeat=3, memory=True):
+    """
+    Exécute fn(*prepare()) repeat fois ; seule la durée de fn est mesurée.
+    Retourne (meilleure durée en s, pic mémoire en octets ou None, résultat du dernier appel).
+    Le pic mémoire (tracemalloc, allocations Python et NumPy du processus courant) est
+    mesuré lors d'un appel supplémentaire, pour ne pas fausser les durées.
+    """
+    durees = []
+    for _ in range(repeat):
+        args = prepare()
+        debut = time.perf_counter()
+        resultat = fn(*args)
+        durees.append(time.perf_counter() - debut)
+
+    pic = None
+    if memory:
+        args = prepare()
+        tracemalloc.start()
+        try:
+            resultat = fn(*args)
+            pic = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return min(durees), pic, resultat
+
+
+def _copy_matrices(g):
+    # Le moteur python modifie L et P en place : chaque mesure part d'une copie
+    return [ligne[:] for ligne in g.L], [ligne[:] for ligne in g.P]
+
+
+def _reconstruct_all(P, paires):
+    for s, t in paires:
+        reconstruct_path(P, s, t)
+
+
+def run_case(path, n, engines, pairs, repeat, memory, visualize_max, workdir, seed):
+    """
+    Mesure toutes les étapes sur un fichier de graphe.
+    Retourne une liste de (moteur, étape, durée, pic mémoire) ; moteur vaut "-"
+    pour les étapes qui n'en dépendent pas.
+    """
+    mesures = []
+
+    t, pic, g = measure(load_graph_from_file, lambda: (path,), repeat, memory)
+    mesures.append(("-", "load", t, pic))
+
+    reference = None
+    for engine in engines:
+        t, pic, (L, P, _) = measure(
+            lambda L, P: floyd_warshall(L, P, verbose=False, engine=engine),
+            lambda: _copy_matrices(g), repeat, memory)
+        mesures.append((engine, "floyd", t, pic))
+        if reference is None:
+            reference = (engine, [list(ligne) for ligne in L], P)
+        elif [list(ligne) for ligne in L] != reference[1]:
+            print(f"  ATTENTION : L diffère entre les moteurs '{reference[0]}' et '{engine}'")
+
+    if reference is not None:
+        rng = random.Random(f"{seed}-paires-{n}")
+        paires = [(rng.randrange(n), rng.randrange(n)) for _ in range(pairs)]
+        t, pic, _ = measure(_reconstruct_all, lambda: (reference[2], paires), repeat, memory)
+        mesures.append(("-", "reconstruct", t, pic))
+
+    if PYVIS_AVAILABLE and n <= visualize_max:
+        html = os.path.join(workdir, f"bench_{n}.html")
+        t, pic, _ = measure(visualize_graph, lambda: (g, html), repeat, memory)
+        mesures.append(("-", "visualize", t, pic))
+
+    return mesures
+
+
+def environment():
+    """Description de la machine et des versions, enregistrée avec les résultats."""
+    infos = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": None,
+        "pyvis": PYVIS_AVAILABLE,
+    }
+    if NUMPY_AVAILABLE:
+        import numpy as np
+        infos["numpy"] = np.__version__
+    return infos
+
+
+def run(args):
+    engines = args.engines or (["python", "numpy", "blocked"] if NUMPY_AVAILABLE else ["python"])
+    if not NUMPY_AVAILABLE and any(e != "python" for e in engines):
+        print("ERREUR : NumPy est nécessaire pour les moteurs autres que 'python' (pip install numpy).")
+        return 2
+    if not PYVIS_AVAILABLE:
+        print("pyvis n'est pas installé : l'étape 'visualize' n'est pas mesurée.")
+
+    resultats = []
+    print(f"{'n':>6} {'densité':>8} {'nég.':>5} {'arcs':>8} {'moteur':>9} {'étape':>12}"
+          f" {'durée (s)':>11} {'pic (Mo)':>9}")
+    print("-" * 75)
+    with tempfile.TemporaryDirectory(prefix="bench_") as workdir:
+        for n in args.sizes:
+            for density in args.densities:
+                for negative in (False, True):
+                    path = os.path.join(workdir, f"graphe_{n}.txt")
+                    arcs = write_random_graph(path, n, density, negative, args.seed)
+                    for engine, etape, t, pic in run_case(path, n, engines, args.pairs, args.repeat,
+                                                          not args.no_memory, args.visualize_max,
+                                                          workdir, args.seed):
+                        resultats.append({
+                            "n": n, "density": density, "negative": negative, "arcs": arcs,
+                            "engine": engine, "phase": etape, "seconds": t, "peak_bytes": pic,
+                        })
+                        memoire = "-" if pic is None else f"{pic / 2**20:.2f}"
+                        print(f"{n:>6} {density:>8} {'oui' if negative else 'non':>5} {arcs:>8}"
+                              f" {engine:>9} {etape:>12} {t:>11.4f} {memoire:>9}")
+
+    donnees = {
+        "format": RESULTS_FORMAT,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "environment": environment(),
+        "parameters": {"seed": args.seed, "repeat": args.repeat, "pairs": args.pairs,
+                       "engines": engines, "memory": not args.no_memory},
+        "results": resultats,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(donnees, f, indent=2)
+    print(f"\nRésultats enregistrés dans {args.output}")
+    return 0
+
+
+def _load_results(path):
+    with open(path, encoding="utf-8") as f:
+        donnees = json.load(f)
+    if donnees.get("format") != RESULTS_FORMAT:
+        raise ValueError(f"{path} : format de résultats non reconnu.")
+    return donnees
+
+
+def _key(r):
+    return r["n"], r["density"], r["negative"], r["engine"], r["phase"]
+
+
+def _is_regression(ancien, nouveau, threshold, plancher):
+    """Hausse relative au-delà du seuil, et absolue au-delà du bruit."""
+    if ancien is None or nouveau is None:
+        return False
+    return nouveau > ancien * (1 + threshold) and nouveau - ancien > plancher
+
+
+def compare(args):
+    ancien, nouveau = _load_results(args.baseline), _load_results(args.candidate)
+
+    for cle, valeur in ancien["environment"].items():
+        if nouveau["environment"].get(cle) != valeur:
+            print(f"ATTENTION : environnement différent ({cle} : {valeur} -> {nouveau['environment'].get(cle)})")
+
+    avant = {_key(r): r for r in ancien["results"]}
+    apres = {_key(r): r for r in nouveau["results"]}
+    communes = [k for k in avant if k in apres]
+
+    print(f"{'n':>6} {'densité':>8} {'nég.':>5} {'moteur':>9} {'étape':>12}"
+          f" {'avant (s)':>10} {'après (s)':>10} {'rapport':>8} {'mémoire':>8}")
+    print("-" * 87)
+    regressions = 0
+    for k in communes:
+        a, b = avant[k], apres[k]
+        lent = _is_regression(a["seconds"], b["seconds"], args.threshold, MIN_SECONDS_DELTA)
+        lourd = _is_regression(a["peak_bytes"], b["peak_bytes"], args.threshold, MIN_BYTES_DELTA)
+        rapport = b["seconds"] / a["seconds"] if a["seconds"] else float("inf")
+        memoire = "-"
+        if a["peak_bytes"] and b["peak_bytes"] is not None:
+            memoire = f"{b['peak_bytes'] / a['peak_bytes']:.2f}x"
+        drapeaux = " ".join(d for d, actif in (("RÉGRESSION temps", lent), ("RÉGRESSION mémoire", lourd)) if actif)
+        regressions += lent or lourd
+
+        n, density, negative, engine, etape = k
+        print(f"{n:>6} {density:>8} {'oui' if negative else 'non':>5} {engine:>9} {etape:>12}"
+              f" {a['seconds']:>10.4f} {b['seconds']:>10.4f} {rapport:>7.2f}x {memoire:>8}  {drapeaux}")
+
+    for nom, seules in (("l'exécution de référence", [k for k in avant if k not in apres]),
+                        ("la nouvelle exécution", [k for k in apres if k not in avant])):
+        if seules:
+            print(f"\n{len(seules)} mesure(s) présente(s) seulement dans {nom}.")
+
+    print(f"\n{regressions} régression(s) sur {len(communes)} mesure(s) comparée(s)"
+          f" (seuil : +{args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de Floyd-Warshall et des étapes associées.")
+    commandes = parser.add_subparsers(dest="command", required=True)
+
+    p_run = commandes.add_parser("run", help="mesurer et enregistrer les résultats")
+    p_run.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200],
+                       help="nombres de sommets à tester")
+    p_run.add_argument("--densities", type=float, nargs="+", default=[0.05, 0.3],
+                       help="proportions d'arcs parmi les n² paires")
+    p_run.add_argument("--engines", choices=ENGINES, nargs="+", default=None,
+                       help="moteurs de Floyd-Warshall (par défaut : python, et numpy et blocked si disponibles)")
+    p_run.add_argument("--repeat", type=int, default=3, help="répétitions par mesure (on garde la meilleure)")
+    p_run.add_argument("--pairs", type=int, default=1000, help="chemins reconstruits par mesure")
+    p_run.add_argument("--visualize-max", type=int, default=300,
+                       help="taille maximale des graphes pour la mesure de la visualisation")
+    p_run.add_argument("--no-memory", action="store_true", help="ne pas mesurer le pic mémoire")
+    p_run.add_argument("--seed", type=int, default=0)
+    p_run.add_argument("--output", default="bench_results.json", help="fichier JSON des résultats")
+
+    p_cmp = commandes.add_parser("compare", help="comparer deux fichiers de résultats")
+    p_cmp.add_argument("baseline", help="résultats de référence")
+    p_cmp.add_argument("candidate", help="nouveaux résultats")
+    p_cmp.add_argument("--threshold", type=float, default=0.10,
+                       help="hausse relative tolérée avant de signaler une régression")
+
+    args = parser.parse_args()
+    sys.exit(run(args) if args.command == "run" else compare(args))
+
+
+if __name__ == "__main__":
+    main()
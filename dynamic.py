@@ -0,0 +1,354 @@
+# dynamic.py
+# Mise à jour incrémentale des plus courts chemins quand le graphe change de quelques arcs
+# Ajout d'un arc ou baisse de son poids : O(n²) au lieu de relancer Floyd-Warshall (O(n³))
+# Hausse ou suppression : seules les paires dont le plus court chemin empruntait l'arc sont recalculées
+
+from collections import deque
+from contextlib import contextmanager
+from math import inf
+from floyd import floyd_warshall
+from output import reconstruct_path
+
+
+class DynamicShortestPaths:
+    """
+    Plus courts chemins entre toutes les paires (L, P), tenus à jour arc par arc.
+
+    - graph : Graph, CompactGraph ou SparseGraph (seuls ses arcs sont lus, il n'est pas modifié)
+    - L, P : résultat déjà calculé pour ce graphe (listes de listes, MatrixView d'un
+      résultat enregistré ou tableaux NumPy) ; ils sont recopiés dans des listes
+      modifiables. S'ils sont omis, Floyd-Warshall est lancé sur une copie des matrices du graphe.
+
+    Attention : les arcs sont lus dans graph.L pour Graph et CompactGraph, que
+    floyd_warshall(graph.L, graph.P) remplace par les plus courts chemins. Il faut donc
+    construire la structure avant d'appeler floyd_warshall sur le graphe (ou lui donner
+    un SparseGraph, dont les arcs restent intacts) ; passer L = graph.L lève ValueError.
+
+    self.L et self.P sont modifiées sur place : elles s'utilisent comme celles de
+    floyd_warshall (ask_for_paths, reconstruct_path...). cycle_negatif indique un cycle
+    absorbant ; s'il a été créé par une mise à jour, cycle en donne les sommets.
+
+    Plusieurs modifications peuvent être regroupées dans un bloc « with dyn.batch(): » :
+    elles sont alors appliquées ensemble, en un seul recalcul, à la sortie du bloc.
+    """
+
+    def __init__(self, graph, L=None, P=None):
+        if L is not None and (L is graph.L or P is graph.P):
+            # Floyd-Warshall a remplacé les arcs du graphe par les plus courts chemins
+            raise ValueError("L et P doivent être distinctes de graph.L et graph.P : "
+                             "construire DynamicShortestPaths avant floyd_warshall.")
+        self.n = graph.n
+        # Poids courants des arcs : weights[u][v] = w, et la même chose par arc entrant
+        self.weights = [dict(graph.neighbors(u)) for u in range(self.n)]
+        self.incoming = [{} for _ in range(self.n)]
+        for u in range(self.n):
+            for v, w in self.weights[u].items():
+                self.incoming[v][u] = w
+        self.cycle = None
+        # Modifications en attente (u, v) -> nouveau poids (None = suppression), dans un lot
+        self._pending = None
+
+        if L is None or P is None:
+            L, P, cycle_negatif = floyd_warshall(
+                [list(ligne) for ligne in graph.L], [list(ligne) for ligne in graph.P],
+                verbose=False)
+        else:
+            L, P = _writable_matrices(L, P)
+            cycle_negatif = any(L[i][i] < 0 for i in range(self.n))
+
+        self.L = L
+        self.P = P
+        self.cycle_negatif = cycle_negatif
+
+    def _check_arc(self, u, v):
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise IndexError(f"Arc ({u}, {v}) hors limites (sommets de 0 à {self.n - 1}).")
+        if self.cycle_negatif:
+            raise ValueError("Cycle absorbant : les plus courts chemins ne sont pas définis.")
+
+    def _current_weight(self, u, v):
+        """Poids de l'arc u -> v, en tenant compte des modifications en attente."""
+        if self._pending is not None and (u, v) in self._pending:
+            return self._pending[(u, v)]
+        return self.weights[u].get(v)
+
+    def _existing_weight(self, u, v):
+        self._check_arc(u, v)
+        ancien = self._current_weight(u, v)
+        if ancien is None:
+            raise ValueError(f"L'arc ({u}, {v}) n'existe pas.")
+        return ancien
+
+    def _set_weight(self, u, v, w):
+        if w is None:
+            self.weights[u].pop(v, None)
+            self.incoming[v].pop(u, None)
+        else:
+            self.weights[u][v] = w
+            self.incoming[v][u] = w
+
+    def add_arc(self, u, v, w):
+        """
+        Ajoute l'arc u -> v de poids w (ou remplace son poids).
+        Retourne True si la modification crée un cycle absorbant (None dans un lot).
+        """
+        self._check_arc(u, v)
+        return self._update(u, v, w)
+
+    def decrease_arc(self, u, v, w):
+        """
+        Baisse le poids de l'arc existant u -> v à w.
+        Retourne True si la modification crée un cycle absorbant (None dans un lot).
+        """
+        ancien = self._existing_weight(u, v)
+        if w > ancien:
+            raise ValueError(f"Le nouveau poids de l'arc ({u}, {v}) est supérieur à l'ancien ({ancien} -> {w}).")
+        return self._update(u, v, w)
+
+    def increase_arc(self, u, v, w):
+        """
+        Augmente le poids de l'arc existant u -> v à w.
+        Retourne False (une hausse ne crée pas de cycle absorbant ; None dans un lot).
+        """
+        ancien = self._existing_weight(u, v)
+        if w < ancien:
+            raise ValueError(f"Le nouveau poids de l'arc ({u}, {v}) est inférieur à l'ancien ({ancien} -> {w}).")
+        return self._update(u, v, w)
+
+    def remove_arc(self, u, v):
+        """
+        Supprime l'arc existant u -> v.
+        Retourne False (une suppression ne crée pas de cycle absorbant ; None dans un lot).
+        """
+        self._existing_weight(u, v)
+        return self._update(u, v, None)
+
+    @contextmanager
+    def batch(self):
+        """
+        Regroupe les modifications faites dans le bloc « with » et les applique
+        à la sortie (consulter ensuite cycle_negatif). Si le bloc lève une
+        exception, les modifications en attente sont abandonnées.
+        """
+        if self._pending is not None:
+            yield self  # lot déjà ouvert : on s'y rattache
+            return
+        self._pending = {}
+        try:
+            yield self
+        except BaseException:
+            self._pending = None
+            raise
+        self._flush()
+
+    def _update(self, u, v, w):
+        if self._pending is not None:
+            self._pending[(u, v)] = w
+            return None
+        self._pending = {(u, v): w}
+        return self._flush()
+
+    def _flush(self):
+        """
+        Applique les modifications en attente : d'abord les hausses et suppressions
+        (recalcul des chemins qui les empruntaient), puis les baisses et ajouts
+        (relâchement en O(n²) par arc). Retourne cycle_negatif.
+        """
+        pending, self._pending = self._pending, None
+        hausses = {}
+        baisses = []
+        for (u, v), w in pending.items():
+            ancien = self.weights[u].get(v)
+            if w is None:
+                if ancien is not None:
+                    hausses[(u, v)] = None
+            elif ancien is not None and w > ancien:
+                hausses[(u, v)] = w
+            elif ancien is None or w < ancien:
+                baisses.append((u, v, w))
+
+        if hausses:
+            self._raise_arcs(hausses)
+        for u, v, w in baisses:
+            if self.cycle_negatif:
+                self._set_weight(u, v, w)  # résultat déjà invalide : on garde seulement le poids
+            else:
+                self._decrease(u, v, w)
+        return self.cycle_negatif
+
+    def _raise_arcs(self, hausses):
+        """
+        Hausses et suppressions d'arcs (poids None). Pour chaque source i, un arc
+        u -> v n'a d'effet que s'il appartient à l'arbre des plus courts chemins
+        de i, c'est-à-dire si P[i][v] == u : seuls les sommets du sous-arbre de v
+        sont alors recalculés.
+        """
+        for (u, v), w in hausses.items():
+            self._set_weight(u, v, w)
+
+        for i in range(self.n):
+            Pi = self.P[i]
+            racines = [v for (u, v) in hausses if v != i and Pi[v] == u]
+            if racines:
+                self._recompute_row(i, racines)
+
+        self._refresh_diagonal()
+
+    def _recompute_row(self, i, racines):
+        """
+        Recalcule L[i][j] et P[i][j] pour les sommets j des sous-arbres (dans l'arbre
+        de la source i) issus de racines. Les autres distances sont inchangées :
+        on part des meilleurs arcs entrants venant de l'extérieur, puis on propage
+        à l'intérieur avec SPFA (les poids peuvent être négatifs).
+        """
+        Li, Pi = self.L[i], self.P[i]
+
+        enfants = [[] for _ in range(self.n)]
+        for j in range(self.n):
+            p = Pi[j]
+            if j != i and p is not None:
+                enfants[p].append(j)
+
+        touches = set()
+        pile = list(racines)
+        while pile:
+            j = pile.pop()
+            if j not in touches:
+                touches.add(j)
+                pile.extend(enfants[j])
+
+        for j in touches:
+            Li[j] = inf
+            Pi[j] = None
+
+        # Meilleur arc entrant depuis un sommet non touché (chemin vide pour x == i)
+        for j in touches:
+            for x, wx in self.incoming[j].items():
+                if x in touches or x == j:
+                    continue
+                d = (0 if x == i else Li[x]) + wx
+                if d < Li[j]:
+                    Li[j] = d
+                    Pi[j] = x
+
+        file = deque(j for j in touches if Li[j] != inf)
+        dans_file = set(file)
+        while file:
+            x = file.popleft()
+            dans_file.discard(x)
+            dx = Li[x]
+            for y, wy in self.weights[x].items():
+                if y in touches and dx + wy < Li[y]:
+                    Li[y] = dx + wy
+                    Pi[y] = x
+                    if y not in dans_file:
+                        file.append(y)
+                        dans_file.add(y)
+
+    def _refresh_diagonal(self):
+        """
+        Règle de Floyd-Warshall pour la diagonale : L[u][u] vaut le minimum entre
+        le poids de la boucle u -> u et le plus court circuit passant par u,
+        ou 0 (chemin vide) si u n'a pas de boucle.
+        """
+        L, P = self.L, self.P
+        for u in range(self.n):
+            if u in self.weights[u]:
+                L[u][u], P[u][u] = self._best_circuit(u, self.weights[u][u], u)
+            elif L[u][u] != 0:
+                L[u][u], P[u][u] = 0, u
+
+    def _best_circuit(self, u, meilleur, pred):
+        """Plus court circuit par u, s'il est plus court que meilleur : (distance, prédécesseur)."""
+        Lu = self.L[u]
+        for x, wx in self.incoming[u].items():
+            if x != u and Lu[x] + wx < meilleur:
+                meilleur, pred = Lu[x] + wx, x
+        return meilleur, pred
+
+    def _decrease(self, u, v, w):
+        """
+        Nouvel arc u -> v de poids w, jamais plus lourd que l'ancien.
+
+        Un chemin i -> j ne peut s'améliorer qu'en passant par le nouvel arc :
+        i ~> u -> v ~> j. Tant qu'il n'y a pas de cycle absorbant, les distances
+        vers u et depuis v ne changent pas, d'où une seule passe en O(n²).
+        """
+        L, P = self.L, self.P
+
+        if u == v:
+            return self._decrease_loop(u, w)
+
+        # Le nouvel arc ferme-t-il un circuit de poids négatif v ~> u -> v ?
+        if w + L[v][u] < 0:
+            self._set_weight(u, v, w)
+            self.cycle_negatif = True
+            self.cycle = [u] + reconstruct_path(P, v, u)[:-1]
+            return True
+
+        self._set_weight(u, v, w)
+
+        # Copies de la ligne v (distances et prédécesseurs depuis v) et de la colonne u.
+        # Le chemin vide compte pour 0, même si L[u][u] ou L[v][v] porte une boucle.
+        ligne_v = list(L[v])
+        ligne_v[v] = 0
+        pred_v = list(P[v])
+        pred_v[v] = u  # sur i ~> u -> v, le prédécesseur de v est u
+        colonne_u = [L[i][u] for i in range(self.n)]
+        colonne_u[u] = 0
+        cibles = [j for j in range(self.n) if ligne_v[j] != inf]
+
+        for i in range(self.n):
+            base = colonne_u[i] + w
+            Li = L[i]
+            # Si i ~> u -> v n'améliore pas L[i][v], aucun L[i][j] ne s'améliore
+            # (inégalité triangulaire L[i][j] <= L[i][v] + L[v][j])
+            if base == inf or (i != v and base >= Li[v]):
+                continue
+            Pi = P[i]
+            for j in cibles:
+                d = base + ligne_v[j]
+                if d < Li[j]:
+                    Li[j] = d
+                    Pi[j] = pred_v[j]
+
+        return False
+
+    def _decrease_loop(self, u, w):
+        """
+        Boucle u -> u de poids w. Comme pour Floyd-Warshall, L[u][u] vaut alors
+        le minimum entre le poids de la boucle et le plus court circuit passant par u ;
+        les autres distances ne changent pas.
+        """
+        if w < 0:
+            self._set_weight(u, u, w)
+            self.cycle_negatif = True
+            self.cycle = [u]
+            return True
+
+        if u not in self.weights[u]:
+            # Jusqu'ici L[u][u] valait 0 (chemin vide) : on cherche le plus court circuit
+            self.L[u][u], self.P[u][u] = self._best_circuit(u, inf, None)
+
+        self._set_weight(u, u, w)
+        if w < self.L[u][u]:
+            self.L[u][u] = w
+            self.P[u][u] = u
+        return False
+
+
+def _writable_matrices(L, P):
+    """
+    Copie L et P (listes, MatrixView ou tableaux NumPy) en listes de listes au format
+    de Graph : distances entières quand elles le sont, None pour « pas de prédécesseur »
+    (NumPy et les fichiers de résultats le codent par -1).
+    """
+    L = [[d if d == inf or d == -inf or not float(d).is_integer() else int(d) for d in _row_list(ligne)]
+         for ligne in L]
+    P = [[None if p is None or p < 0 else int(p) for p in _row_list(ligne)] for ligne in P]
+    return L, P
+
+
+def _row_list(ligne):
+    # Les lignes NumPy sont converties en types Python (float, int) d'un seul coup
+    return ligne.tolist() if hasattr(ligne, "tolist") else list(ligne)
@@ -3,8 +3,27 @@
 # On calcule les plus courts chemins entre toutes les paires de sommets
 # et on détecte les cycles absorbants (cycles de poids négatif)
 
+import os
+from array import array
 from math import inf
-from output import print_matrices
+from multiprocessing import Barrier, Process, Value
+from multiprocessing.connection import wait
+from threading import BrokenBarrierError
+from graph import MatrixView, NO_PREDECESSOR
+from tracing import TextTraceObserver
+
+try:
+    import numpy as np
+    from multiprocessing import shared_memory
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Moteurs de calcul disponibles pour floyd_warshall
+ENGINES = ("python", "numpy", "blocked", "parallel")
+
+# Taille par défaut des tuiles du moteur "blocked" (256 x 256 float64 = 512 Kio)
+DEFAULT_BLOCK_SIZE = 256
 
 def detect_cycle_negatif(L):
     """
@@ -18,7 +37,8 @@ def detect_cycle_negatif(L):
             return True
     return False
 
-def floyd_warshall(L, P, verbose=True, show_initial=True):
+def floyd_warshall(L, P, verbose=True, show_initial=True, engine="python", stop_on_cycle=False,
+                   block_size=DEFAULT_BLOCK_SIZE, workers=None, observer=None, next_hop=False):
     """
     Implémente l'algorithme de Floyd-Warshall.
 
@@ -26,24 +46,62 @@ def floyd_warshall(L, P, verbose=True, show_initial=True):
     - L : matrice des distances (modifiée en place)
     - P : matrice des prédécesseurs (modifiée en place)
     - verbose : si True, affiche les matrices à chaque étape
+      (raccourci pour observer=TextTraceObserver(show_initial=show_initial))
     - show_initial : si True, affiche l'état initial des matrices
+    - engine : moteur de calcul, "python" (triple boucle), "numpy"
+      (mise à jour vectorisée de toute la matrice à chaque k) ou "blocked"
+      (NumPy par tuiles, plus économe en cache pour les grandes matrices)
+      ou "parallel" (NumPy, lignes réparties entre plusieurs processus)
+    - stop_on_cycle : si True, on s'arrête dès qu'un L[i][i] devient négatif
+      (les matrices renvoyées sont alors celles du moment de l'arrêt)
+    - block_size : taille des tuiles du moteur "blocked"
+    - workers : nombre de processus du moteur "parallel" (par défaut, le nombre de cœurs)
+    - observer : FloydObserver (voir tracing.py) notifié au début, après chaque
+      itération k et à la fin ; remplace l'affichage de verbose
+    - next_hop : si True, renvoie aussi la matrice des successeurs S (voir successor_matrix)
 
     Retourne :
     - (L, P, cycle_negatif) :
         * L : matrice des plus courts chemins
         * P : matrice des prédécesseurs correspondants
         * cycle_negatif : booléen, True s'il existe un cycle absorbant
+    - (L, P, cycle_negatif, S) si next_hop est True
     """
+    resultat = _floyd_warshall(L, P, verbose, show_initial, engine, stop_on_cycle,
+                               block_size, workers, observer)
+    if next_hop:
+        return resultat + (successor_matrix(resultat[1]),)
+    return resultat
+
+
+def _floyd_warshall(L, P, verbose, show_initial, engine, stop_on_cycle, block_size, workers, observer):
+    """Choix du moteur et version Python (triple boucle) ; voir floyd_warshall."""
+    if engine not in ENGINES:
+        raise ValueError(f"Moteur inconnu : {engine!r} (choix possibles : {', '.join(ENGINES)}).")
+
+    if observer is None and verbose:
+        observer = TextTraceObserver(show_initial=show_initial)
+
+    if engine == "numpy":
+        return _floyd_warshall_numpy(L, P, observer, stop_on_cycle)
+    if engine == "blocked":
+        if block_size < 1:
+            raise ValueError("block_size doit être un entier strictement positif.")
+        return _floyd_warshall_numpy(L, P, observer, stop_on_cycle, block_size)
+    if engine == "parallel":
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers doit être un entier strictement positif.")
+        return _floyd_warshall_numpy(L, P, observer, stop_on_cycle, workers=workers)
+
     n = len(L)
 
-    if verbose and show_initial:
-        print_matrices(L, P, "Initialisation")
+    if observer is not None:
+        observer.on_start(L, P)
 
     # Boucle principale : on autorise progressivement chaque sommet k comme intermédiaire
     for k in range(n):
-        if verbose:
-            print(f"=== Début de l'itération k = {k} ===")
-
         # Pour chaque paire (i, j), on vérifie si passer par k améliore le chemin
         for i in range(n):
             for j in range(n):
@@ -60,15 +118,400 @@ def floyd_warshall(L, P, verbose=True, show_initial=True):
                     # de j est le même que sur le chemin k->j
                     P[i][j] = P[k][j]
 
-        if verbose:
-            print_matrices(L, P, f"Après k = {k}")
+            # Arrêt anticipé : un circuit négatif passe par i, inutile de continuer
+            if stop_on_cycle and L[i][i] < 0:
+                if observer is not None:
+                    observer.on_early_stop(k, i)
+                    observer.on_finish(L, P, True)
+                return L, P, True
+
+        if observer is not None and observer.wants_iteration(k):
+            observer.on_iteration(k, L, P)
 
     cycle_negatif = detect_cycle_negatif(L)
 
-    if verbose:
-        if cycle_negatif:
-            print("!  Cycle absorbant détecté (cycle de poids négatif).")
-        else:
-            print("Aucun cycle absorbant détecté.")
+    if observer is not None:
+        observer.on_finish(L, P, cycle_negatif)
 
     return L, P, cycle_negatif
+
+
+def successor_matrix(P):
+    """
+    Calcule la matrice des successeurs S à partir de la matrice des prédécesseurs P :
+    S[i][j] est le premier sommet après i sur le plus court chemin de i à j
+    (S[i][i] = i, None s'il n'y a pas de chemin). Le chemin décrit est le même
+    que celui de reconstruct_path, mais il se lit dans l'ordre : i, S[i][j], S[S[i][j]][j]...
+
+    Coût O(n²), négligeable devant Floyd-Warshall : chaque case est résolue une fois
+    en remontant l'arbre des plus courts chemins de la source i.
+    S a le même format que P : listes (None), MatrixView (-1) ou tableau NumPy (-1).
+    """
+    if NUMPY_AVAILABLE and isinstance(P, (np.ndarray, MatrixView)):
+        return _successor_matrix_numpy(P)
+
+    n = len(P)
+    S = [_successor_row(P[i], i, n) for i in range(n)]
+    if isinstance(P, MatrixView):
+        tampon = array("i", (NO_PREDECESSOR if s is None else s for ligne in S for s in ligne))
+        return MatrixView(tampon, n, none_value=NO_PREDECESSOR)
+    return S
+
+
+def _successor_row(Pi, i, n):
+    """Ligne i de la matrice des successeurs (voir successor_matrix)."""
+    Si = [None] * n
+    if Pi[i] is not None:
+        Si[i] = i
+    for j in range(n):
+        if j == i or Si[j] is not None or Pi[j] is None:
+            continue
+        # On remonte les prédécesseurs jusqu'à un sommet déjà résolu ou jusqu'à la source
+        chaine = []
+        x = j
+        successeur = None
+        while len(chaine) <= n:
+            if Si[x] is not None:
+                successeur = Si[x]
+                break
+            chaine.append(x)
+            p = Pi[x]
+            if p is None:
+                break
+            if p == i:
+                successeur = x
+                break
+            x = p
+        for y in chaine:
+            Si[y] = successeur
+    return Si
+
+
+def _successor_matrix_numpy(P):
+    """
+    Version vectorisée de successor_matrix, par sauts de pointeurs : à chaque passe,
+    chaque case non résolue saute à l'ancêtre de son ancêtre, d'où O(log n) passes.
+    """
+    vue = isinstance(P, MatrixView)
+    Pn = np.frombuffer(P.buffer, dtype=np.int32).reshape(P.n, P.n) if vue else P
+    n = Pn.shape[0]
+    lignes = np.arange(n)[:, None]
+    colonnes = np.broadcast_to(np.arange(n), (n, n))
+
+    # Les fils directs de la source sont leur propre successeur
+    S = np.where(Pn == lignes, colonnes, -1).astype(np.int64)
+    np.fill_diagonal(S, -1)
+    ancetre = Pn.astype(np.int64)
+    a_faire = (S < 0) & (Pn >= 0)
+    np.fill_diagonal(a_faire, False)
+
+    for _ in range(2 * n.bit_length() + 2):
+        if not a_faire.any():
+            break
+        a = np.where(a_faire, ancetre, 0)
+        resolus = a_faire & (S[lignes, a] >= 0)
+        S[resolus] = S[lignes, a][resolus]
+        a_faire &= ~resolus
+        ancetre = np.where(a_faire, ancetre[lignes, a], ancetre)
+        a_faire &= ancetre >= 0  # chaîne interrompue : pas de successeur
+
+    np.fill_diagonal(S, np.where(np.diagonal(Pn) >= 0, np.arange(n), -1))
+    if vue:
+        return MatrixView(array("i", S.astype(np.int32).tobytes()), n, none_value=NO_PREDECESSOR)
+    return S
+
+
+def _require_numpy():
+    """Lève une erreur explicite si NumPy n'est pas installé."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("Le moteur 'numpy' nécessite NumPy. Installez-le avec : pip install numpy")
+
+
+def to_numpy(L, P):
+    """
+    Convertit L et P en tableaux NumPy (float64 pour L, int64 pour P).
+    Dans P, l'absence de prédécesseur (None) est codée par -1.
+    Si L et P sont déjà des tableaux NumPy de ce type, ils sont utilisés tels quels ;
+    les vues d'un CompactGraph sont exposées sans copie (même tampon mémoire).
+    """
+    if isinstance(L, MatrixView) and isinstance(P, MatrixView):
+        n = L.n
+        Ln = np.frombuffer(L.buffer, dtype=np.float64).reshape(n, n)
+        Pn = np.frombuffer(P.buffer, dtype=np.int32).reshape(n, n)
+        return Ln, Pn
+
+    if isinstance(L, np.ndarray) and L.dtype == np.float64:
+        Ln = L
+    else:
+        Ln = np.array(L, dtype=np.float64)
+
+    if isinstance(P, np.ndarray) and np.issubdtype(P.dtype, np.integer):
+        Pn = P
+    else:
+        Pn = np.array([[-1 if p is None else p for p in ligne] for ligne in P], dtype=np.int64)
+
+    return Ln, Pn
+
+
+def _numpy_to_lists(Ln, Pn, entiers=True):
+    """
+    Reconvertit les tableaux NumPy en listes de listes au format historique :
+    distances entières (si entiers=True) avec inf, prédécesseurs avec None.
+    """
+    L = []
+    for ligne in Ln.tolist():
+        if entiers:
+            ligne = [v if v == inf or v == -inf else int(v) for v in ligne]
+        L.append(ligne)
+    P = [[None if p < 0 else p for p in ligne] for ligne in Pn.tolist()]
+    return L, P
+
+
+def _write_back(L, P, Ln, Pn, entiers):
+    """Recopie en place le résultat NumPy dans les listes de listes d'origine."""
+    L_listes, P_listes = _numpy_to_lists(Ln, Pn, entiers)
+    for i in range(len(L_listes)):
+        L[i][:] = L_listes[i]
+        P[i][:] = P_listes[i]
+
+
+def _floyd_warshall_numpy(L, P, observer, stop_on_cycle=False, block_size=None, workers=None):
+    """
+    Variante vectorisée de Floyd-Warshall.
+
+    À chaque k, on calcule d'un coup la matrice candidate L[i][k] + L[k][j]
+    (somme extérieure de la colonne k et de la ligne k), puis on applique
+    par masque la même règle que la version Python :
+    si le candidat est strictement meilleur, L[i][j] est remplacé et
+    P[i][j] prend la valeur P[k][j].
+
+    Si block_size est fourni, les k sont traités par blocs et la matrice
+    est parcourue par tuiles de block_size x block_size (voir _blocked_step).
+    Si workers est fourni (et > 1), les lignes sont réparties entre plusieurs
+    processus (voir _parallel_sweep) ; l'observateur ne voit alors que l'état final.
+
+    Si L et P sont des listes de listes, elles sont mises à jour en place
+    à la fin du calcul ; si ce sont des tableaux NumPy ou les vues d'un
+    CompactGraph, le tampon sous-jacent est modifié directement.
+    """
+    _require_numpy()
+
+    vues = isinstance(L, MatrixView)
+    listes = not vues and not isinstance(L, np.ndarray)
+    Ln, Pn = to_numpy(L, P)
+    n = Ln.shape[0]
+
+    # On mémorise si les poids sont entiers pour restituer des int (et non des float)
+    finis = Ln[np.isfinite(Ln)]
+    entiers = bool(np.all(finis == np.floor(finis)))
+
+    if observer is not None:
+        observer.on_start(*_numpy_to_lists(Ln, Pn, entiers))
+
+    # Au-delà de n processus, certains n'auraient aucune ligne à traiter
+    if workers is not None and min(workers, n) > 1:
+        k_arret = _parallel_sweep(Ln, Pn, min(workers, n), stop_on_cycle)
+        if observer is not None:
+            if k_arret is not None:
+                observer.on_early_stop(k_arret, int(np.flatnonzero(np.diagonal(Ln) < 0)[0]))
+            elif observer.wants_iteration(n - 1):
+                observer.on_iteration(n - 1, *_numpy_to_lists(Ln, Pn, entiers))
+    else:
+        _sequential_sweep(Ln, Pn, observer, stop_on_cycle, block_size, entiers)
+
+    cycle_negatif = bool(np.any(np.diagonal(Ln) < 0))
+
+    if observer is not None:
+        observer.on_finish(*_numpy_to_lists(Ln, Pn, entiers), cycle_negatif)
+
+    if listes:
+        _write_back(L, P, Ln, Pn, entiers)
+    if listes or vues:
+        return L, P, cycle_negatif
+
+    return Ln, Pn, cycle_negatif
+
+
+def _sequential_sweep(Ln, Pn, observer, stop_on_cycle, block_size, entiers):
+    """
+    Enchaîne les itérations k dans le processus courant, une par une
+    ou par blocs de block_size (moteur "blocked", l'observateur n'étant
+    alors notifié qu'à la fin de chaque bloc).
+    """
+    n = Ln.shape[0]
+
+    # Chaque étape traite les intermédiaires k de debut à fin - 1
+    pas = 1 if block_size is None else block_size
+    for debut in range(0, n, pas):
+        fin = min(debut + pas, n)
+
+        if block_size is None:
+            _numpy_step(Ln, Pn, debut)
+        else:
+            _blocked_step(Ln, Pn, debut, fin, block_size)
+
+        if stop_on_cycle:
+            negatifs = np.flatnonzero(np.diagonal(Ln) < 0)
+            if negatifs.size:
+                if observer is not None:
+                    observer.on_early_stop(fin - 1, int(negatifs[0]))
+                return
+
+        if observer is not None and observer.wants_iteration(fin - 1):
+            observer.on_iteration(fin - 1, *_numpy_to_lists(Ln, Pn, entiers))
+
+
+def _numpy_step(Ln, Pn, k):
+    """Itération k de Floyd-Warshall sur toute la matrice, en une seule opération vectorisée."""
+    # Candidats L[i][k] + L[k][j] pour toutes les paires (i, j) ;
+    # inf + x reste inf, donc les paires sans chemin ne sont jamais améliorées
+    candidats = np.add.outer(Ln[:, k], Ln[k, :])
+    masque = candidats < Ln
+
+    np.copyto(Ln, candidats, where=masque)
+    # P[i][j] = P[k][j] : la ligne k de P est diffusée sur toutes les lignes i
+    np.copyto(Pn, Pn[k].copy(), where=masque)
+
+
+def _update_tile(Ln, Pn, I, J, K):
+    """
+    Applique les intermédiaires k de la tranche K à la tuile L[I, J] (et P[I, J]).
+    Les tranches étant contiguës, L[I, J] est une vue : la tuile est modifiée en place.
+    """
+    tuile = Ln[I, J]
+    tuile_p = Pn[I, J]
+    for k in range(K.start, K.stop):
+        candidats = np.add.outer(Ln[I, k], Ln[k, J])
+        masque = candidats < tuile
+        np.copyto(tuile, candidats, where=masque)
+        np.copyto(tuile_p, Pn[k, J].copy(), where=masque)
+
+
+def _blocked_step(Ln, Pn, debut, fin, block_size):
+    """
+    Traite le bloc d'intermédiaires k = debut..fin-1 par tuiles (Floyd-Warshall par blocs).
+
+    1. la tuile diagonale (K, K), qui ne dépend que d'elle-même ;
+    2. les tuiles de la ligne (K, J) et de la colonne (I, K) du bloc, qui ne
+       dépendent que d'elles-mêmes et de la tuile diagonale ;
+    3. toutes les autres tuiles (I, J), à partir des tuiles (I, K) et (K, J).
+
+    Chaque tuile tient dans le cache du processeur pendant ses block_size mises à jour,
+    au lieu de balayer toute la matrice n x n à chaque k.
+    """
+    n = Ln.shape[0]
+    K = slice(debut, fin)
+    blocs = [slice(b, min(b + block_size, n)) for b in range(0, n, block_size)
+             if b != debut]
+
+    # Phase 1 : tuile diagonale
+    _update_tile(Ln, Pn, K, K, K)
+
+    # Phase 2 : ligne et colonne du bloc
+    for B in blocs:
+        _update_tile(Ln, Pn, K, B, K)
+        _update_tile(Ln, Pn, B, K, K)
+
+    # Phase 3 : tuiles restantes
+    for I in blocs:
+        for J in blocs:
+            _update_tile(Ln, Pn, I, J, K)
+
+
+def _parallel_sweep(Ln, Pn, workers, stop_on_cycle):
+    """
+    Exécute toutes les itérations k de Floyd-Warshall avec plusieurs processus.
+
+    L et P sont copiées en mémoire partagée (multiprocessing.shared_memory) :
+    rien n'est sérialisé d'une itération à l'autre. Chaque processus met à jour
+    un bloc de lignes i ; pour un k donné, ces mises à jour sont indépendantes
+    une fois la ligne k connue. Deux barrières par k synchronisent les processus.
+
+    Ln et Pn sont mis à jour en place. Retourne le k de l'arrêt anticipé
+    (stop_on_cycle) ou None si toutes les itérations ont été faites.
+    """
+    n = Ln.shape[0]
+    shm_L = shared_memory.SharedMemory(create=True, size=Ln.nbytes)
+    shm_P = shared_memory.SharedMemory(create=True, size=Pn.nbytes)
+    try:
+        Ls = np.ndarray(Ln.shape, dtype=Ln.dtype, buffer=shm_L.buf)
+        Ps = np.ndarray(Pn.shape, dtype=Pn.dtype, buffer=shm_P.buf)
+        Ls[:] = Ln
+        Ps[:] = Pn
+
+        barriere = Barrier(workers)
+        # k de l'arrêt anticipé, -1 tant qu'aucun cycle absorbant n'a été vu
+        arret = Value("q", -1)
+        bornes = [n * w // workers for w in range(workers + 1)]
+        processus = [
+            Process(target=_parallel_worker,
+                    args=(shm_L.name, shm_P.name, Ln.dtype.str, Pn.dtype.str, n,
+                          bornes[w], bornes[w + 1], barriere, arret, stop_on_cycle))
+            for w in range(workers)
+        ]
+        for p in processus:
+            p.start()
+
+        # Si un processus échoue, on casse la barrière pour ne pas bloquer les autres
+        en_cours = {p.sentinel: p for p in processus}
+        echec = False
+        while en_cours:
+            for sentinelle in wait(list(en_cours)):
+                p = en_cours.pop(sentinelle)
+                p.join()
+                if p.exitcode != 0 and not echec:
+                    echec = True
+                    barriere.abort()
+        if echec:
+            raise RuntimeError("Un processus du calcul parallèle de Floyd-Warshall a échoué.")
+
+        Ln[:] = Ls
+        Pn[:] = Ps
+        del Ls, Ps
+        return None if arret.value < 0 else arret.value
+    finally:
+        shm_L.close()
+        shm_L.unlink()
+        shm_P.close()
+        shm_P.unlink()
+
+
+def _parallel_worker(nom_L, nom_P, dtype_L, dtype_P, n, debut, fin, barriere, arret, stop_on_cycle):
+    """
+    Processus de calcul : applique toutes les itérations k aux lignes debut..fin-1.
+    """
+    shm_L = shared_memory.SharedMemory(name=nom_L)
+    shm_P = shared_memory.SharedMemory(name=nom_P)
+    try:
+        Ls = np.ndarray((n, n), dtype=dtype_L, buffer=shm_L.buf)
+        Ps = np.ndarray((n, n), dtype=dtype_P, buffer=shm_P.buf)
+        bloc_L = Ls[debut:fin]
+        bloc_P = Ps[debut:fin]
+        lignes = np.arange(fin - debut)
+
+        for k in range(n):
+            # Copie locale de la ligne k, faite par tous avant que son propriétaire ne la modifie
+            ligne_L = Ls[k].copy()
+            ligne_P = Ps[k].copy()
+            barriere.wait()
+
+            candidats = np.add.outer(bloc_L[:, k], ligne_L)
+            masque = candidats < bloc_L
+            np.copyto(bloc_L, candidats, where=masque)
+            np.copyto(bloc_P, ligne_P, where=masque)
+
+            if stop_on_cycle and np.any(bloc_L[lignes, lignes + debut] < 0):
+                arret.value = k
+
+            # Toutes les lignes sont à jour avant de passer à k + 1
+            barriere.wait()
+            if arret.value >= 0:
+                break
+
+        del Ls, Ps, bloc_L, bloc_P
+    except BrokenBarrierError:
+        # Un autre processus a échoué : le processus principal signale l'erreur
+        pass
+    finally:
+        shm_L.close()
+        shm_P.close()
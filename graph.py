@@ -2,8 +2,13 @@
 # Structure de données pour représenter un graphe orienté valué
 # On stocke les distances dans L et les prédécesseurs dans P
 
+from array import array
 from math import inf
 
+# Codage utilisé par le stockage compact (CompactGraph)
+INF_SENTINEL = inf   # distance infinie (pas de chemin), représentable en float64
+NO_PREDECESSOR = -1  # absence de prédécesseur (None dans la vue de compatibilité)
+
 class Graph:
     """
     Représentation d'un graphe orienté valué.
@@ -37,3 +42,271 @@ class Graph:
         self.L[u][v] = w
         # Le prédécesseur de v sur le chemin direct u->v est u
         self.P[u][v] = u
+
+    def add_arcs(self, arcs):
+        """
+        Ajoute une suite d'arcs (u, v, w), comme des appels successifs à add_arc.
+        """
+        L, P = self.L, self.P
+        for u, v, w in arcs:
+            L[u][v] = w
+            P[u][v] = u
+
+    def arcs(self):
+        """
+        Itère sur les arcs (u, v, w) lus dans L (avant l'exécution de Floyd-Warshall,
+        qui remplace L par les plus courts chemins). Une boucle u -> u n'est visible
+        que si son poids est non nul.
+        """
+        return _dense_arcs(self.L)
+
+    def neighbors(self, u):
+        """Renvoie la liste des successeurs (v, w) de u, lus dans la ligne L[u]."""
+        return _dense_neighbors(self.L, u)
+
+    def arc_count(self):
+        """Nombre d'arcs du graphe (parcours des n² cases de L)."""
+        return sum(1 for _ in self.arcs())
+
+
+class CompactGraph:
+    """
+    Variante compacte de Graph pour les grands graphes.
+
+    Les matrices sont stockées dans deux tampons contigus (module array) :
+    - dist : float64 (8 octets par paire), INF_SENTINEL pour "pas de chemin"
+    - pred : int32 (4 octets par paire), NO_PREDECESSOR pour "pas de prédécesseur"
+
+    L et P sont des vues de compatibilité qui s'utilisent comme des listes
+    de listes (L[i][j], P[i][j] = ...) : floyd, output et visualizer
+    fonctionnent donc sans modification.
+    """
+
+    def __init__(self, n):
+        """
+        n : nombre de sommets (0, 1, ..., n-1)
+        """
+        self.n = n
+
+        self.dist = array("d", [INF_SENTINEL]) * (n * n)
+        self.pred = array("i", [NO_PREDECESSOR]) * (n * n)
+        for i in range(n):
+            self.dist[i * n + i] = 0
+            self.pred[i * n + i] = i
+
+        self.L = MatrixView(self.dist, n)
+        self.P = MatrixView(self.pred, n, none_value=NO_PREDECESSOR)
+
+    def add_arc(self, u, v, w):
+        """
+        Ajoute / met à jour l'arc u -> v de poids w.
+        """
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise IndexError("indice de sommet hors limites")
+        self.dist[u * self.n + v] = w
+        self.pred[u * self.n + v] = u
+
+    def add_arcs(self, arcs):
+        """
+        Ajoute une suite d'arcs (u, v, w), comme des appels successifs à add_arc.
+        """
+        n, dist, pred = self.n, self.dist, self.pred
+        for u, v, w in arcs:
+            if not (0 <= u < n and 0 <= v < n):
+                raise IndexError("indice de sommet hors limites")
+            dist[u * n + v] = w
+            pred[u * n + v] = u
+
+    def arcs(self):
+        """
+        Itère sur les arcs (u, v, w) lus dans L (avant l'exécution de Floyd-Warshall,
+        qui remplace L par les plus courts chemins). Une boucle u -> u n'est visible
+        que si son poids est non nul.
+        """
+        return _dense_arcs(self.L)
+
+    def neighbors(self, u):
+        """Renvoie la liste des successeurs (v, w) de u, lus dans la ligne L[u]."""
+        return _dense_neighbors(self.L, u)
+
+    def arc_count(self):
+        """Nombre d'arcs du graphe (parcours des n² cases de L)."""
+        return sum(1 for _ in self.arcs())
+
+    def nbytes(self):
+        """Taille mémoire des deux matrices, en octets."""
+        return (len(self.dist) * self.dist.itemsize
+                + len(self.pred) * self.pred.itemsize)
+
+
+class SparseGraph:
+    """
+    Représentation creuse d'un graphe orienté valué, en O(n + m) mémoire.
+
+    adj[u] est un dictionnaire {v: w} des successeurs de u : ajouter deux fois
+    le même arc remplace son poids, comme dans Graph. Comme dans les matrices
+    de Graph et CompactGraph (où L[u][u] vaut déjà 0), une boucle u -> u de
+    poids nul n'est pas un arc : elle est ignorée, ou efface la boucle existante.
+
+    Les matrices L et P ne sont construites (densification) qu'au premier
+    accès, pour les algorithmes qui en ont besoin comme floyd_warshall.
+    """
+
+    def __init__(self, n):
+        """
+        n : nombre de sommets (0, 1, ..., n-1)
+        """
+        self.n = n
+        self.adj = [{} for _ in range(n)]
+        self._dense = None
+
+    def add_arc(self, u, v, w):
+        """
+        Ajoute / met à jour l'arc u -> v de poids w.
+        """
+        if not (0 <= u < self.n and 0 <= v < self.n):
+            raise IndexError("indice de sommet hors limites")
+        if u == v and w == 0:
+            self.adj[u].pop(u, None)
+        else:
+            self.adj[u][v] = w
+        # Une éventuelle version dense n'est plus à jour
+        self._dense = None
+
+    def add_arcs(self, arcs):
+        """
+        Ajoute une suite d'arcs (u, v, w), comme des appels successifs à add_arc.
+        """
+        n, adj = self.n, self.adj
+        for u, v, w in arcs:
+            if not (0 <= u < n and 0 <= v < n):
+                raise IndexError("indice de sommet hors limites")
+            if u == v and w == 0:
+                adj[u].pop(u, None)
+            else:
+                adj[u][v] = w
+        self._dense = None
+
+    def arcs(self):
+        """Itère sur les m arcs (u, v, w) du graphe."""
+        for u, successeurs in enumerate(self.adj):
+            for v, w in successeurs.items():
+                yield u, v, w
+
+    def neighbors(self, u):
+        """Renvoie les successeurs (v, w) de u."""
+        return self.adj[u].items()
+
+    def arc_count(self):
+        """Nombre d'arcs du graphe, en O(n)."""
+        return sum(len(successeurs) for successeurs in self.adj)
+
+    def to_dense(self, graph_class=Graph):
+        """
+        Construit un graphe dense (Graph ou CompactGraph) avec les mêmes arcs.
+        """
+        g = graph_class(self.n)
+        for u, v, w in self.arcs():
+            g.add_arc(u, v, w)
+        return g
+
+    @property
+    def L(self):
+        """Matrice des distances de la version dense (construite à la demande)."""
+        return self._densify().L
+
+    @property
+    def P(self):
+        """Matrice des prédécesseurs de la version dense (construite à la demande)."""
+        return self._densify().P
+
+    def _densify(self):
+        if self._dense is None:
+            self._dense = self.to_dense()
+        return self._dense
+
+
+def _dense_arcs(L):
+    """Itère sur les arcs (u, v, w) d'une matrice d'adjacence L."""
+    for u, ligne in enumerate(L):
+        for v, w in enumerate(ligne):
+            if w != inf and (u != v or w != 0):
+                yield u, v, w
+
+
+def _dense_neighbors(L, u):
+    """Successeurs (v, w) de u dans une matrice d'adjacence L."""
+    return [(v, w) for v, w in enumerate(L[u]) if w != inf and (u != v or w != 0)]
+
+
+class MatrixView:
+    """
+    Vue n x n sur un tampon linéaire (ligne par ligne), indexable comme M[i][j].
+
+    - Si none_value est fourni (matrice P), cette valeur est lue comme None
+      et None est écrit comme none_value.
+    - Sinon (matrice L), les flottants entiers sont relus comme des int,
+      pour que l'affichage reste identique à celui de Graph.
+    """
+
+    def __init__(self, buffer, n, none_value=None):
+        self.buffer = buffer
+        self.n = n
+        self.none_value = none_value
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("indice de ligne hors limites")
+        return _RowView(self, i * self.n)
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield _RowView(self, i * self.n)
+
+    def tolist(self):
+        """Copie la matrice sous forme de listes de listes (format de Graph)."""
+        return [list(ligne) for ligne in self]
+
+
+class _RowView:
+    """Une ligne d'une MatrixView ; traduit les sentinelles à la lecture et à l'écriture."""
+
+    __slots__ = ("matrix", "offset")
+
+    def __init__(self, matrix, offset):
+        self.matrix = matrix
+        self.offset = offset
+
+    def __len__(self):
+        return self.matrix.n
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return [self[x] for x in range(*j.indices(self.matrix.n))]
+        if j < 0:
+            j += self.matrix.n
+        if not 0 <= j < self.matrix.n:
+            raise IndexError("indice de colonne hors limites")
+        val = self.matrix.buffer[self.offset + j]
+        none_value = self.matrix.none_value
+        if none_value is not None:
+            return None if val == none_value else val
+        return int(val) if val.is_integer() else val
+
+    def __setitem__(self, j, val):
+        if j < 0:
+            j += self.matrix.n
+        if not 0 <= j < self.matrix.n:
+            raise IndexError("indice de colonne hors limites")
+        if val is None:
+            val = self.matrix.none_value
+        self.matrix.buffer[self.offset + j] = val
+
+    def __iter__(self):
+        for j in range(self.matrix.n):
+            yield self[j]
@@ -0,0 +1,161 @@
+# graph_binary.py
+# Format binaire compact pour les graphes, lu par projection mémoire (mmap)
+# En-tête (n, m, type des poids) puis trois tableaux contigus : u, v et w
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from graph import SparseGraph
+
+# Signature en tête de fichier, utilisée pour reconnaître le format
+MAGIC = b"FWGRAPH1"
+# Extension conseillée pour les fichiers binaires
+BINARY_EXTENSION = ".gbin"
+
+# En-tête (petit-boutiste) : signature, n, m, type des poids, bourrage jusqu'à 32 octets.
+# Les tableaux qui suivent restent ainsi alignés sur 8 octets.
+_ENTETE = struct.Struct("<8sqqc7x")
+# Types de poids possibles (codes du module array) : int32, int64, float64
+_TYPES_POIDS = (b"i", b"q", b"d")
+
+def is_binary_graph(path):
+    """Renvoie True si le fichier commence par la signature du format binaire."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_binary_graph(path, graph):
+    """
+    Écrit un graphe (Graph, CompactGraph ou SparseGraph) au format binaire.
+
+    Les arcs sont écrits triés par sommet initial u, ce qui permet de retrouver
+    les successeurs d'un sommet par dichotomie, sans index supplémentaire.
+    Les poids sont stockés en int32 si possible, en int64 sinon (float64 si
+    un poids n'est pas entier).
+    """
+    arcs = sorted(graph.arcs(), key=lambda arc: arc[0])
+    u = array("i", [a[0] for a in arcs])
+    v = array("i", [a[1] for a in arcs])
+
+    poids = [a[2] for a in arcs]
+    if all(isinstance(x, int) for x in poids):
+        code = "i" if all(-2**31 <= x < 2**31 for x in poids) else "q"
+    else:
+        code = "d"
+    w = array(code, poids)
+
+    if sys.byteorder != "little":
+        for tableau in (u, v, w):
+            tableau.byteswap()
+
+    with open(path, "wb") as f:
+        f.write(_ENTETE.pack(MAGIC, graph.n, len(arcs), code.encode("ascii")))
+        u.tofile(f)
+        v.tofile(f)
+        w.tofile(f)
+
+
+def convert_text_to_binary(src, dst):
+    """
+    Convertit un fichier de graphe au format texte du sujet vers le format binaire.
+    Les arcs en double sont fusionnés comme au chargement (le dernier l'emporte).
+    """
+    from loader import load_graph_from_file
+    write_binary_graph(dst, load_graph_from_file(src, SparseGraph))
+
+
+class MappedGraph(SparseGraph):
+    """
+    Graphe creux en lecture seule, adossé à un fichier binaire projeté en mémoire.
+
+    L'ouverture ne lit que l'en-tête : les tableaux u, v, w sont des vues
+    (memoryview) sur la projection, et ne sont chargés par le système qu'au
+    moment où ils sont parcourus. L et P sont construites à la demande,
+    comme pour SparseGraph.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            entete = f.read(_ENTETE.size)
+            if len(entete) < _ENTETE.size:
+                raise ValueError("Fichier de graphe binaire trop court.")
+            magic, n, m, code = _ENTETE.unpack(entete)
+            if magic != MAGIC or code not in _TYPES_POIDS:
+                raise ValueError("Fichier de graphe binaire mal formé.")
+
+            code = code.decode("ascii")
+            taille_w = array(code).itemsize
+            if n < 0 or m < 0 or _ENTETE.size + m * (8 + taille_w) > _file_size(f):
+                raise ValueError("Fichier de graphe binaire tronqué.")
+
+            self.n = n
+            self.m = m
+            self._dense = None
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        debut = _ENTETE.size
+        self.u = mapped_column(self._mmap, debut, m, "i")
+        self.v = mapped_column(self._mmap, debut + 4 * m, m, "i")
+        self.w = mapped_column(self._mmap, debut + 8 * m, m, code)
+
+    def add_arc(self, u, v, w):
+        raise TypeError("Un MappedGraph est en lecture seule.")
+
+    def add_arcs(self, arcs):
+        raise TypeError("Un MappedGraph est en lecture seule.")
+
+    def arcs(self):
+        """Itère sur les m arcs (u, v, w), dans l'ordre du fichier."""
+        return zip(self.u, self.v, self.w)
+
+    def neighbors(self, u):
+        """Successeurs (v, w) de u, retrouvés par dichotomie dans le tableau u trié."""
+        debut = bisect_left(self.u, u)
+        fin = bisect_right(self.u, u, debut)
+        return zip(self.v[debut:fin], self.w[debut:fin])
+
+    def arc_count(self):
+        """Nombre d'arcs, lu dans l'en-tête."""
+        return self.m
+
+    def close(self):
+        """
+        Libère la projection mémoire (le graphe n'est plus utilisable ensuite).
+        Si des vues sur u, v ou w existent encore ailleurs, la projection sera
+        libérée avec la dernière d'entre elles.
+        """
+        self.u = self.v = self.w = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+def _file_size(f):
+    """Taille d'un fichier ouvert, en octets."""
+    f.seek(0, 2)
+    return f.tell()
+
+
+def mapped_column(projection, debut, m, code):
+    """
+    Vue typée sur m valeurs de la projection, à partir de l'octet debut.
+    Sans copie sur une machine petit-boutiste ; sinon, copie avec inversion des octets.
+    """
+    octets = memoryview(projection)[debut:debut + m * array(code).itemsize]
+    if sys.byteorder == "little":
+        return octets.cast(code)
+    tableau = array(code, octets.tobytes())
+    tableau.byteswap()
+    return tableau
+
+
+if __name__ == "__main__":
+    # Conversion en ligne de commande : python graph_binary.py graphe.txt graphe.gbin
+    if len(sys.argv) != 3:
+        print("Usage : python graph_binary.py <fichier_texte> <fichier_binaire>")
+        sys.exit(1)
+    convert_text_to_binary(sys.argv[1], sys.argv[2])
+    print(f"Graphe converti : {sys.argv[2]}")
@@ -0,0 +1,350 @@
+# graph_generator.py
+# Génération de grands graphes synthétiques au format texte de load_graph_from_file
+# (n, m, puis une ligne "u v w" par arc), écrits par blocs sans construire le graphe en mémoire
+#
+# Usage : python graph_generator.py TOPOLOGIE N [-m ARCS] [--weights MIN MAX] [--negative 0.1]
+#                                   [--absorbing-cycle present|absent] [--seed 0] [-o fichier.txt]
+#
+# Topologies :
+#   grid        grille (réseau routier) : voisins gauche/droite/haut/bas, dans les deux sens
+#   scale_free  graphe sans échelle (Chung-Lu orienté) : degrés en loi de puissance,
+#               les sommets de petit numéro sont les plus connectés
+#   complete    graphe complet : n(n - 1) arcs
+#   dag         graphe orienté sans circuit (arcs u -> v avec u < v)
+#
+# Poids : entiers de [MIN, MAX] ; une proportion --negative des arcs reçoit un poids
+# négatif (de [MIN, -1]). Avec --absorbing-cycle present, un circuit de poids négatif
+# est planté ; avec absent, les poids suivent un potentiel caché (w >= p[u] - p[v]) qui
+# rend tout circuit de poids positif ou nul (au plus ~50 % d'arcs négatifs dans ce cas).
+
+import argparse
+import sys
+from math import isqrt
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TOPOLOGIES = ("grid", "scale_free", "complete", "dag")
+# Nombre d'arcs générés et écrits par bloc
+CHUNK_ARCS = 1 << 20
+# Tirages en loi de puissance avant de compléter les voisins manquants un à un
+_SCALE_FREE_ROUNDS = 8
+
+
+def generate_graph(path, topology, n, m=None, weight_range=(1, 100), negative_fraction=0.0,
+                   absorbing_cycle=None, seed=0, width=None, gamma=2.5):
+    """
+    Génère un graphe dans le fichier path (voir write_graph pour les paramètres).
+    Retourne le nombre d'arcs écrits.
+    """
+    with open(path, "w") as f:
+        return write_graph(f, topology, n, m, weight_range, negative_fraction,
+                           absorbing_cycle, seed, width, gamma)
+
+
+def write_graph(stream, topology, n, m=None, weight_range=(1, 100), negative_fraction=0.0,
+                absorbing_cycle=None, seed=0, width=None, gamma=2.5):
+    """
+    Écrit un graphe synthétique dans le flux texte stream, bloc par bloc.
+
+    Paramètres :
+    - topology : "grid", "scale_free", "complete" ou "dag"
+    - n : nombre de sommets
+    - m : nombre d'arcs pour "scale_free" et "dag" (par défaut 8n, borné) ;
+      il est imposé par la topologie pour "grid" et "complete"
+    - weight_range : (min, max), bornes incluses des poids
+    - negative_fraction : proportion visée d'arcs de poids négatif
+    - absorbing_cycle : True (un circuit absorbant est garanti), False (aucun circuit
+      absorbant) ou None (pas de garantie)
+    - seed : graine ; les mêmes paramètres donnent le même fichier
+    - width : largeur de la grille (par défaut √n ; la dernière ligne peut être incomplète)
+    - gamma : exposant de la loi de puissance des degrés de "scale_free" (> 2)
+
+    Lève ValueError si les paramètres sont incohérents.
+    Retourne le nombre d'arcs écrits.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("NumPy est nécessaire pour générer des graphes (pip install numpy).")
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Topologie inconnue : {topology} (attendu : {', '.join(TOPOLOGIES)}).")
+    if n < 1:
+        raise ValueError("Le graphe doit avoir au moins un sommet.")
+    lo, hi = weight_range
+    if lo > hi:
+        raise ValueError("Intervalle de poids vide.")
+    if not 0 <= negative_fraction <= 1:
+        raise ValueError("La proportion d'arcs négatifs doit être entre 0 et 1.")
+    if negative_fraction > 0 and lo >= 0:
+        raise ValueError("Des poids négatifs demandent un minimum négatif.")
+    if negative_fraction < 1 and hi < 0:
+        raise ValueError("Des poids positifs demandent un maximum positif ou nul.")
+
+    rng = np.random.default_rng(seed)
+    if topology == "grid":
+        width = width or max(1, isqrt(n))
+        m, chunks, circuit = _grid(n, width)
+    elif topology == "complete":
+        m, chunks, circuit = _complete(n)
+    elif topology == "dag":
+        m, chunks, circuit = _dag(n, m, rng)
+    else:
+        if gamma <= 2:
+            raise ValueError("L'exposant gamma doit être supérieur à 2.")
+        m, chunks, circuit = _scale_free(n, m, 1 / (gamma - 1), rng, forced=absorbing_cycle is True)
+
+    if absorbing_cycle is True:
+        if circuit is None:
+            raise ValueError(f"La topologie {topology} ne permet pas de circuit absorbant "
+                             f"(pas de circuit, ou graphe trop petit).")
+        if lo >= 0:
+            raise ValueError("Un circuit absorbant demande un minimum de poids négatif.")
+        # Les arcs du circuit planté reçoivent le poids minimal : le circuit est négatif
+        plantes = np.array([u * n + v for u, v in circuit], dtype=np.int64)
+
+    potentiel = None
+    if absorbing_cycle is False and topology != "dag" and negative_fraction > 0:
+        # Poids w >= p[u] - p[v] : w = b + p[u] - p[v] avec b >= 0, donc tout circuit
+        # a le poids de la somme de ses b, positive ou nulle
+        if hi < 1:
+            raise ValueError("Sans circuit absorbant, des poids négatifs demandent aussi un maximum positif.")
+        ecart = min(hi, -lo)
+        potentiel = rng.integers(0, ecart + 1, size=n)
+        # Seuls les arcs « montants » (p[u] < p[v]) peuvent être négatifs : environ la moitié
+        part_montante = 0.5 * (1 - 1 / (ecart + 1))
+        negative_fraction = min(1.0, negative_fraction / part_montante)
+
+    stream.write(f"{n}\n{m}\n")
+    ecrits = 0
+    for u, v in chunks:
+        w = _weights(rng, u, v, lo, hi, negative_fraction, potentiel)
+        if absorbing_cycle is True:
+            w[np.isin(u * n + v, plantes)] = lo
+        ecrits += _write_arcs(stream, u, v, w)
+
+    if ecrits != m:
+        raise AssertionError(f"{ecrits} arcs écrits au lieu de {m}.")
+    return m
+
+
+def _write_arcs(stream, u, v, w):
+    """Écrit un bloc d'arcs ; le formatage par gabarit "%d %d %d" est le plus rapide en Python."""
+    k = len(u)
+    if k:
+        stream.write(("%d %d %d\n" * k) % tuple(np.column_stack((u, v, w)).ravel().tolist()))
+    return k
+
+
+def _weights(rng, u, v, lo, hi, negative_fraction, potentiel):
+    """Poids d'un bloc d'arcs : négatifs dans [lo, -1] avec la probabilité voulue, sinon dans [max(lo, 0), hi]."""
+    k = len(u)
+    negatif = rng.random(k) < negative_fraction
+    if potentiel is None:
+        bas_negatif = np.full(k, lo)
+        bas_positif = np.full(k, max(lo, 0))
+    else:
+        # Contrainte w >= p[u] - p[v] (toujours satisfiable : |p[u] - p[v]| <= min(hi, -lo))
+        d = potentiel[u] - potentiel[v]
+        negatif &= d < 0
+        bas_negatif = np.maximum(lo, d)
+        bas_positif = np.maximum(max(lo, 0), d)
+    w = np.empty(k, dtype=np.int64)
+    positif = ~negatif
+    w[positif] = rng.integers(bas_positif[positif], hi + 1)
+    w[negatif] = rng.integers(bas_negatif[negatif], 0)
+    return w
+
+
+def _source_chunks(degres):
+    """Découpe les sommets en intervalles [debut, fin) d'environ CHUNK_ARCS arcs sortants."""
+    cumul = np.cumsum(degres)
+    debut = 0
+    while debut < len(degres):
+        deja = cumul[debut - 1] if debut else 0
+        fin = int(np.searchsorted(cumul, deja + CHUNK_ARCS, side="right"))
+        fin = max(fin, debut + 1)
+        yield debut, fin
+        debut = fin
+
+
+def _spread(m, poids, caps):
+    """Répartit m arcs entre les sommets, proportionnellement à poids, sans dépasser caps."""
+    if m > caps.sum():
+        raise ValueError(f"Trop d'arcs demandés : au plus {int(caps.sum())} pour cette topologie.")
+    degres = np.minimum(np.floor(m * poids / poids.sum()).astype(np.int64), caps)
+    reste = m - int(degres.sum())
+    while reste > 0:
+        libre = caps - degres
+        p = np.where(libre > 0, poids, 0)
+        if reste < np.count_nonzero(p):
+            # Moins d'un arc par sommet non saturé : un de plus aux plus gros d'entre eux
+            ajout = np.zeros_like(degres)
+            ajout[np.argsort(-p, kind="stable")[:reste]] = 1
+        else:
+            ajout = np.minimum(libre, np.floor(reste * p / p.sum()).astype(np.int64))
+        degres += ajout
+        reste -= int(ajout.sum())
+    return degres
+
+
+def _default_arcs(m, n, capacite):
+    return min(8 * n, capacite) if m is None else m
+
+
+def _grid(n, width):
+    """Grille de largeur width, arcs vers les 4 voisins ; circuit planté : le premier carré."""
+    lignes = -(-n // width)
+    m = 2 * ((n - lignes) + max(0, n - width))
+
+    def blocs():
+        for debut in range(0, n, max(1, CHUNK_ARCS // 4)):
+            src = np.arange(debut, min(n, debut + CHUNK_ARCS // 4))
+            col = src % width
+            voisins = np.stack((src - width, src - 1, src + 1, src + width), axis=1)
+            valide = np.stack((src >= width, col > 0, (col < width - 1) & (src + 1 < n), src + width < n), axis=1)
+            yield np.repeat(src, valide.sum(axis=1)), voisins[valide]
+
+    circuit = None
+    if width >= 2 and n >= width + 2:
+        circuit = [(0, 1), (1, width + 1), (width + 1, width), (width, 0)]
+    return m, blocs(), circuit
+
+
+def _complete(n):
+    """Graphe complet sans boucle ; circuit planté : 0 -> 1 -> 0."""
+    m = n * (n - 1)
+
+    def blocs():
+        pas = max(1, CHUNK_ARCS // max(1, n - 1))
+        autres = np.arange(n - 1)
+        for debut in range(0, n, pas):
+            src = np.arange(debut, min(n, debut + pas))
+            u = np.repeat(src, n - 1)
+            v = np.tile(autres, len(src))
+            yield u, v + (v >= u)
+
+    return m, blocs(), [(0, 1), (1, 0)] if n >= 2 else None
+
+
+def _dag(n, m, rng):
+    """
+    DAG : arcs u -> v avec u < v (0, 1, ..., n - 1 est un ordre topologique).
+    Les k successeurs de u sont tirés un par tranche de l'intervalle ]u, n[ : ils sont distincts.
+    """
+    caps = np.arange(n - 1, -1, -1, dtype=np.int64)
+    m = _default_arcs(m, n, n * (n - 1) // 2)
+    degres = _spread(m, np.ones(n), caps)
+
+    def blocs():
+        for debut, fin in _source_chunks(degres):
+            k = degres[debut:fin]
+            src = np.arange(debut, fin)
+            u = np.repeat(src, k)
+            rang = np.arange(len(u)) - np.repeat(np.cumsum(k) - k, k)
+            kk, cc = np.repeat(k, k), np.repeat(caps[debut:fin], k)
+            bas, haut = rang * cc // kk, (rang + 1) * cc // kk
+            yield u, u + 1 + bas + (rng.random(len(u)) * (haut - bas)).astype(np.int64)
+
+    return m, blocs(), None
+
+
+def _power_law(rng, k, n, a):
+    """k sommets tirés avec une probabilité proportionnelle à (i + 1)^-a (a < 1, inversion continue)."""
+    e = 1 - a
+    x = (1 + rng.random(k) * ((n + 1) ** e - 1)) ** (1 / e)
+    return np.minimum(x.astype(np.int64) - 1, n - 1)
+
+
+def _scale_free(n, m, a, rng, forced):
+    """
+    Chung-Lu orienté : le degré sortant et la probabilité d'être choisi comme
+    successeur sont proportionnels à (i + 1)^-a. Les doublons et les boucles tirés
+    sont écartés puis retirés ; circuit planté : 0 -> 1 -> 0 (les deux plus gros sommets).
+    """
+    m = _default_arcs(m, n, n * (n - 1))
+    poids = np.arange(1, n + 1, dtype=np.float64) ** -a
+    degres = _spread(m, poids, np.full(n, n - 1, dtype=np.int64))
+    circuit = [(0, 1), (1, 0)] if n >= 2 and degres[0] and degres[1] else None
+
+    def blocs():
+        for debut, fin in _source_chunks(degres):
+            src = np.arange(debut, fin)
+            k = degres[debut:fin]
+            cles = np.empty(0, dtype=np.int64)
+            if forced and circuit is not None:
+                cles = np.array(sorted(u * n + v for u, v in circuit if debut <= u < fin), dtype=np.int64)
+
+            for _ in range(_SCALE_FREE_ROUNDS):
+                manque = k - np.bincount(cles // n - debut, minlength=len(src))
+                if not manque.any():
+                    break
+                u = np.repeat(src, manque)
+                v = _power_law(rng, len(u), n, a)
+                garde = u != v
+                cles = _union(cles, u[garde] * n + v[garde])
+            else:
+                cles = _fill_missing(rng, cles, src, k, n)
+            yield cles // n, cles % n
+
+    return m, blocs(), circuit
+
+
+def _union(a, b):
+    """Union triée de deux tableaux d'entiers (plus rapide que np.union1d, qui passe par un hachage)."""
+    c = np.concatenate((a, b))
+    c.sort()
+    garde = np.ones(len(c), dtype=bool)
+    garde[1:] = c[1:] != c[:-1]
+    return c[garde]
+
+
+def _fill_missing(rng, cles, src, k, n):
+    """Complète, sommet par sommet, les successeurs que les tirages n'ont pas fournis."""
+    manque = k - np.bincount(cles // n - src[0], minlength=len(src))
+    ajouts = []
+    for i in np.nonzero(manque)[0]:
+        u = int(src[i])
+        presents = set((cles[cles // n == u] % n).tolist())
+        presents.add(u)
+        candidats = [v for v in rng.permutation(n).tolist() if v not in presents]
+        ajouts.extend(u * n + v for v in candidats[:manque[i]])
+    return _union(cles, np.array(ajouts, dtype=np.int64))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Génère un grand graphe synthétique au format texte du chargeur.")
+    parser.add_argument("topology", choices=TOPOLOGIES)
+    parser.add_argument("n", type=int, help="nombre de sommets")
+    parser.add_argument("-m", "--arcs", type=int, default=None,
+                        help="nombre d'arcs (scale_free et dag ; par défaut 8n)")
+    parser.add_argument("--weights", type=int, nargs=2, default=[1, 100], metavar=("MIN", "MAX"),
+                        help="bornes incluses des poids")
+    parser.add_argument("--negative", type=float, default=0.0,
+                        help="proportion d'arcs de poids négatif")
+    parser.add_argument("--absorbing-cycle", choices=("present", "absent"), default=None,
+                        help="garantir la présence ou l'absence d'un circuit absorbant")
+    parser.add_argument("--width", type=int, default=None, help="largeur de la grille (par défaut √n)")
+    parser.add_argument("--gamma", type=float, default=2.5, help="exposant de la loi de puissance (scale_free)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", default="-", help="fichier de sortie ('-' : sortie standard)")
+    args = parser.parse_args()
+
+    absorbant = None if args.absorbing_cycle is None else args.absorbing_cycle == "present"
+    options = dict(topology=args.topology, n=args.n, m=args.arcs, weight_range=tuple(args.weights),
+                   negative_fraction=args.negative, absorbing_cycle=absorbant, seed=args.seed,
+                   width=args.width, gamma=args.gamma)
+    try:
+        if args.output == "-":
+            write_graph(sys.stdout, **options)
+        else:
+            m = generate_graph(args.output, **options)
+            print(f"{args.output} : {args.n} sommets, {m} arcs")
+    except (ValueError, RuntimeError) as e:
+        print(f"ERREUR : {e}", file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
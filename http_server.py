@@ -0,0 +1,345 @@
+# http_server.py
+# Serveur HTTP local (asyncio, sans dépendance) gardant en mémoire des graphes déjà résolus
+# Les résolutions (chargement + Floyd-Warshall) tournent dans des processus séparés :
+# la boucle d'événements n'est jamais bloquée par un calcul
+#
+# Usage : python http_server.py [--port 8000] [--graphs-dir graphs] [--workers 4] [--preload]
+#
+#   GET  /path?graph=g14&from=0&to=9   plus court chemin (graph : nom du fichier, ou son début)
+#   GET  /graphs                       graphes disponibles et graphes en mémoire
+#   POST /graphs?name=reseau           envoi d'un graphe (corps : fichier texte ou binaire)
+#   GET  /metrics                      histogrammes de latence par point d'accès
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlsplit, parse_qs
+from loader import load_graph_from_file
+from floyd import floyd_warshall, NUMPY_AVAILABLE
+from path_queries import PathTreeCache
+from interface import list_graph_files
+
+# Bornes supérieures (en millisecondes) des classes des histogrammes de latence
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000)
+# Taille maximale d'un graphe envoyé
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+
+_RAISONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large",
+            431: "Request Header Fields Too Large", 500: "Internal Server Error"}
+
+
+def solve_file(path):
+    """
+    Charge et résout un graphe (exécuté dans un processus de calcul).
+    Retourne (L, P, cycle_negatif), en listes de listes.
+    """
+    g = load_graph_from_file(path)
+    engine = "numpy" if NUMPY_AVAILABLE else "python"
+    return floyd_warshall(g.L, g.P, verbose=False, engine=engine, stop_on_cycle=True)
+
+
+class LatencyHistogram:
+    """Histogramme cumulatif des durées de traitement d'un point d'accès."""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)  # dernière classe : au-delà de la plus grande borne
+        self.total = 0
+        self.sum_ms = 0.0
+
+    def record(self, seconds):
+        ms = seconds * 1000
+        self.total += 1
+        self.sum_ms += ms
+        for i, borne in enumerate(self.buckets_ms):
+            if ms <= borne:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+
+    def to_dict(self):
+        classes = {f"<={borne}ms": c for borne, c in zip(self.buckets_ms, self.counts)}
+        classes[f">{self.buckets_ms[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.total,
+            "mean_ms": round(self.sum_ms / self.total, 3) if self.total else None,
+            "buckets": classes,
+        }
+
+
+class SolvedGraph:
+    """Graphe résolu, gardé en mémoire : L, P et le cache des arbres de chemins."""
+
+    def __init__(self, L, P, cycle_negatif):
+        self.n = len(L)
+        self.L = L
+        self.P = P
+        self.cycle_negatif = cycle_negatif
+        self.paths = PathTreeCache(P)
+
+
+class QueryServer:
+    """
+    Serveur de requêtes : graphes résolus en mémoire (par nom), groupe de processus
+    pour les résolutions, histogrammes de latence par point d'accès.
+    """
+
+    def __init__(self, graphs_dir="graphs", workers=None):
+        self.graphs_dir = graphs_dir
+        self.workers = workers
+        self.pool = self._new_pool()
+        self.graphs = {}       # nom -> SolvedGraph
+        self._en_cours = {}    # nom -> asyncio.Future de la résolution en cours
+        self.latencies = {}    # point d'accès -> LatencyHistogram
+
+    def _new_pool(self):
+        # Processus lancés par "spawn" et non "fork" : un processus créé pendant une requête
+        # hériterait sinon des sockets des clients, qui ne seraient jamais vraiment fermées
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+    # --- Graphes ---------------------------------------------------------
+
+    def resolve_name(self, name):
+        """
+        Nom de graphe demandé -> nom connu : graphe envoyé, nom de fichier sans extension,
+        ou début de nom non suivi d'un chiffre (g14 -> g14_application, mais g1 -/-> g10test).
+        """
+        if name in self.graphs or name in self._en_cours:
+            return name
+        noms = [os.path.splitext(f)[0] for f in list_graph_files(self.graphs_dir)]
+        if name in noms:
+            return name
+        motif = re.compile(re.escape(name) + r"(\D.*)?$")
+        candidats = [nom for nom in noms if motif.match(nom)]
+        return candidats[0] if len(candidats) == 1 else None
+
+    def _graph_path(self, name):
+        for f in list_graph_files(self.graphs_dir):
+            if os.path.splitext(f)[0] == name:
+                return os.path.join(self.graphs_dir, f)
+        return None
+
+    async def get_graph(self, name):
+        """Graphe résolu (résolution dans un processus de calcul au premier accès)."""
+        if name in self.graphs:
+            return self.graphs[name]
+        path = self._graph_path(name)
+        if path is None:
+            return None
+        return await self._solve(name, path)
+
+    async def _solve(self, name, path, cleanup=False):
+        """Résout path dans le groupe de processus ; une seule résolution à la fois par nom."""
+        if name in self._en_cours:
+            return await asyncio.shield(self._en_cours[name])
+
+        loop = asyncio.get_running_loop()
+        attente = loop.create_future()
+        self._en_cours[name] = attente
+        try:
+            try:
+                L, P, cycle = await loop.run_in_executor(self.pool, solve_file, path)
+            except BrokenProcessPool:
+                # Un processus de calcul a planté : on repart avec un groupe neuf
+                self.pool = self._new_pool()
+                raise RuntimeError("Le processus de calcul s'est arrêté brutalement.")
+            graphe = SolvedGraph(L, P, cycle)
+            self.graphs[name] = graphe
+            attente.set_result(graphe)
+            return graphe
+        except BaseException as e:
+            attente.set_exception(e)
+            attente.exception()  # évite l'avertissement si personne d'autre n'attendait
+            raise
+        finally:
+            del self._en_cours[name]
+            if cleanup:
+                os.remove(path)
+
+    async def preload(self):
+        """Résout à l'avance tous les graphes du dossier (en parallèle)."""
+        noms = [os.path.splitext(f)[0] for f in list_graph_files(self.graphs_dir)]
+        await asyncio.gather(*(self.get_graph(nom) for nom in noms), return_exceptions=True)
+
+    # --- Points d'accès --------------------------------------------------
+
+    async def handle_path(self, query):
+        try:
+            name = query["graph"][0]
+            start, end = int(query["from"][0]), int(query["to"][0])
+        except (KeyError, ValueError):
+            return 400, {"error": "Paramètres attendus : graph, from, to (entiers)."}
+
+        nom = self.resolve_name(name)
+        graphe = await self.get_graph(nom) if nom is not None else None
+        if graphe is None:
+            return 404, {"error": f"Graphe inconnu : {name}"}
+        if graphe.cycle_negatif:
+            return 409, {"error": "Cycle absorbant : les plus courts chemins ne sont pas définis."}
+        if not (0 <= start < graphe.n and 0 <= end < graphe.n):
+            return 400, {"error": f"Sommets attendus entre 0 et {graphe.n - 1}."}
+
+        chemin = graphe.paths.path(start, end)
+        distance = None if chemin is None else graphe.L[start][end]
+        return 200, {"graph": nom, "from": start, "to": end, "distance": distance, "path": chemin}
+
+    async def handle_graphs(self, query):
+        disponibles = [os.path.splitext(f)[0] for f in list_graph_files(self.graphs_dir)]
+        en_memoire = {nom: {"vertices": g.n, "cycle": g.cycle_negatif} for nom, g in self.graphs.items()}
+        return 200, {"available": disponibles, "resident": en_memoire, "solving": sorted(self._en_cours)}
+
+    async def handle_upload(self, query, body):
+        name = query.get("name", [""])[0]
+        if not re.fullmatch(r"[\w.-]+", name):
+            return 400, {"error": "Paramètre name attendu (lettres, chiffres, '.', '-', '_')."}
+        if name in self._en_cours:
+            return 409, {"error": f"Le graphe {name} est déjà en cours de résolution."}
+
+        # Le fichier reçu est résolu par un processus de calcul, puis supprimé
+        fd, path = tempfile.mkstemp(prefix="upload_", suffix=".graph")
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        try:
+            graphe = await self._solve(name, path, cleanup=True)
+        except ValueError as e:
+            return 400, {"error": f"Graphe invalide : {e}"}
+        except IndexError:
+            return 400, {"error": "Graphe invalide : numéro de sommet hors de [0, n - 1]."}
+        return 201, {"graph": name, "vertices": graphe.n, "cycle": graphe.cycle_negatif}
+
+    async def handle_metrics(self, query):
+        return 200, {route: h.to_dict() for route, h in sorted(self.latencies.items())}
+
+    async def dispatch(self, method, target, body):
+        """
+        Choisit le point d'accès ; retourne (route, statut, réponse JSON).
+        Une erreur du traitement donne 500, comptée sous la route qui l'a produite.
+        """
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        traitements = {
+            ("GET", "/path"): lambda: self.handle_path(query),
+            ("GET", "/graphs"): lambda: self.handle_graphs(query),
+            ("POST", "/graphs"): lambda: self.handle_upload(query, body),
+            ("GET", "/metrics"): lambda: self.handle_metrics(query),
+        }
+        traitement = traitements.get((method, url.path))
+        if traitement is None:
+            if any(chemin == url.path for _, chemin in traitements):
+                return "autre", 405, {"error": f"Méthode {method} non prise en charge."}
+            return "autre", 404, {"error": f"Point d'accès inconnu : {url.path}"}
+
+        route = f"{method} {url.path}"
+        try:
+            return route, *await traitement()
+        except Exception as e:
+            return route, 500, {"error": f"{type(e).__name__}: {e}"}
+
+    # --- HTTP ------------------------------------------------------------
+
+    async def handle_connection(self, reader, writer):
+        """Une connexion : requêtes HTTP/1.1 successives (keep-alive) jusqu'à sa fermeture."""
+        try:
+            while True:
+                ligne = await reader.readline()
+                if not ligne:
+                    break
+                debut = time.perf_counter()
+                try:
+                    method, target, _ = ligne.decode("latin-1").split()
+                except ValueError:
+                    await self._send(writer, 400, {"error": "Requête HTTP mal formée."}, False)
+                    break
+
+                entetes = {}
+                while True:
+                    ligne = await reader.readline()
+                    if ligne in (b"\r\n", b"\n", b""):
+                        break
+                    cle, _, valeur = ligne.decode("latin-1").partition(":")
+                    entetes[cle.strip().lower()] = valeur.strip()
+
+                garder = entetes.get("connection", "").lower() != "close"
+                try:
+                    taille = int(entetes.get("content-length", 0) or 0)
+                    if taille < 0:
+                        raise ValueError(taille)
+                except ValueError:
+                    await self._send(writer, 400, {"error": "En-tête Content-Length invalide."}, False)
+                    break
+                if taille > MAX_UPLOAD_BYTES:
+                    await self._send(writer, 413, {"error": "Graphe trop volumineux."}, False)
+                    break
+                body = await reader.readexactly(taille) if taille else b""
+
+                try:
+                    route, statut, reponse = await self.dispatch(method, target, body)
+                except Exception as e:
+                    route, statut, reponse = "erreur", 500, {"error": f"{type(e).__name__}: {e}"}
+                await self._send(writer, statut, reponse, garder)
+                self.latencies.setdefault(route, LatencyHistogram()).record(time.perf_counter() - debut)
+                if not garder:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except (ValueError, asyncio.LimitOverrunError):
+            # readline : ligne de requête ou d'en-tête plus longue que la limite du flux (64 Kio)
+            try:
+                await self._send(writer, 431, {"error": "Ligne de requête ou d'en-tête trop longue."}, False)
+            except ConnectionError:
+                pass
+        finally:
+            writer.close()
+
+    async def _send(self, writer, statut, reponse, garder):
+        corps = json.dumps(reponse, ensure_ascii=False).encode("utf-8")
+        entete = (f"HTTP/1.1 {statut} {_RAISONS.get(statut, '')}\r\n"
+                  f"Content-Type: application/json; charset=utf-8\r\n"
+                  f"Content-Length: {len(corps)}\r\n"
+                  f"Connection: {'keep-alive' if garder else 'close'}\r\n\r\n")
+        writer.write(entete.encode("latin-1") + corps)
+        await writer.drain()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def serve(host="127.0.0.1", port=8000, graphs_dir="graphs", workers=None, preload=False):
+    server = QueryServer(graphs_dir, workers)
+    if preload:
+        await server.preload()
+    tcp = await asyncio.start_server(server.handle_connection, host, port)
+    print(f"Serveur à l'écoute sur http://{host}:{port} ({len(server.graphs)} graphe(s) en mémoire)")
+    try:
+        async with tcp:
+            await tcp.serve_forever()
+    finally:
+        server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur HTTP de requêtes de plus courts chemins.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--graphs-dir", default="graphs")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processus de calcul (par défaut, le nombre de cœurs)")
+    parser.add_argument("--preload", action="store_true",
+                        help="résoudre tous les graphes du dossier au démarrage")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.graphs_dir, args.workers, args.preload))
+    except KeyboardInterrupt:
+        print("\nServeur arrêté.")
+
+
+if __name__ == "__main__":
+    main()
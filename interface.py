@@ -4,7 +4,10 @@
 
 import os
 import re
+from functools import partial
 from output import print_path_and_distance
+from graph_binary import BINARY_EXTENSION
+from path_queries import PathTreeCache
 
 # ANSI color codes (minimal, with fallback for Windows)
 try:
@@ -59,14 +62,15 @@ def extract_number(filename):
 
 def list_graph_files(graphs_dir="graphs"):
     """
-    Retourne la liste triée NUMERIQUEMENT des fichiers .txt dans graphs_dir.
+    Retourne la liste triée NUMERIQUEMENT des fichiers .txt (et des graphes
+    binaires .gbin, voir graph_binary.py) dans graphs_dir.
     """
     if not os.path.isdir(graphs_dir):
         return []
 
     files = [
         f for f in os.listdir(graphs_dir)
-        if f.lower().endswith(".txt")
+        if f.lower().endswith((".txt", BINARY_EXTENSION))
     ]
 
     # Tri numérique pour que g10.txt vienne après g9.txt
@@ -139,24 +143,28 @@ def display_graph_summary(graph):
     print(f"{Colors.SUCCESS}✓ Graphe chargé avec succès{Colors.RESET}")
     print(f"  • Nombre de sommets : {Colors.BOLD}{graph.n}{Colors.RESET}")
     
-    # Compter le nombre d'arcs (non-infini dans L)
-    from math import inf
-    arc_count = 0
-    for i in range(graph.n):
-        for j in range(graph.n):
-            if i != j and graph.L[i][j] != inf:
-                arc_count += 1
+    # Compter le nombre d'arcs (O(m) pour un SparseGraph, sans densification)
+    arc_count = graph.arc_count()
     
     print(f"  • Nombre d'arcs : {Colors.BOLD}{arc_count}{Colors.RESET}")
     print_separator("-", 60)
 
 
+def format_cycle(cycle):
+    """
+    Met en forme un cycle [v0, v1, ..., vk] sous la forme "v0 -> v1 -> ... -> vk -> v0".
+    """
+    return " -> ".join(str(v) for v in cycle + cycle[:1])
+
+
 def ask_for_paths(L, P):
     """
     Boucle de demande de chemins à l'utilisateur suivant la séquence du sujet :
     "Chemin ? Si oui, alors Sommet de départ ? Sommet d'arrivée ? Affichage du chemin Recommencer?"
     """
     n = len(L)
+    # Les arbres de chemins des sources déjà interrogées sont gardés en cache
+    paths = PathTreeCache(P)
     
     print(f"\n{Colors.TITLE}=== Analyse des plus courts chemins ==={Colors.RESET}")
     print(f"Le graphe contient {n} sommets (numérotés de 0 à {n-1}).")
@@ -198,7 +206,7 @@ def ask_for_paths(L, P):
 
         # Affichage du chemin
         print()
-        print_path_and_distance(L, P, start, end)
+        print_path_and_distance(L, P, start, end, paths)
         print()
 
         # Recommencer ?
@@ -213,9 +221,69 @@ def ask_for_paths(L, P):
     print(f"{Colors.SUCCESS}Retour au menu principal.{Colors.RESET}")
 
 
-def run_automatic_tests(graphs_dir="graphs"):
+def test_graph_file(path, precheck=True, cache=True):
+    """
+    Charge un graphe et recherche un cycle absorbant (étape de run_automatic_tests).
+    Fonction de niveau module : elle peut être confiée à un processus de calcul.
+
+    Retourne un dictionnaire : vertices, has_cycle, cycle (sommets du cycle
+    trouvé par la pré-vérification) et cached (None si le cache n'a pas été consulté).
+    """
+    from loader import load_graph_from_file
+    from floyd import floyd_warshall
+    from sssp import adjacency_lists, find_negative_cycle
+    from result_file import graph_fingerprint
+    from result_cache import ResultCache
+
+    g = load_graph_from_file(path)
+    cycle = None
+    if precheck:
+        cycle = find_negative_cycle(adjacency_lists(g))
+
+    cached = None
+    if cycle is not None:
+        cycle_negatif = True
+    else:
+        result_cache = ResultCache() if cache else None
+        # Empreinte prise avant Floyd-Warshall, qui modifie g.L et g.P sur place
+        fingerprint = graph_fingerprint(g) if result_cache else None
+        saved = result_cache.get(fingerprint) if result_cache else None
+        if result_cache:
+            cached = saved is not None
+        if saved is not None:
+            cycle_negatif = saved.cycle_negatif
+            saved.close()
+        else:
+            # Exécuter Floyd-Warshall sans affichage détaillé
+            L, P, cycle_negatif = floyd_warshall(g.L, g.P, verbose=False, show_initial=False,
+                                                 stop_on_cycle=True)
+            # Avec stop_on_cycle, L et P sont incomplètes en cas de cycle : pas de mise en cache
+            if result_cache and not cycle_negatif:
+                result_cache.put(fingerprint, L, P, cycle_negatif)
+
+    return {
+        'vertices': g.n,
+        'has_cycle': cycle_negatif,
+        'cycle': cycle,
+        'cached': cached
+    }
+
+
+def run_automatic_tests(graphs_dir="graphs", precheck=True, cache=True, workers=1, timeout=None):
     """
     Exécute Floyd-Warshall sur tous les graphes et affiche un résumé.
+
+    Si precheck est True, les graphes contenant un cycle absorbant sont repérés
+    par une recherche rapide (SPFA) sans lancer Floyd-Warshall.
+
+    Si cache est True, les résultats sans cycle absorbant sont conservés dans
+    un cache disque (voir result_cache.py) : seuls les graphes modifiés depuis
+    la dernière exécution sont recalculés.
+
+    Avec workers > 1 ou un timeout (en secondes), les graphes sont répartis entre
+    plusieurs processus (voir batch_runner.py) : un graphe trop long ou qui fait
+    planter son processus est signalé en erreur sans bloquer les autres.
+    Le résumé reste dans l'ordre numérique des fichiers.
     """
     files = list_graph_files(graphs_dir)
     
@@ -226,51 +294,60 @@ def run_automatic_tests(graphs_dir="graphs"):
     print(f"\n{Colors.TITLE}=== Mode test automatique ==={Colors.RESET}")
     print(f"Analyse de {len(files)} graphe(s)...\n")
     
-    from loader import load_graph_from_file
-    from floyd import floyd_warshall
+    from batch_runner import run_batch
+    from result_cache import cache_summary
     
-    results = []
+    paths = [os.path.join(graphs_dir, fname) for fname in files]
+    job = partial(test_graph_file, precheck=precheck, cache=cache)
     
-    # On teste chaque graphe et on stocke les résultats
-    for fname in files:
-        path = os.path.join(graphs_dir, fname)
-        try:
-            g = load_graph_from_file(path)
-            # Exécuter Floyd-Warshall sans affichage détaillé
-            L, P, cycle_negatif = floyd_warshall(g.L, g.P, verbose=False, show_initial=False)
-            
-            results.append({
-                'file': fname,
-                'vertices': g.n,
-                'has_cycle': cycle_negatif
-            })
-            
-        except Exception as e:
+    # On teste chaque graphe (dans ce processus, ou réparti entre plusieurs)
+    if workers > 1 or timeout is not None:
+        outcomes = run_batch(paths, job, workers, timeout)
+    else:
+        outcomes = []
+        for path in paths:
+            try:
+                outcomes.append((True, job(path)))
+            except Exception as e:
+                outcomes.append((False, str(e)))
+    
+    results = []
+    for fname, (ok, value) in zip(files, outcomes):
+        if ok:
+            results.append(dict(value, file=fname))
+        else:
             results.append({
                 'file': fname,
                 'vertices': None,
                 'has_cycle': None,
-                'error': str(e)
+                'error': value
             })
     
     # Afficher le résumé
     print_separator("=", 70, Colors.SEPARATOR)
-    print(f"{Colors.BOLD}{'Fichier':<20} {'Sommets':<10} {'Cycle négatif':<20}{Colors.RESET}")
+    print(f"{Colors.BOLD}{'Fichier':<20} {'Sommets':<10} {'Cache':<8} {'Cycle négatif':<20}{Colors.RESET}")
     print_separator("-", 70, Colors.SEPARATOR)
     
     for r in results:
         file_str = r['file']
+        cache_str = {True: "succès", False: "échec"}.get(r.get('cached'), "-")
         if r['vertices'] is None:
             vertices_str = "ERREUR"
             cycle_str = f"{Colors.ERROR}{r.get('error', 'Inconnu')}{Colors.RESET}"
         else:
             vertices_str = str(r['vertices'])
-            if r['has_cycle']:
+            if r['has_cycle'] and r.get('cycle'):
+                cycle_str = f"{Colors.ERROR}OUI ({format_cycle(r['cycle'])}){Colors.RESET}"
+            elif r['has_cycle']:
                 cycle_str = f"{Colors.ERROR}OUI{Colors.RESET}"
             else:
                 cycle_str = f"{Colors.SUCCESS}NON{Colors.RESET}"
         
-        print(f"{file_str:<20} {vertices_str:<10} {cycle_str}")
+        print(f"{file_str:<20} {vertices_str:<10} {cache_str:<8} {cycle_str}")
     
     print_separator("=", 70, Colors.SEPARATOR)
+    if cache:
+        hits = sum(1 for r in results if r.get('cached') is True)
+        misses = sum(1 for r in results if r.get('cached') is False)
+        print(cache_summary(hits, misses))
     print()
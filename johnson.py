@@ -0,0 +1,85 @@
+# johnson.py
+# Algorithme de Johnson : plus courts chemins entre toutes les paires pour les graphes creux
+# Repondération par Bellman-Ford, puis un Dijkstra (tas binaire) par source : O(n·m·log n)
+
+from array import array
+from graph import Graph, CompactGraph
+from sssp import (adjacency_lists, bellman_ford_potentials, dijkstra,
+                  remove_loops, incoming_arcs, apply_loop_rule)
+
+def johnson(graph, verbose=False, compact=False):
+    """
+    Calcule les plus courts chemins entre toutes les paires avec l'algorithme de Johnson.
+
+    Paramètres :
+    - graph : Graph, CompactGraph ou SparseGraph (il faut les arcs d'origine :
+      ne pas appeler johnson après floyd_warshall sur le même graphe dense)
+    - verbose : si True, affiche le diagnostic sur les cycles absorbants
+    - compact : si True, L et P sont renvoyées dans des tampons compacts
+      (vues MatrixView, comme CompactGraph) au lieu de listes de listes
+
+    Retourne (L, P, cycle_negatif), au même format que floyd_warshall :
+    mêmes distances L, et P donne un plus court chemin valide
+    (en cas d'égalité entre deux chemins, le prédécesseur retenu peut différer).
+    En cas de cycle absorbant, les plus courts chemins ne sont pas définis :
+    L et P sont alors les matrices initiales (arcs directs).
+    """
+    n = graph.n
+    adj = adjacency_lists(graph)
+
+    # Les boucles u -> u ne servent pas à Dijkstra, mais comptent pour L[u][u]
+    boucles = remove_loops(adj)
+
+    # Une boucle de poids négatif est à elle seule un cycle absorbant
+    h = None
+    if all(w >= 0 for w in boucles.values()):
+        h = bellman_ford_potentials(adj)
+
+    if h is None:
+        if verbose:
+            print("!  Cycle absorbant détecté (cycle de poids négatif).")
+        return _initial_matrices(graph, compact) + (True,)
+
+    # Arcs entrants, pour recalculer L[u][u] en présence d'une boucle
+    entrants = incoming_arcs(adj, boucles)
+
+    L, P = _empty_matrices(n, compact)
+    for s in range(n):
+        dist, pred = dijkstra(adj, s, h)
+
+        if s in boucles:
+            apply_loop_rule(dist, pred, s, boucles[s], entrants[s])
+
+        _store_row(L, P, s, dist, pred, compact)
+
+    if verbose:
+        print("Aucun cycle absorbant détecté.")
+
+    return L, P, False
+
+
+def _empty_matrices(n, compact):
+    """Prépare les matrices résultat (listes à remplir ou tampons compacts)."""
+    if compact:
+        g = CompactGraph(n)
+        return g.L, g.P
+    return [], []
+
+
+def _store_row(L, P, s, dist, pred, compact):
+    """Range la ligne s des distances et des prédécesseurs dans les matrices résultat."""
+    if compact:
+        n = L.n
+        L.buffer[s * n:(s + 1) * n] = array("d", dist)
+        P.buffer[s * n:(s + 1) * n] = array("i", [-1 if p is None else p for p in pred])
+    else:
+        L.append(dist)
+        P.append(pred)
+
+
+def _initial_matrices(graph, compact):
+    """Matrices initiales (arcs directs uniquement), comme celles de Graph."""
+    g = CompactGraph(graph.n) if compact else Graph(graph.n)
+    for u, v, w in graph.arcs():
+        g.add_arc(u, v, w)
+    return g.L, g.P
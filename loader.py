@@ -2,9 +2,30 @@
 # Charge un graphe depuis un fichier texte au format du sujet
 # Format : première ligne = nombre de sommets, deuxième = nombre d'arcs, puis les arcs
 
+import re
+import warnings
+from itertools import islice
 from graph import Graph
+from graph_binary import MappedGraph, is_binary_graph
 
-def load_graph_from_file(path):
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Taille des blocs lus dans le fichier (les arcs sont analysés bloc par bloc)
+CHUNK_SIZE = 1 << 22
+
+# Ligne de commentaire (premier caractère non blanc = '#')
+_LIGNE_COMMENTAIRE = re.compile(rb"^[ \t\f\v]*#[^\n]*\n?", re.MULTILINE)
+# Une ligne et sa fin de ligne, telles que les découpe open() en mode texte
+_LIGNE = re.compile(rb"[^\r\n]*(?:\r\n|\r|\n|$)")
+_FIN_DE_LIGNE = re.compile(r"\r\n|\r|\n")
+# Caractères ASCII que str.split() traite comme des blancs, mais pas bytes.split()
+_BLANCS_STR_SEULEMENT = (b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+
+def load_graph_from_file(path, graph_class=Graph):
     """
     Lit un graphe depuis un fichier texte.
     Format attendu (comme dans l'annexe du sujet) :
@@ -17,35 +38,190 @@ def load_graph_from_file(path):
         w = poids (entier)
 
     On ignore les lignes vides et les lignes commençant par '#'.
+
+    graph_class : classe de graphe à construire (Graph par défaut,
+    CompactGraph pour un stockage compact des matrices, SparseGraph pour
+    des listes d'adjacence en O(n + m) sans matrice n x n).
+
+    Le fichier est lu par blocs de CHUNK_SIZE octets, analysés en bloc
+    (avec NumPy s'il est installé) ; les arcs de chaque bloc sont ajoutés
+    directement au graphe, sans garder le texte du fichier en mémoire.
+    Les règles (commentaires, lignes vides, trois valeurs par ligne) et les
+    erreurs (ValueError) sont les mêmes que pour une lecture ligne par ligne.
+
+    Les fichiers au format binaire (voir graph_binary.py) sont reconnus
+    automatiquement et projetés en mémoire : avec graph_class=SparseGraph,
+    on obtient sans copie un MappedGraph (graphe creux en lecture seule).
     """
-    with open(path, "r", encoding="utf-8") as f:
-        # On filtre les commentaires et les lignes vides
-        lignes_utiles = []
-        for ligne in f:
-            ligne = ligne.strip()
-            if not ligne:
-                continue
-            if ligne.startswith("#"):
-                continue
-            lignes_utiles.append(ligne)
-
-        if len(lignes_utiles) < 2:
+    if is_binary_graph(path):
+        return _load_binary_graph(path, graph_class)
+
+    with open(path, "rb") as f:
+        blocs = _read_chunks(f)
+
+        # En-tête : les deux premières lignes utiles donnent n et m
+        entete = []
+        reste = b""
+        for bloc in blocs:
+            for ligne_brute in _LIGNE.finditer(bloc):
+                ligne = ligne_brute.group().decode("utf-8").strip()
+                if not ligne or ligne.startswith("#"):
+                    continue
+                entete.append(ligne)
+                if len(entete) == 2:
+                    reste = bloc[ligne_brute.end():]
+                    break
+            if len(entete) == 2:
+                break
+
+        if len(entete) < 2:
             raise ValueError("Fichier de graphe trop court ou mal formé.")
 
-        n = int(lignes_utiles[0])
-        m = int(lignes_utiles[1])
+        n = int(entete[0])
+        m = int(entete[1])
+
+        g = graph_class(n)
 
-        if len(lignes_utiles) < 2 + m:
+        # On ajoute les arcs bloc par bloc, jusqu'à en avoir lu m
+        restant = m
+        for bloc in _chain(reste, blocs):
+            if restant <= 0:
+                break
+            restant -= _add_arcs_from_chunk(g, bloc, restant)
+
+        if restant > 0:
             raise ValueError("Nombre de lignes d'arcs incohérent avec m.")
 
-        g = Graph(n)
+    return g
+
 
-        # On ajoute chaque arc au graphe
-        for i in range(m):
-            u_str, v_str, w_str = lignes_utiles[2 + i].split()
-            u = int(u_str)
-            v = int(v_str)
-            w = int(w_str)
-            g.add_arc(u, v, w)
+def _load_binary_graph(path, graph_class):
+    """Charge un fichier binaire : projection directe, ou copie dans graph_class."""
+    projection = MappedGraph(path)
+    if issubclass(MappedGraph, graph_class):
+        return projection
 
+    g = graph_class(projection.n)
+    g.add_arcs(projection.arcs())
+    projection.close()
     return g
+
+
+def _read_chunks(f):
+    """
+    Lit le fichier binaire f par blocs d'environ CHUNK_SIZE octets
+    se terminant tous sur une fin de ligne (sauf éventuellement le dernier).
+    """
+    reste = b""
+    while True:
+        donnees = f.read(CHUNK_SIZE)
+        if not donnees:
+            break
+        donnees = reste + donnees
+        coupure = donnees.rfind(b"\n") + 1
+        if coupure == 0:
+            # Pas encore de fin de ligne : on continue à lire
+            reste = donnees
+            continue
+        reste = donnees[coupure:]
+        yield donnees[:coupure]
+    if reste:
+        yield reste
+
+
+def _chain(premier, blocs):
+    """Enchaîne un premier bloc (s'il n'est pas vide) et les blocs suivants."""
+    if premier:
+        yield premier
+    yield from blocs
+
+
+def _add_arcs_from_chunk(g, bloc, restant):
+    """
+    Ajoute au graphe les arcs d'un bloc de lignes, au plus `restant` arcs.
+    Retourne le nombre d'arcs (lignes utiles) consommés.
+    """
+    if not bloc.isascii() or any(c in bloc for c in _BLANCS_STR_SEULEMENT):
+        # Texte inhabituel : on garde exactement la sémantique des chaînes Python
+        return _add_arcs_line_by_line(g, bloc, restant)
+
+    if b"\r" in bloc:
+        bloc = bloc.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if b"#" in bloc:
+        bloc = _LIGNE_COMMENTAIRE.sub(b"", bloc)
+
+    if NUMPY_AVAILABLE:
+        nb = _add_arcs_numpy(g, bloc, restant)
+        if nb is not None:
+            return nb
+
+    # Découpage des lignes puis des valeurs : les boucles de map/filter tournent en C
+    lignes = filter(None, map(bytes.split, bloc.split(b"\n")))
+    arcs = [(int(u), int(v), int(w)) for u, v, w in islice(lignes, restant)]
+    g.add_arcs(arcs)
+    return len(arcs)
+
+
+def _add_arcs_numpy(g, bloc, restant):
+    """
+    Analyse vectorisée d'un bloc (ASCII, sans commentaire, fins de ligne "\n").
+    Retourne le nombre d'arcs ajoutés, ou None si le bloc n'a pas exactement
+    trois entiers par ligne non vide (il est alors analysé autrement).
+    """
+    octets = np.frombuffer(bloc, dtype=np.uint8)
+    if octets.size == 0:
+        return 0
+
+    # Début de valeur : caractère non blanc précédé d'un blanc (ou en début de bloc)
+    fin_ligne = octets == 10
+    separateur = fin_ligne | (octets == 32) | ((octets >= 9) & (octets <= 13))
+    debut_valeur = ~separateur
+    debut_valeur[1:] &= separateur[:-1]
+
+    # Nombre de valeurs par ligne : 0 (ligne vide) ou 3
+    num_ligne = np.cumsum(fin_ligne) - fin_ligne
+    par_ligne = np.bincount(num_ligne[debut_valeur])
+    if np.any((par_ligne != 0) & (par_ligne != 3)):
+        return None
+
+    try:
+        with warnings.catch_warnings():
+            # Une valeur non entière provoque un avertissement : on le traite comme une erreur
+            warnings.simplefilter("error", DeprecationWarning)
+            valeurs = np.fromstring(bloc, dtype=np.int64, sep=" ")
+    except (ValueError, DeprecationWarning):
+        return None
+
+    limites = np.iinfo(np.int64)
+    if (valeurs.size != np.count_nonzero(debut_valeur)
+            or np.any(valeurs == limites.max) or np.any(valeurs == limites.min)):
+        # Valeur illisible ou trop grande pour un entier 64 bits
+        return None
+
+    valeurs = valeurs[:3 * restant].tolist()
+    entiers = iter(valeurs)
+    g.add_arcs(zip(entiers, entiers, entiers))
+    return len(valeurs) // 3
+
+
+def _add_arcs_line_by_line(g, bloc, restant):
+    """
+    Analyse un bloc ligne par ligne, avec les règles d'origine
+    (lignes vides et commentaires ignorés, exactement trois valeurs par ligne).
+    """
+    nb = 0
+    for ligne in _FIN_DE_LIGNE.split(bloc.decode("utf-8")):
+        if nb == restant:
+            break
+        ligne = ligne.strip()
+        if not ligne:
+            continue
+        if ligne.startswith("#"):
+            continue
+        u_str, v_str, w_str = ligne.split()
+        u = int(u_str)
+        v = int(v_str)
+        w = int(w_str)
+        g.add_arc(u, v, w)
+        nb += 1
+    return nb
@@ -2,15 +2,25 @@
 # Point d'entrée principal du programme
 # On orchestre le menu et le flux d'exécution : choix de graphe, Floyd-Warshall, chemins
 
+import os
 from interface import (
     print_header, display_graph_list, choose_graph_file,
     display_graph_summary, ask_for_paths, run_automatic_tests,
-    Colors, print_separator
+    format_cycle, Colors, print_separator
 )
 from loader import load_graph_from_file
+from graph import SparseGraph
 from floyd import floyd_warshall
+from sssp import adjacency_lists, find_negative_cycle
 from output import print_matrix
+from tracing import TextTraceObserver, SampledObserver
 from visualizer import visualize_graph, open_in_browser, PYVIS_AVAILABLE
+from result_file import graph_fingerprint, save_results, open_results, RESULT_EXTENSION
+
+# Au-delà de ce nombre de sommets, on n'affiche qu'une itération sur dix environ
+TRACE_FULL_MAX_VERTICES = 30
+# Dossier des résultats enregistrés (matrices L et P, voir result_file.py)
+RESULTS_DIR = "results"
 
 
 def show_main_menu():
@@ -35,9 +45,35 @@ def show_main_menu():
         print(f"{Colors.ERROR}Choix invalide. Veuillez entrer un nombre entre 1 et 5.{Colors.RESET}")
 
 
-def analyze_graph(graphs_dir="graphs"):
+def result_path_for(graph_path):
+    """Chemin du fichier de résultat associé à un fichier de graphe."""
+    base_name = os.path.splitext(os.path.basename(graph_path))[0]
+    return os.path.join(RESULTS_DIR, base_name + RESULT_EXTENSION)
+
+
+def open_saved_results(path, fingerprint):
+    """Rouvre le résultat enregistré s'il existe et a cette empreinte de graphe, sinon None."""
+    if not os.path.isfile(path):
+        return None
+    try:
+        saved = open_results(path)
+    except (OSError, ValueError):
+        return None
+    if saved.fingerprint != fingerprint:
+        saved.close()
+        return None
+    return saved
+
+
+def analyze_graph(graphs_dir="graphs", precheck=True):
     """
     Gère l'analyse d'un graphe : sélection, chargement, Floyd-Warshall, chemins.
+
+    Si precheck est True, on recherche d'abord un cycle absorbant (SPFA, O(n·m)) :
+    s'il y en a un, on l'affiche et on ne lance pas Floyd-Warshall (O(n³)).
+
+    Si un résultat a été enregistré pour ce même graphe (dossier results/),
+    il est rouvert par projection mémoire au lieu d'être recalculé.
     """
     path = choose_graph_file(graphs_dir)
     
@@ -48,21 +84,61 @@ def analyze_graph(graphs_dir="graphs"):
     print(f"\n{Colors.TITLE}Chargement du graphe : {path}{Colors.RESET}")
     
     try:
-        g = load_graph_from_file(path)
+        # Chargement creux en O(n + m) (projection directe d'un fichier binaire) :
+        # les matrices n x n ne sont construites que si un calcul est nécessaire
+        creux = load_graph_from_file(path, SparseGraph)
     except Exception as e:
         print(f"{Colors.ERROR}Erreur lors du chargement du graphe : {e}{Colors.RESET}")
         return True  # Continue the loop
     
-    display_graph_summary(g)
+    display_graph_summary(creux)
+    
+    # Résultat déjà calculé lors d'une session précédente ?
+    fingerprint = graph_fingerprint(creux)
+    result_path = result_path_for(path)
+    saved = open_saved_results(result_path, fingerprint)
+    if saved is not None:
+        print(f"\n{Colors.SUCCESS}Résultat enregistré trouvé ({result_path}) : pas de recalcul.{Colors.RESET}")
+        if saved.cycle_negatif:
+            print(f"\n{Colors.ERROR}{Colors.BOLD}⚠ ATTENTION : Cycle absorbant détecté !{Colors.RESET}")
+            print(f"{Colors.WARNING}Les plus courts chemins ne sont pas définis.{Colors.RESET}")
+        else:
+            ask_for_paths(saved.L, saved.P)
+        saved.close()
+        print_separator("=", 70, Colors.SEPARATOR)
+        input(f"\n{Colors.WARNING}Appuyez sur Entrée pour retourner au menu principal...{Colors.RESET}")
+        return True  # Continue the loop
+    
+    if precheck:
+        # Vérification rapide avant le calcul cubique
+        cycle = find_negative_cycle(adjacency_lists(creux))
+        if cycle is not None:
+            print(f"\n{Colors.ERROR}{Colors.BOLD}⚠ ATTENTION : Cycle absorbant détecté avant Floyd-Warshall !{Colors.RESET}")
+            print(f"{Colors.WARNING}Circuit de poids négatif : {format_cycle(cycle)}{Colors.RESET}")
+            print(f"{Colors.WARNING}Les plus courts chemins ne sont pas définis.{Colors.RESET}")
+            print_separator("=", 70, Colors.SEPARATOR)
+            input(f"\n{Colors.WARNING}Appuyez sur Entrée pour retourner au menu principal...{Colors.RESET}")
+            return True  # Continue the loop
+    
+    # Floyd-Warshall travaille sur les matrices denses
+    g = creux.to_dense()
+    del creux
     
     print(f"\n{Colors.TITLE}=== Matrice initiale ==={Colors.RESET}")
     print_matrix(g.L, "L (distances initiales)")
     
     print(f"\n{Colors.TITLE}=== Exécution de Floyd-Warshall ==={Colors.RESET}")
-    print("Affichage des matrices intermédiaires à chaque étape k...\n")
+    observer = TextTraceObserver(show_initial=False)
+    if g.n > TRACE_FULL_MAX_VERTICES:
+        every = g.n // 10
+        observer = SampledObserver(observer, every=every)
+        print(f"Affichage des matrices intermédiaires toutes les {every} étapes k...\n")
+    else:
+        print("Affichage des matrices intermédiaires à chaque étape k...\n")
     
     # Exécution de Floyd-Warshall (avec affichage des matrices intermédiaires)
-    L, P, cycle_negatif = floyd_warshall(g.L, g.P, verbose=True, show_initial=False)
+    L, P, cycle_negatif = floyd_warshall(g.L, g.P, verbose=False, stop_on_cycle=True,
+                                         observer=observer)
     
     print_separator("=", 70, Colors.SEPARATOR)
     
@@ -77,6 +153,13 @@ def analyze_graph(graphs_dir="graphs"):
         print(f"\n{Colors.SUCCESS}{Colors.BOLD}✓ Aucun cycle absorbant détecté{Colors.RESET}")
         print(f"{Colors.SUCCESS}Les plus courts chemins sont bien définis.{Colors.RESET}\n")
         
+        # Proposer d'enregistrer L et P pour les prochaines sessions
+        enregistrer = input(f"{Colors.BOLD}Enregistrer le résultat pour les prochaines sessions ? (o/n) : {Colors.RESET}").strip().lower()
+        if enregistrer in ('o', 'oui', 'y', 'yes'):
+            os.makedirs(RESULTS_DIR, exist_ok=True)
+            save_results(result_path, L, P, cycle_negatif, fingerprint)
+            print(f"{Colors.SUCCESS}Résultat enregistré : {result_path}{Colors.RESET}")
+        
         # Proposer l'analyse des chemins
         ask_for_paths(L, P)
     
@@ -113,7 +196,6 @@ def visualize_graph_menu(graphs_dir="graphs"):
         return
     
     # Générer le nom du fichier de sortie basé sur le nom du fichier source
-    import os
     base_name = os.path.splitext(os.path.basename(path))[0]
     output_file = f"{base_name}_visualization.html"
     
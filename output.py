@@ -2,45 +2,121 @@
 # Fonctions d'affichage des matrices et de reconstruction des chemins
 # On affiche L et P, et on reconstruit les chemins à partir de P
 
+import io
+import sys
 from math import inf
 
-def print_matrix(M, name="M"):
+def format_value(val):
     """
-    Affiche une matrice M avec un nom.
+    Représentation textuelle d'une case de matrice : None, ∞ ou la valeur.
+    """
+    if val is None:
+        return "None"
+    if val == inf:
+        return "∞"
+    return str(val)
+
+
+def _window(bornes, n):
+    """Normalise une fenêtre (début, fin) d'indices sur [0, n] ; None = tout."""
+    if bornes is None:
+        return 0, n
+    debut, fin = bornes
+    return max(0, debut), min(n, fin)
+
+
+def iter_matrix_lines(M, name="M", columns=None, rows=None):
+    """
+    Génère ligne par ligne (chaînes terminées par "\n") l'affichage d'une matrice M.
+    Seule la ligne courante est construite : une matrice 5000 x 5000 n'est jamais
+    entièrement convertie en texte.
+
+    columns / rows : fenêtre (début, fin) d'indices à afficher, fin exclue
+    (par défaut, toutes les colonnes / lignes).
     """
     n = len(M)
-    print(f"\n{name} =")
+    c0, c1 = _window(columns, n)
+    r0, r1 = _window(rows, n)
+
+    yield f"\n{name} =\n"
     # en-tête colonnes
-    print("      ", end="")
-    for j in range(n):
-        print(f"{j:>6}", end="")
-    print()
-    print("     " + "-" * (6 * n))
-
-    for i in range(n):
-        print(f"{i:>3} |", end=" ")
-        for j in range(n):
-            val = M[i][j]
-            if val is None:
-                s = "None"
-            elif val == inf:
-                s = "∞"
-            else:
-                s = str(val)
-            print(f"{s:>6}", end="")
-        print()
+    yield "      " + "".join(f"{j:>6}" for j in range(c0, c1)) + "\n"
+    yield "     " + "-" * (6 * (c1 - c0)) + "\n"
+
+    for i in range(r0, r1):
+        cases = "".join([f"{format_value(val):>6}" for val in M[i][c0:c1]])
+        yield f"{i:>3} | {cases}\n"
+
+
+def write_matrix(M, stream=None, name="M", columns=None, rows=None, buffer_size=1 << 16):
+    """
+    Écrit l'affichage d'une matrice dans un objet fichier (sys.stdout par défaut).
+    Les lignes sont accumulées dans un tampon réutilisé, vidé tous les buffer_size
+    caractères : peu d'appels à write, et une mémoire bornée quelle que soit la taille de M.
+    """
+    _write_lines(iter_matrix_lines(M, name, columns, rows), stream, buffer_size)
+
+
+def iter_matrices_lines(L, P, step_desc="", columns=None, rows=None):
+    """
+    Génère ligne par ligne l'affichage des matrices L et P pour une étape donnée.
+    """
+    yield "\n" + "=" * 50 + "\n"
+    if step_desc:
+        yield f"Étape : {step_desc}\n"
+    yield from iter_matrix_lines(L, "L (distances)", columns, rows)
+    yield from iter_matrix_lines(P, "P (prédécesseurs)", columns, rows)
+    yield "=" * 50 + "\n\n"
+
+
+def write_matrices(L, P, stream=None, step_desc="", columns=None, rows=None, buffer_size=1 << 16):
+    """
+    Écrit l'affichage des matrices L et P dans un objet fichier (voir write_matrix).
+    """
+    _write_lines(iter_matrices_lines(L, P, step_desc, columns, rows), stream, buffer_size)
+
+
+def _write_lines(lignes, stream, buffer_size):
+    """Écrit des lignes dans stream en passant par un tampon réutilisé."""
+    if stream is None:
+        stream = sys.stdout
+    tampon = io.StringIO()
+    for ligne in lignes:
+        tampon.write(ligne)
+        if tampon.tell() >= buffer_size:
+            stream.write(tampon.getvalue())
+            tampon.seek(0)
+            tampon.truncate()
+    stream.write(tampon.getvalue())
+
+
+def format_matrix(M, name="M", columns=None, rows=None):
+    """
+    Construit en une seule chaîne l'affichage d'une matrice M avec un nom
+    (même rendu que print_matrix).
+    """
+    return "".join(iter_matrix_lines(M, name, columns, rows))
+
+
+def format_matrices(L, P, step_desc="", columns=None, rows=None):
+    """
+    Construit en une seule chaîne l'affichage des matrices L et P pour une étape donnée.
+    """
+    return "".join(iter_matrices_lines(L, P, step_desc, columns, rows))
+
+
+def print_matrix(M, name="M", columns=None, rows=None):
+    """
+    Affiche une matrice M avec un nom (éventuellement restreinte à une fenêtre).
+    """
+    write_matrix(M, sys.stdout, name, columns, rows)
 
 
 def print_matrices(L, P, step_desc=""):
     """
     Affiche les matrices L (distances) et P (prédécesseurs) pour une étape donnée.
     """
-    print("\n" + "=" * 50)
-    if step_desc:
-        print(f"Étape : {step_desc}")
-    print_matrix(L, "L (distances)")
-    print_matrix(P, "P (prédécesseurs)")
-    print("=" * 50 + "\n")
+    write_matrices(L, P, sys.stdout, step_desc)
 
 
 def reconstruct_path(P, start, end):
@@ -66,14 +142,52 @@ def reconstruct_path(P, start, end):
     return chemin
 
 
-def print_path_and_distance(L, P, start, end):
+def next_hop(S, u, v):
+    """
+    Premier sommet après u sur le plus court chemin de u à v, lu dans la matrice
+    des successeurs S (floyd_warshall(..., next_hop=True)) : une seule lecture, O(1).
+    Retourne v si u == v, None s'il n'y a pas de chemin.
+    """
+    h = S[u][v]
+    if h is None or h < 0:
+        return None
+    return int(h)
+
+
+def iter_path_forward(S, start, end):
+    """
+    Générateur : parcourt le plus court chemin de start à end dans l'ordre,
+    sommet par sommet, à partir de la matrice des successeurs S.
+    Ne produit rien s'il n'y a pas de chemin ; chaque pas coûte une lecture de S.
+    """
+    if next_hop(S, start, end) is None:
+        return
+    u = start
+    yield u
+    for _ in range(len(S)):
+        if u == end:
+            return
+        u = next_hop(S, u, end)
+        if u is None:
+            return  # cas si la chaîne des successeurs est interrompue
+        yield u
+
+
+def print_path_and_distance(L, P, start, end, paths=None):
     """
     Affiche un chemin et sa distance totale.
+    Si paths (PathTreeCache, voir path_queries.py) est fourni, le chemin y est lu.
+    """
+    path = paths.path(start, end) if paths is not None else reconstruct_path(P, start, end)
+    print_path(path, None if path is None else L[start][end], start, end)
+
+
+def print_path(path, distance, start, end):
+    """
+    Affiche un chemin déjà reconstruit (None s'il n'y en a pas) et sa distance.
     """
-    path = reconstruct_path(P, start, end)
     if path is None:
         print(f"Aucun chemin de {start} à {end}.")
     else:
-        distance = L[start][end]
         path_str = " -> ".join(str(v) for v in path)
         print(f"Chemin de {start} à {end} : {path_str} (valeur = {distance})")
@@ -0,0 +1,264 @@
+# path_queries.py
+# Requêtes de chemins en lot : distances et chemins pour de nombreuses paires (départ, arrivée)
+# Reconstruction vectorisée (NumPy) en deux passes, sans liste Python par chemin
+# Cache LRU des arbres de plus courts chemins, pour les sources interrogées souvent
+
+from array import array
+from collections import OrderedDict
+from floyd import NUMPY_AVAILABLE, to_numpy
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+
+class PathBatch:
+    """
+    Résultat d'une requête en lot, sous forme compacte :
+    - distances[t] : distance de la t-ième paire (inf s'il n'y a pas de chemin)
+    - vertices : sommets de tous les chemins, mis bout à bout
+    - offsets : le chemin t est vertices[offsets[t]:offsets[t + 1]] (vide si pas de chemin)
+
+    Les trois tableaux sont des tableaux NumPy, ou des array si NumPy est absent.
+    """
+
+    def __init__(self, distances, vertices, offsets):
+        self.distances = distances
+        self.vertices = vertices
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.distances)
+
+    def path(self, t):
+        """Chemin de la t-ième paire (tranche de vertices, sans copie avec NumPy)."""
+        return self.vertices[self.offsets[t]:self.offsets[t + 1]]
+
+
+class PathQueryEngine:
+    """
+    Répond à des requêtes de chemins en lot sur un résultat (L, P) de floyd_warshall.
+
+    L et P (listes, MatrixView ou tableaux NumPy) ne sont convertis qu'une fois,
+    à la création : on garde l'objet pour enchaîner les lots de requêtes.
+    """
+
+    def __init__(self, L, P):
+        self.n = len(L)
+        if NUMPY_AVAILABLE:
+            self.L, self.P = to_numpy(L, P)
+        else:
+            self.L, self.P = L, P
+
+    def query(self, pairs):
+        """
+        Distances et plus courts chemins pour une suite de paires (départ, arrivée),
+        ou un tableau NumPy de forme (k, 2). Retourne un PathBatch ; les chemins
+        sont les mêmes que ceux de output.reconstruct_path.
+        """
+        if NUMPY_AVAILABLE:
+            return self._query_numpy(pairs)
+        return self._query_python(pairs)
+
+    def _check(self, debut, fin):
+        if not (0 <= debut < self.n and 0 <= fin < self.n):
+            raise IndexError(f"Paire ({debut}, {fin}) hors limites (sommets de 0 à {self.n - 1}).")
+
+    def _query_numpy(self, pairs):
+        n, Pn = self.n, self.P
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        s, e = pairs[:, 0], pairs[:, 1]
+        hors = (s < 0) | (s >= n) | (e < 0) | (e >= n)
+        if hors.any():
+            t = int(np.flatnonzero(hors)[0])
+            self._check(int(s[t]), int(e[t]))
+
+        distances = self.L[s, e]
+
+        # Passe 1 : longueur de chaque chemin, en remontant P pour toutes les paires à la fois.
+        # Au plus n étapes : au-delà, P ne décrit pas un chemin (cycle absorbant).
+        longueurs = np.zeros(len(s), dtype=np.int64)
+        actives = np.flatnonzero(Pn[s, e] >= 0)
+        longueurs[actives] = 1
+        courant = e.copy()
+        for _ in range(n):
+            actives = actives[courant[actives] != s[actives]]
+            if len(actives) == 0:
+                break
+            suivant = Pn[s[actives], courant[actives]]
+            courant[actives] = suivant
+            longueurs[actives] += 1
+            casses = suivant < 0
+            if casses.any():
+                longueurs[actives[casses]] = 0
+                actives = actives[~casses]
+        else:
+            longueurs[actives] = 0
+
+        offsets = np.zeros(len(s) + 1, dtype=np.int64)
+        np.cumsum(longueurs, out=offsets[1:])
+        distances[longueurs == 0] = np.inf
+
+        # Passe 2 : écriture des sommets de la fin vers le début de chaque tranche
+        vertices = np.empty(int(offsets[-1]), dtype=np.int64)
+        actives = np.flatnonzero(longueurs)
+        position = offsets[1:][actives] - 1
+        courant = e[actives]
+        vertices[position] = courant
+        depart = s[actives]
+        while len(courant):
+            restent = courant != depart
+            courant, depart, position = courant[restent], depart[restent], position[restent] - 1
+            courant = Pn[depart, courant]
+            vertices[position] = courant
+
+        return PathBatch(distances, vertices, offsets)
+
+    def _query_python(self, pairs):
+        L, P = self.L, self.P
+        distances = array("d")
+        vertices = array("q")
+        offsets = array("q", [0])
+        pile = array("q")  # chemin à l'envers, réutilisé d'une paire à l'autre
+
+        for debut, fin in pairs:
+            self._check(debut, fin)
+            del pile[:]
+            j = fin
+            if P[debut][fin] is not None:
+                pile.append(j)
+                while j != debut and len(pile) <= self.n:
+                    j = P[debut][j]
+                    if j is None:
+                        break
+                    pile.append(j)
+            if j == debut and pile:
+                pile.reverse()
+                vertices.extend(pile)
+                distances.append(L[debut][fin])
+            else:
+                distances.append(float("inf"))
+            offsets.append(len(vertices))
+
+        return PathBatch(distances, vertices, offsets)
+
+
+# Mémoire maximale par défaut des arbres en cache (PathTreeCache)
+DEFAULT_TREE_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class _PathTree:
+    """
+    Arbre des plus courts chemins d'une source s (ligne P[s]), décomposé en chemins lourds :
+    chaque chaîne lourde est rangée de haut en bas, d'un seul tenant, dans ordre.
+    Le chemin de s à v est alors la concaténation d'au plus O(log n) tranches de ordre.
+    """
+
+    __slots__ = ("source", "parent", "ordre", "position", "tete")
+
+    def __init__(self, Ps, s):
+        n = len(Ps)
+        self.source = s
+        self.parent = array("i", (-1 if p is None else p for p in Ps))
+        parent = self.parent
+
+        enfants = [[] for _ in range(n)]
+        for v in range(n):
+            if v != s and parent[v] >= 0:
+                enfants[parent[v]].append(v)
+
+        # Parcours depuis s (les sommets non atteints n'ont pas de chemin), puis tailles des sous-arbres
+        parcours = [s]
+        for v in parcours:
+            parcours.extend(enfants[v])
+        taille = [1] * n
+        lourd = [-1] * n
+        for v in reversed(parcours):
+            if v != s:
+                taille[parent[v]] += taille[v]
+        for v in parcours:
+            if enfants[v]:
+                lourd[v] = max(enfants[v], key=taille.__getitem__)
+
+        # Chaînes lourdes : on suit le fils le plus lourd, les autres fils commencent une chaîne
+        self.ordre = array("i")
+        self.position = array("i", [-1]) * n
+        self.tete = array("i", [-1]) * n
+        pile = [s]
+        while pile:
+            tete = v = pile.pop()
+            while v >= 0:
+                self.position[v] = len(self.ordre)
+                self.ordre.append(v)
+                self.tete[v] = tete
+                pile.extend(e for e in enfants[v] if e != lourd[v])
+                v = lourd[v]
+
+    def path(self, fin):
+        """Chemin [s, ..., fin], ou None si fin n'est pas atteint depuis s."""
+        if self.position[fin] < 0:
+            return None
+        tranches = []
+        v = fin
+        while True:
+            tete = self.tete[v]
+            tranches.append(self.ordre[self.position[tete]:self.position[v] + 1])
+            if tete == self.source:
+                break
+            v = self.parent[tete]
+        chemin = []
+        for tranche in reversed(tranches):
+            chemin.extend(tranche)
+        return chemin
+
+    def nbytes(self):
+        return 4 * (len(self.parent) + len(self.ordre) + len(self.position) + len(self.tete))
+
+
+class PathTreeCache:
+    """
+    Reconstruction de chemins avec cache LRU des arbres de plus courts chemins.
+
+    Au premier chemin demandé depuis une source, toute la ligne P[source] est
+    transformée en arbre (O(n)) ; les demandes suivantes depuis cette source
+    sont des découpes de tranches, sans remonter P. Les arbres les moins
+    récemment utilisés sont oubliés au-delà de max_bytes.
+    """
+
+    def __init__(self, P, max_bytes=DEFAULT_TREE_CACHE_BYTES):
+        self.P = P
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._arbres = OrderedDict()
+        self._nbytes = 0
+
+    def path(self, start, end):
+        """Même résultat que output.reconstruct_path(P, start, end)."""
+        if self.P[start][end] is None:
+            return None
+        if start == end:
+            return [start]
+        return self.tree(start).path(end)
+
+    def tree(self, start):
+        """Arbre des plus courts chemins de start (construit au besoin)."""
+        arbre = self._arbres.get(start)
+        if arbre is not None:
+            self._arbres.move_to_end(start)
+            self.hits += 1
+            return arbre
+
+        self.misses += 1
+        arbre = _PathTree(self.P[start], start)
+        self._arbres[start] = arbre
+        self._nbytes += arbre.nbytes()
+        # On garde toujours au moins l'arbre qui vient d'être construit
+        while self._nbytes > self.max_bytes and len(self._arbres) > 1:
+            _, ancien = self._arbres.popitem(last=False)
+            self._nbytes -= ancien.nbytes()
+        return arbre
+
+
+def query_paths(L, P, pairs):
+    """Requête en lot ponctuelle (voir PathQueryEngine.query)."""
+    return PathQueryEngine(L, P).query(pairs)
@@ -0,0 +1,241 @@
+# point_to_point.py
+# Plus court chemin entre deux sommets seulement, sans calcul entre toutes les paires
+# Dijkstra bidirectionnel, ou A* avec une heuristique fournie ou des points de repère (ALT)
+
+import heapq
+from math import inf
+from output import print_path
+from sssp import adjacency_lists, bellman_ford_potentials, dijkstra, remove_loops
+
+# Méthodes de recherche disponibles pour PointToPoint.shortest_path
+METHODS = ("bidirectional", "astar")
+
+
+class PointToPoint:
+    """
+    Moteur de requêtes « de start à end » sur un graphe chargé par load_graph_from_file
+    (Graph, CompactGraph, SparseGraph ou MappedGraph ; pour un graphe dense, à créer
+    avant floyd_warshall, qui modifie L).
+
+    - landmarks : nombre de points de repère pour l'heuristique ALT de A*
+      (deux Dijkstra complets par repère à la création, puis des requêtes bien plus rapides)
+
+    Les poids négatifs sont acceptés : le graphe est alors repondéré une fois pour
+    toutes par des potentiels de Bellman-Ford (comme Johnson), ce qui rend tous les
+    poids positifs sans changer les plus courts chemins. Un cycle absorbant lève
+    une ValueError. Les chemins et distances suivent les conventions de floyd_warshall
+    (y compris pour start == end en présence d'une boucle).
+    """
+
+    def __init__(self, graph, landmarks=0):
+        self.n = graph.n
+        adj = adjacency_lists(graph)
+        self.boucles = remove_loops(adj)
+
+        # Une boucle de poids négatif est à elle seule un cycle absorbant
+        if any(w < 0 for w in self.boucles.values()):
+            raise ValueError("Cycle absorbant : les plus courts chemins ne sont pas définis.")
+
+        # Potentiels (repondération) seulement si un poids est négatif
+        self.h = None
+        if any(w < 0 for successeurs in adj for _, w in successeurs):
+            self.h = h = bellman_ford_potentials(adj)
+            if h is None:
+                raise ValueError("Cycle absorbant : les plus courts chemins ne sont pas définis.")
+            adj = [[(v, w + h[u] - h[v]) for v, w in successeurs] for u, successeurs in enumerate(adj)]
+
+        self.adj = adj
+        self.radj = [[] for _ in range(self.n)]
+        for u, successeurs in enumerate(adj):
+            for v, w in successeurs:
+                self.radj[v].append((u, w))
+
+        # Repères ALT : distances depuis (aller) et vers (retour) chaque repère
+        self.landmarks = []
+        self._depuis = []
+        self._vers = []
+        if landmarks:
+            self._choose_landmarks(landmarks)
+
+    def _choose_landmarks(self, k):
+        """
+        Repères choisis un à un le plus loin possible des précédents (sommet 0 pour commencer) :
+        des repères « en périphérie » donnent les meilleures bornes inférieures.
+        """
+        eloignement = [0] * self.n
+        r = 0
+        for _ in range(min(k, self.n)):
+            depuis, _ = dijkstra(self.adj, r)
+            vers, _ = dijkstra(self.radj, r)
+            self.landmarks.append(r)
+            self._depuis.append(depuis)
+            self._vers.append(vers)
+            for v in range(self.n):
+                d = min(depuis[v], vers[v])
+                eloignement[v] = inf if eloignement[v] == inf or d == inf else eloignement[v] + d
+            for x in self.landmarks:
+                eloignement[x] = -1
+            # Prochain repère : le plus éloigné des repères déjà choisis, parmi les sommets atteints
+            r = max(range(self.n), key=lambda v: eloignement[v] if eloignement[v] != inf else -1)
+            if eloignement[r] < 0:
+                break
+
+    def _alt_heuristic(self, end):
+        """
+        Borne inférieure ALT de la distance (repondérée) de v à end, par inégalité triangulaire :
+        d(v, end) >= d(R, end) - d(R, v) et d(v, end) >= d(v, R) - d(end, R) pour chaque repère R.
+        """
+        termes = [(depuis, depuis[end], vers, vers[end])
+                  for depuis, vers in zip(self._depuis, self._vers)]
+
+        def heuristique(v):
+            borne = 0
+            for depuis, depuis_end, vers, vers_end in termes:
+                if depuis_end != inf and depuis[v] != inf and depuis_end - depuis[v] > borne:
+                    borne = depuis_end - depuis[v]
+                if vers[v] != inf and vers_end != inf and vers[v] - vers_end > borne:
+                    borne = vers[v] - vers_end
+            return borne
+
+        return heuristique
+
+    def shortest_path(self, start, end, method="bidirectional", heuristic=None):
+        """
+        Plus court chemin de start à end.
+
+        - method : "bidirectional" (Dijkstra depuis les deux extrémités) ou "astar"
+        - heuristic : pour A*, fonction heuristic(v, end) donnant une borne inférieure
+          cohérente de la distance de v à end ; par défaut, l'heuristique ALT
+          si des repères ont été calculés, sinon 0 (A* revient alors à Dijkstra)
+
+        Retourne (chemin, distance) : chemin = [start, ..., end], ou None (distance inf)
+        s'il n'y a pas de chemin.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Méthode inconnue : {method!r} (choix possibles : {', '.join(METHODS)}).")
+        if not (0 <= start < self.n and 0 <= end < self.n):
+            raise IndexError(f"Sommet hors limites (sommets de 0 à {self.n - 1}).")
+
+        if start == end:
+            return self._closed_walk(start)
+
+        if method == "astar":
+            if heuristic is not None:
+                h = self.h
+                if h is None:
+                    estimation = lambda v: heuristic(v, end)
+                else:
+                    # Borne sur le graphe d'origine -> borne sur le graphe repondéré
+                    estimation = lambda v: heuristic(v, end) + h[v] - h[end]
+            elif self.landmarks:
+                estimation = self._alt_heuristic(end)
+            else:
+                estimation = None
+            chemin, distance = self._astar(start, end, estimation)
+        else:
+            chemin, distance = self._bidirectional(start, end)
+
+        if chemin is None:
+            return None, inf
+        if self.h is not None:
+            distance = distance - self.h[start] + self.h[end]
+        return chemin, distance
+
+    def print_path_and_distance(self, start, end, **options):
+        """Affiche le chemin et sa distance, au même format que output.print_path_and_distance."""
+        chemin, distance = self.shortest_path(start, end, **options)
+        print_path(chemin, distance, start, end)
+
+    def _closed_walk(self, s):
+        """
+        start == end : chemin [s] ; la distance suit la règle de Floyd-Warshall,
+        0 sans boucle, sinon min(poids de la boucle, plus court circuit passant par s).
+        """
+        if s not in self.boucles:
+            return [s], 0
+        # Sur un circuit, les potentiels de la repondération s'annulent
+        distance = self.boucles[s]
+        dist, _ = dijkstra(self.adj, s)
+        for x, w in self.radj[s]:
+            if dist[x] + w < distance:
+                distance = dist[x] + w
+        return [s], distance
+
+    def _bidirectional(self, s, t):
+        """
+        Dijkstra bidirectionnel : on avance alternativement depuis s (arcs sortants)
+        et depuis t (arcs entrants), et on s'arrête dès que la somme des deux
+        sommets de tas dépasse le meilleur chemin déjà trouvé (mu).
+        Seuls les sommets explorés sont stockés (dictionnaires) : aucune
+        initialisation en O(n) par requête.
+        """
+        dist = ({s: 0}, {t: 0})
+        pred = ({s: None}, {t: None})
+        tas = ([(0, s)], [(0, t)])
+        voisins = (self.adj, self.radj)
+        mu = inf
+        rencontre = None
+
+        while tas[0] and tas[1]:
+            if tas[0][0][0] + tas[1][0][0] >= mu:
+                break
+            # On avance du côté dont le tas est le moins profond
+            cote = 0 if tas[0][0][0] <= tas[1][0][0] else 1
+            d, u = heapq.heappop(tas[cote])
+            dist_c, pred_c = dist[cote], pred[cote]
+            if d > dist_c[u]:
+                continue  # entrée périmée
+            dist_autre = dist[1 - cote]
+            for v, w in voisins[cote][u]:
+                nd = d + w
+                if nd < dist_c.get(v, inf):
+                    dist_c[v] = nd
+                    pred_c[v] = u
+                    heapq.heappush(tas[cote], (nd, v))
+                if v in dist_autre and nd + dist_autre[v] < mu:
+                    mu = nd + dist_autre[v]
+                    rencontre = v
+
+        if rencontre is None:
+            return None, inf
+
+        # s ~> rencontre (prédécesseurs avant), puis rencontre ~> t (successeurs arrière)
+        chemin = []
+        v = rencontre
+        while v is not None:
+            chemin.append(v)
+            v = pred[0][v]
+        chemin.reverse()
+        v = pred[1][rencontre]
+        while v is not None:
+            chemin.append(v)
+            v = pred[1][v]
+        return chemin, mu
+
+    def _astar(self, s, t, estimation):
+        """A* depuis s : avec une heuristique cohérente, t est définitif dès qu'il sort du tas."""
+        dist = {s: 0}
+        pred = {s: None}
+        tas = [(estimation(s) if estimation else 0, 0, s)]
+        fermes = set()
+
+        while tas:
+            _, d, u = heapq.heappop(tas)
+            if u == t:
+                chemin = []
+                while u is not None:
+                    chemin.append(u)
+                    u = pred[u]
+                chemin.reverse()
+                return chemin, d
+            if u in fermes or d > dist[u]:
+                continue
+            fermes.add(u)
+            for v, w in self.adj[u]:
+                nd = d + w
+                if nd < dist.get(v, inf):
+                    dist[v] = nd
+                    pred[v] = u
+                    heapq.heappush(tas, (nd + (estimation(v) if estimation else 0), nd, v))
+
+        return None, inf
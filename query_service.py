@@ -0,0 +1,168 @@
+# query_service.py
+# Service de requêtes non interactif : le graphe est chargé et résolu une seule fois,
+# puis les requêtes JSON (une par ligne) sont lues sur l'entrée standard et les réponses
+# écrites sur la sortie standard, par lots (mémoire bornée par la taille d'un lot)
+#
+# Usage : python query_service.py graphs/g14_application.txt [--batch-size 4096] [--no-path]
+# Requête : {"from": 0, "to": 9}  (un champ "id" éventuel est recopié dans la réponse)
+# Réponse : {"from": 0, "to": 9, "distance": 14, "path": [0, 1, 3, 4, 9]}
+#           (distance et path valent null s'il n'y a pas de chemin)
+
+import argparse
+import io
+import json
+import os
+import sys
+from itertools import islice
+from loader import load_graph_from_file
+from floyd import floyd_warshall, ENGINES, NUMPY_AVAILABLE
+from graph import CompactGraph
+from path_queries import PathQueryEngine
+from result_file import graph_fingerprint
+from result_cache import ResultCache
+
+# Nombre de requêtes traitées (et de réponses écrites) d'un seul tenant
+DEFAULT_BATCH_SIZE = 4096
+# Taille maximale d'une lecture sur l'entrée standard
+READ_SIZE = 1 << 16
+
+
+def solve_graph(path, engine, use_cache=True):
+    """
+    Charge et résout le graphe une fois pour toutes (ou relit le résultat en cache).
+    Retourne (L, P, cycle_negatif, saved) ; saved est le résultat en cache à fermer, ou None.
+    """
+    g = load_graph_from_file(path, CompactGraph)
+    cache = ResultCache() if use_cache else None
+    # Empreinte prise avant Floyd-Warshall, qui modifie g.L et g.P sur place
+    fingerprint = graph_fingerprint(g) if cache else None
+    saved = cache.get(fingerprint) if cache else None
+    if saved is not None:
+        return saved.L, saved.P, saved.cycle_negatif, saved
+
+    L, P, cycle_negatif = floyd_warshall(g.L, g.P, verbose=False, engine=engine, stop_on_cycle=True)
+    if cache and not cycle_negatif:
+        cache.put(fingerprint, L, P, cycle_negatif)
+    return L, P, cycle_negatif, None
+
+
+def _is_vertex(x, n):
+    """Numéro de sommet valide ; les booléens JSON (sous-classe de int) sont refusés."""
+    return isinstance(x, int) and not isinstance(x, bool) and 0 <= x < n
+
+
+def answer_batch(lignes, engine, n, with_path=True, cycle_negatif=False):
+    """
+    Réponses (lignes JSON) à un lot de requêtes, dans l'ordre des requêtes.
+    Les paires valides sont résolues ensemble (PathQueryEngine.query) ;
+    une requête mal formée reçoit une réponse {"error": ...} sans interrompre le lot.
+    """
+    requetes = []
+    reponses = []
+    for ligne in lignes:
+        ligne = ligne.strip()
+        if not ligne:
+            continue
+        try:
+            requete = json.loads(ligne)
+            depart, arrivee = requete["from"], requete["to"]
+            if not (_is_vertex(depart, n) and _is_vertex(arrivee, n)):
+                raise ValueError(f"sommets attendus entre 0 et {n - 1}")
+        except (ValueError, KeyError, TypeError) as e:
+            reponses.append({"error": f"Requête invalide : {e}"})
+            continue
+        reponse = {"from": depart, "to": arrivee}
+        if isinstance(requete, dict) and "id" in requete:
+            reponse["id"] = requete["id"]
+        if cycle_negatif:
+            reponse["error"] = "Cycle absorbant : les plus courts chemins ne sont pas définis."
+        else:
+            requetes.append(len(reponses))
+        reponses.append(reponse)
+
+    if requetes:
+        lot = engine.query([(reponses[i]["from"], reponses[i]["to"]) for i in requetes])
+        for t, i in enumerate(requetes):
+            distance = float(lot.distances[t])
+            if distance == float("inf"):
+                reponses[i]["distance"] = None
+                if with_path:
+                    reponses[i]["path"] = None
+            else:
+                reponses[i]["distance"] = int(distance) if distance.is_integer() else distance
+                if with_path:
+                    reponses[i]["path"] = [int(v) for v in lot.path(t)]
+
+    return [json.dumps(r, ensure_ascii=False) for r in reponses]
+
+
+def read_batches(stdin, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Lots d'au plus batch_size lignes lues sur stdin. Un lot part dès que l'entrée
+    déjà disponible est épuisée, sans attendre qu'il soit plein : un client qui
+    attend la réponse à sa requête avant d'envoyer la suivante n'est pas bloqué.
+    """
+    try:
+        fd = stdin.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # Flux en mémoire (StringIO...) : tout est déjà disponible
+        while True:
+            lignes = list(islice(stdin, batch_size))
+            if not lignes:
+                return
+            yield lignes
+
+    reste = b""
+    while True:
+        # os.read rend ce qui est disponible ; il ne bloque que si rien ne l'est
+        donnees = os.read(fd, READ_SIZE)
+        if not donnees:
+            if reste.strip():
+                yield [reste.decode("utf-8", errors="replace")]
+            return
+        lignes = (reste + donnees).split(b"\n")
+        reste = lignes.pop()  # ligne incomplète : complétée par la lecture suivante
+        for debut in range(0, len(lignes), batch_size):
+            yield [ligne.decode("utf-8", errors="replace") for ligne in lignes[debut:debut + batch_size]]
+
+
+def serve(path, stdin, stdout, batch_size=DEFAULT_BATCH_SIZE, with_path=True,
+          engine="numpy" if NUMPY_AVAILABLE else "python", use_cache=True):
+    """Résout le graphe puis répond aux requêtes de stdin jusqu'à la fin de l'entrée."""
+    L, P, cycle_negatif, saved = solve_graph(path, engine, use_cache)
+    requetes = PathQueryEngine(L, P)
+    try:
+        for lignes in read_batches(stdin, batch_size):
+            reponses = answer_batch(lignes, requetes, len(L), with_path, cycle_negatif)
+            if reponses:
+                stdout.write("\n".join(reponses) + "\n")
+            # Chaque lot est transmis dès qu'il est prêt
+            stdout.flush()
+    finally:
+        if saved is not None:
+            # Les vues sur la projection disparaissent avant sa fermeture
+            del L, P, requetes
+            saved.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Service de requêtes de plus courts chemins (JSON lines).")
+    parser.add_argument("graph", help="fichier de graphe (texte ou binaire)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="nombre de requêtes traitées par lot")
+    parser.add_argument("--no-path", action="store_true", help="distances seulement")
+    parser.add_argument("--engine", choices=ENGINES,
+                        default="numpy" if NUMPY_AVAILABLE else "python",
+                        help="moteur de Floyd-Warshall")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="ne pas consulter le cache de résultats")
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size doit être un entier strictement positif")
+
+    serve(args.graph, sys.stdin, sys.stdout, args.batch_size, not args.no_path,
+          args.engine, not args.no_cache)
+
+
+if __name__ == "__main__":
+    main()
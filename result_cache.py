@@ -0,0 +1,92 @@
+# result_cache.py
+# Cache des résultats de Floyd-Warshall, indexé par l'empreinte du graphe chargé
+# Un fichier de résultat (voir result_file.py) par graphe, éviction LRU par taille totale
+
+import os
+from result_file import save_results, open_results, RESULT_EXTENSION
+
+# Dossier et taille maximale par défaut du cache
+DEFAULT_CACHE_DIR = ".fwcache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class ResultCache:
+    """
+    Cache disque des matrices L et P, indexé par graph_fingerprint(graph).
+
+    La clé dépend du graphe lu, pas du fichier ni de sa date de modification :
+    un fichier réécrit à l'identique reste en cache, un graphe modifié non.
+    La date de modification des entrées sert d'horodatage LRU : elle est mise
+    à jour à chaque lecture, et les entrées les plus anciennes sont supprimées
+    dès que la taille totale dépasse max_bytes.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, fingerprint):
+        return os.path.join(self.directory, fingerprint + RESULT_EXTENSION)
+
+    def get(self, fingerprint):
+        """
+        Renvoie le résultat enregistré (SavedResults, à fermer après usage)
+        ou None s'il n'est pas en cache.
+        """
+        path = self._path(fingerprint)
+        try:
+            saved = open_results(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if saved.fingerprint != fingerprint:
+            saved.close()
+            self.misses += 1
+            return None
+
+        os.utime(path)  # entrée la plus récemment utilisée
+        self.hits += 1
+        return saved
+
+    def put(self, fingerprint, L, P, cycle_negatif):
+        """Enregistre un résultat, puis libère de la place si nécessaire."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(fingerprint)
+        # Écriture dans un fichier temporaire : une entrée n'est jamais lue à moitié écrite
+        # (nom propre au processus : plusieurs processus peuvent calculer le même graphe)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        save_results(tmp, L, P, cycle_negatif, fingerprint)
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes."""
+        entrees = []
+        for nom in os.listdir(self.directory):
+            if nom.endswith(RESULT_EXTENSION):
+                try:
+                    st = os.stat(os.path.join(self.directory, nom))
+                except OSError:
+                    continue  # entrée supprimée entre-temps par un autre processus
+                entrees.append((st.st_mtime, st.st_size, nom))
+
+        total = sum(taille for _, taille, _ in entrees)
+        for _, taille, nom in sorted(entrees):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, nom))
+            except OSError:
+                continue  # entrée encore ouverte (Windows) : on la garde
+            total -= taille
+
+    def summary(self):
+        """Bilan des accès, pour les résumés de fin d'exécution."""
+        return cache_summary(self.hits, self.misses)
+
+
+def cache_summary(hits, misses):
+    """Ligne de bilan du cache (les compteurs peuvent venir de plusieurs processus)."""
+    return f"Cache : {hits} succès, {misses} échec(s)"
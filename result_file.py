@@ -0,0 +1,117 @@
+# result_file.py
+# Sauvegarde des matrices L et P calculées, et réouverture par projection mémoire (mmap)
+# Permet de répondre aux demandes de chemins sans relancer Floyd-Warshall (O(n³))
+
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from graph import MatrixView, NO_PREDECESSOR
+from graph_binary import mapped_column
+
+# Signature en tête de fichier et extension conseillée
+RESULT_MAGIC = b"FWRESLT1"
+RESULT_EXTENSION = ".fwr"
+
+# En-tête (petit-boutiste) : signature, n, cycle absorbant, empreinte SHA-256 du graphe.
+# Bourrage jusqu'à 64 octets : L (float64) puis P (int32) suivent, alignées.
+_ENTETE = struct.Struct("<8sq?7x32s8x")
+
+
+def graph_fingerprint(graph):
+    """
+    Empreinte (SHA-256, en hexadécimal) du graphe chargé : n et l'ensemble des arcs.
+
+    Elle ne dépend ni du fichier (commentaires, ordre des lignes, format texte
+    ou binaire) ni de la classe de graphe utilisée : deux graphes identiques
+    ont la même empreinte. Les boucles de poids 0 sont ignorées (sans effet).
+    """
+    arcs = sorted(
+        (u, v, int(w) if float(w).is_integer() else w)
+        for u, v, w in graph.arcs()
+        if u != v or w != 0
+    )
+    h = hashlib.sha256(f"n={graph.n}\n".encode("ascii"))
+    for debut in range(0, len(arcs), 1 << 16):
+        lignes = "".join(f"{u} {v} {w}\n" for u, v, w in arcs[debut:debut + (1 << 16)])
+        h.update(lignes.encode("ascii"))
+    return h.hexdigest()
+
+
+def save_results(path, L, P, cycle_negatif, fingerprint=""):
+    """
+    Enregistre L, P, l'indicateur de cycle absorbant et l'empreinte du graphe.
+
+    L et P peuvent être des listes de listes, des MatrixView ou des tableaux NumPy ;
+    l'écriture se fait ligne par ligne, sans copie complète des matrices.
+    """
+    n = len(L)
+    empreinte = bytes.fromhex(fingerprint) if fingerprint else bytes(32)
+    with open(path, "wb") as f:
+        f.write(_ENTETE.pack(RESULT_MAGIC, n, bool(cycle_negatif), empreinte))
+        for ligne in L:
+            _write_row(f, array("d", ligne))
+        for ligne in P:
+            _write_row(f, array("i", [NO_PREDECESSOR if p is None else p for p in ligne]))
+
+
+def _write_row(f, ligne):
+    """Écrit une ligne de matrice en petit-boutiste."""
+    if sys.byteorder != "little":
+        ligne.byteswap()
+    ligne.tofile(f)
+
+
+class SavedResults:
+    """
+    Résultat enregistré, rouvert par projection mémoire.
+
+    L et P sont des MatrixView (lecture seule) sur le fichier : elles s'utilisent
+    comme les matrices de floyd_warshall (ask_for_paths, reconstruct_path...),
+    et seules les lignes consultées sont effectivement lues sur le disque.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            entete = f.read(_ENTETE.size)
+            if len(entete) < _ENTETE.size:
+                raise ValueError("Fichier de résultat trop court.")
+            magic, n, cycle, empreinte = _ENTETE.unpack(entete)
+            if magic != RESULT_MAGIC or n < 0:
+                raise ValueError("Fichier de résultat mal formé.")
+            f.seek(0, 2)
+            if f.tell() < _ENTETE.size + 12 * n * n:
+                raise ValueError("Fichier de résultat tronqué.")
+
+            self.n = n
+            self.cycle_negatif = cycle
+            self.fingerprint = empreinte.hex() if any(empreinte) else ""
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        debut = _ENTETE.size
+        self.L = MatrixView(mapped_column(self._mmap, debut, n * n, "d"), n)
+        self.P = MatrixView(mapped_column(self._mmap, debut + 8 * n * n, n * n, "i"), n,
+                            none_value=NO_PREDECESSOR)
+
+    def matches(self, graph):
+        """True si le résultat a été calculé pour ce graphe (même empreinte)."""
+        return self.n == graph.n and self.fingerprint == graph_fingerprint(graph)
+
+    def close(self):
+        """
+        Libère la projection mémoire (L et P ne sont plus utilisables ensuite).
+        Si des vues sur L ou P existent encore ailleurs, la projection sera
+        libérée avec la dernière d'entre elles.
+        """
+        self.L = self.P = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+def open_results(path):
+    """Rouvre un fichier écrit par save_results (voir SavedResults)."""
+    return SavedResults(path)
+
@@ -1,32 +1,102 @@
 # run_all_tests.py
+# Options :
+#   --cache : réutilise le cache de résultats (les graphes déjà résolus n'ont alors
+#             que leurs matrices finales dans la trace, sans les étapes k)
+#   --workers N : répartit les graphes entre N processus
+#   --timeout S : abandonne un graphe au-delà de S secondes (le lot continue)
 
+import argparse
+import io
 import os
+from functools import partial
 from loader import load_graph_from_file
+from graph_binary import BINARY_EXTENSION
 from floyd import floyd_warshall
+from tracing import TextTraceObserver
+from output import write_matrices
+from result_file import graph_fingerprint
+from result_cache import ResultCache, cache_summary
+from batch_runner import run_batch
+from interface import extract_number
 
 TEST_DIR = "graphs"
 
-files = sorted(
-    [f for f in os.listdir(TEST_DIR) if f.endswith(".txt")],
-    key=lambda x: int(''.join(filter(str.isdigit, x)))
-)
 
-with open("traces_execution.txt", "w", encoding="utf-8") as out:
-    for f in files:
-        path = os.path.join(TEST_DIR, f)
-        out.write(f"\n===== TEST {f} =====\n")
+def trace_graph_file(path, use_cache=False):
+    """
+    Charge et résout un graphe ; la trace est écrite dans un tampon propre à l'appel.
+    Retourne (trace, cached) ; cached vaut None si le cache n'a pas été consulté.
+    """
+    out = io.StringIO()
+    try:
+        g = load_graph_from_file(path)
+    except Exception as e:
+        out.write(f"X Erreur chargement : {e}\n")
+        return out.getvalue(), None
 
-        try:
-            g = load_graph_from_file(path)
-        except Exception as e:
-            out.write(f"X Erreur chargement : {e}\n")
-            continue
+    # Cache des résultats sans cycle absorbant, indexé par l'empreinte du graphe
+    cache = ResultCache() if use_cache else None
+    # Empreinte prise avant Floyd-Warshall, qui modifie g.L et g.P sur place
+    fingerprint = graph_fingerprint(g) if cache else None
+    saved = cache.get(fingerprint) if cache else None
 
-        L, P, cycle = floyd_warshall(g.L, g.P, verbose=True)
+    if saved is not None:
+        # Graphe inchangé : seules les matrices finales sont écrites
+        write_matrices(saved.L, saved.P, out, "Résultat en cache (trace non recalculée)")
+        cycle = saved.cycle_negatif
+        saved.close()
+    else:
+        # La trace complète de l'algorithme est écrite étape par étape
+        L, P, cycle = floyd_warshall(g.L, g.P, verbose=False, observer=TextTraceObserver(out))
+        if cache and not cycle:
+            cache.put(fingerprint, L, P, cycle)
 
-        if cycle:
-            out.write("ATTENTION Cycle négatif détecté\n")
-        else:
-            out.write("PARFAIT ! Aucun cycle négatif\n")
+    if cycle:
+        out.write("ATTENTION Cycle négatif détecté\n")
+    else:
+        out.write("PARFAIT ! Aucun cycle négatif\n")
+    return out.getvalue(), None if cache is None else saved is not None
 
-print("PARFAIT ! Tests terminés — traces dans traces_execution.txt")
+
+def main():
+    parser = argparse.ArgumentParser(description="Exécute Floyd-Warshall sur tous les graphes de test.")
+    parser.add_argument("--cache", action="store_true",
+                        help="réutilise le cache de résultats (trace réduite aux matrices finales "
+                             "pour les graphes déjà résolus)")
+    parser.add_argument("--workers", type=int, default=1, help="nombre de processus")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="durée maximale par graphe, en secondes")
+    args = parser.parse_args()
+
+    files = sorted(
+        [f for f in os.listdir(TEST_DIR) if f.endswith((".txt", BINARY_EXTENSION))],
+        key=extract_number
+    )
+    paths = [os.path.join(TEST_DIR, f) for f in files]
+    job = partial(trace_graph_file, use_cache=args.cache)
+
+    if args.workers > 1 or args.timeout is not None:
+        outcomes = run_batch(paths, job, args.workers, args.timeout)
+    else:
+        outcomes = [(True, job(path)) for path in paths]
+
+    # Les traces sont réunies dans l'ordre numérique des fichiers
+    hits = misses = 0
+    with open("traces_execution.txt", "w", encoding="utf-8") as out:
+        for f, (ok, value) in zip(files, outcomes):
+            out.write(f"\n===== TEST {f} =====\n")
+            if not ok:
+                out.write(f"X Erreur : {value}\n")
+                continue
+            trace, cached = value
+            out.write(trace)
+            hits += cached is True
+            misses += cached is False
+
+    if args.cache:
+        print(cache_summary(hits, misses))
+    print("PARFAIT ! Tests terminés — traces dans traces_execution.txt")
+
+
+if __name__ == "__main__":
+    main()
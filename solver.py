@@ -0,0 +1,107 @@
+# solver.py
+# Choix automatique de l'algorithme de plus courts chemins entre toutes les paires
+# Floyd-Warshall (O(n³)) pour les graphes denses, Johnson (O(n·m·log n)) pour les graphes creux
+
+from math import inf, log2
+from floyd import floyd_warshall
+from johnson import johnson
+from sssp import adjacency_lists, dijkstra, spfa, remove_loops, incoming_arcs, apply_loop_rule
+
+ALGORITHMS = ("auto", "floyd", "johnson")
+
+def choose_algorithm(n, m):
+    """
+    Choisit l'algorithme le plus adapté à un graphe de n sommets et m arcs.
+    Johnson coûte environ n·m·log n contre n³ pour Floyd-Warshall :
+    on le retient dès que m·log n est nettement inférieur à n² (m << n²).
+    """
+    if n == 0:
+        return "floyd"
+    return "johnson" if m * max(1.0, log2(n)) * 4 < n * n else "floyd"
+
+
+def all_pairs_shortest_paths(graph, algorithm="auto", verbose=False, **options):
+    """
+    Calcule les plus courts chemins entre toutes les paires de sommets de graph.
+
+    Paramètres :
+    - graph : Graph, CompactGraph ou SparseGraph
+    - algorithm : "floyd", "johnson" ou "auto" (choix selon la densité du graphe)
+    - verbose : affichage détaillé (matrices à chaque étape pour Floyd-Warshall)
+    - options : paramètres supplémentaires transmis à floyd_warshall (engine, show_initial...)
+
+    Retourne (L, P, cycle_negatif), comme floyd_warshall.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algorithme inconnu : {algorithm!r} (choix possibles : {', '.join(ALGORITHMS)}).")
+
+    if algorithm == "auto":
+        algorithm = choose_algorithm(graph.n, graph.arc_count())
+
+    if algorithm == "johnson":
+        return johnson(graph, verbose=verbose)
+
+    return floyd_warshall(graph.L, graph.P, verbose=verbose, **options)
+
+
+def shortest_paths_from(graph, sources, verbose=False):
+    """
+    Plus courts chemins depuis quelques sources seulement, sans calcul entre toutes les paires.
+
+    Dijkstra (tas binaire) depuis chaque source si tous les poids sont positifs ou nuls,
+    SPFA sinon : le coût est proportionnel au nombre de sources, pas à n.
+
+    Retourne (L, P, cycle_negatif), où L et P sont des dictionnaires {source: ligne} :
+    L[s][v] et P[s][v] ont le même sens que dans les matrices de floyd_warshall,
+    ce qui permet d'utiliser directement reconstruct_path(P, s, v).
+    cycle_negatif vaut True si un cycle absorbant est accessible depuis une source ;
+    L et P contiennent alors les lignes initiales (arcs directs), comme johnson.
+    """
+    n = graph.n
+    sources = list(dict.fromkeys(sources))  # sans doublons, dans l'ordre
+    for s in sources:
+        if not 0 <= s < n:
+            raise IndexError(f"Source {s} hors limites (sommets de 0 à {n - 1}).")
+
+    adj = adjacency_lists(graph)
+    boucles = remove_loops(adj)
+    entrants = incoming_arcs(adj, boucles)
+    positifs = all(w >= 0 for successeurs in adj for _, w in successeurs)
+
+    L, P = {}, {}
+    for s in sources:
+        if positifs:
+            dist, pred = dijkstra(adj, s)
+        else:
+            dist, pred, cycle = spfa(adj, s)
+            if cycle is not None:
+                return _initial_rows(adj, boucles, sources, verbose)
+
+        # Une boucle négative accessible depuis s est à elle seule un cycle absorbant
+        if any(w < 0 and dist[u] != inf for u, w in boucles.items()):
+            return _initial_rows(adj, boucles, sources, verbose)
+
+        if s in boucles:
+            apply_loop_rule(dist, pred, s, boucles[s], entrants[s])
+        L[s] = dist
+        P[s] = pred
+
+    if verbose:
+        print("Aucun cycle absorbant accessible depuis les sources.")
+    return L, P, False
+
+
+def _initial_rows(adj, boucles, sources, verbose):
+    """Lignes initiales (arcs directs) des sources, renvoyées en cas de cycle absorbant."""
+    if verbose:
+        print("!  Cycle absorbant détecté (cycle de poids négatif).")
+    n = len(adj)
+    L, P = {}, {}
+    for s in sources:
+        dist = [inf] * n
+        pred = [None] * n
+        dist[s], pred[s] = boucles.get(s, 0), s
+        for v, w in adj[s]:
+            dist[v], pred[v] = w, s
+        L[s], P[s] = dist, pred
+    return L, P, True
@@ -0,0 +1,227 @@
+# sssp.py
+# Plus courts chemins depuis une source (single-source shortest paths)
+# Bellman-Ford (poids quelconques) et Dijkstra avec tas binaire (poids >= 0 ou repondérés)
+
+import heapq
+from collections import deque
+from math import inf
+
+def adjacency_lists(graph):
+    """
+    Construit les listes de successeurs adj[u] = [(v, w), ...] d'un graphe
+    (Graph, CompactGraph ou SparseGraph). Pour un graphe dense, il faut l'appeler
+    avant que floyd_warshall ne modifie L.
+    """
+    return [list(graph.neighbors(u)) for u in range(graph.n)]
+
+
+def remove_loops(adj):
+    """
+    Retire les boucles u -> u des listes de successeurs (sur place) :
+    elles ne servent pas aux recherches de chemins, mais comptent pour L[u][u].
+    Retourne le dictionnaire {u: poids de la boucle}.
+    """
+    boucles = {}
+    for u, successeurs in enumerate(adj):
+        for v, w in successeurs:
+            if v == u:
+                boucles[u] = w
+        if u in boucles:
+            adj[u] = [(v, w) for v, w in successeurs if v != u]
+    return boucles
+
+
+def incoming_arcs(adj, cibles):
+    """Arcs entrants {v: [(x, w), ...]} des sommets v de cibles."""
+    entrants = {v: [] for v in cibles}
+    if entrants:
+        for x, successeurs in enumerate(adj):
+            for v, w in successeurs:
+                if v in entrants:
+                    entrants[v].append((x, w))
+    return entrants
+
+
+def apply_loop_rule(dist, pred, s, boucle, entrants):
+    """
+    Même règle que Floyd-Warshall pour une source s qui porte une boucle :
+    dist[s] = min(poids de la boucle, plus court circuit passant par s),
+    pred[s] = dernier sommet du circuit (s si la boucle est la plus courte).
+    """
+    dist[s] = boucle
+    for x, w in entrants:
+        if dist[x] + w < dist[s]:
+            dist[s] = dist[x] + w
+            pred[s] = x
+
+
+def bellman_ford_potentials(adj):
+    """
+    Bellman-Ford depuis une source virtuelle reliée à tous les sommets par un arc de poids 0.
+
+    Retourne la liste h des potentiels (h[v] = distance depuis la source virtuelle),
+    qui vérifie h[v] <= h[u] + w pour tout arc u -> v,
+    ou None si le graphe contient un cycle absorbant.
+    """
+    h, _, cycle = _spfa_virtual_source(adj)
+    return None if cycle is not None else h
+
+
+def find_negative_cycle(adj):
+    """
+    Recherche rapide d'un cycle absorbant (SPFA depuis une source virtuelle), en O(n·m)
+    au pire et souvent bien moins : on s'arrête dès qu'un cycle apparaît.
+
+    Retourne la liste des sommets du cycle [v0, v1, ..., vk]
+    (arcs v0 -> v1 -> ... -> vk -> v0), ou None s'il n'y a pas de cycle absorbant.
+    """
+    return _spfa_virtual_source(adj)[2]
+
+
+def _spfa_virtual_source(adj):
+    """
+    SPFA (Bellman-Ford avec file) depuis une source virtuelle reliée à tous les sommets.
+
+    Tous les n relâchements, on cherche un circuit dans le graphe des prédécesseurs :
+    un tel circuit est forcément un cycle absorbant, ce qui permet de s'arrêter
+    bien avant les n passes de Bellman-Ford.
+
+    Retourne (h, pred, cycle) ; cycle vaut None s'il n'y a pas de cycle absorbant.
+    """
+    n = len(adj)
+    h = [0] * n
+    pred = [None] * n
+
+    # Tous les sommets sont à distance 0 de la source virtuelle : ils sont tous à traiter
+    file = deque(range(n))
+    dans_file = [True] * n
+    relachements = 0
+
+    while file:
+        u = file.popleft()
+        dans_file[u] = False
+        hu = h[u]
+        for v, w in adj[u]:
+            if hu + w < h[v]:
+                h[v] = hu + w
+                pred[v] = u
+                relachements += 1
+                if relachements % n == 0:
+                    cycle = _cycle_in_predecessors(pred, v)
+                    if cycle is not None:
+                        return h, pred, cycle
+                if not dans_file[v]:
+                    file.append(v)
+                    dans_file[v] = True
+
+    return h, pred, None
+
+
+def spfa(adj, source):
+    """
+    SPFA (Bellman-Ford avec file) depuis une seule source, pour des poids quelconques.
+
+    Retourne (dist, pred, cycle), comme dijkstra pour dist et pred ; cycle donne
+    les sommets d'un cycle absorbant accessible depuis source (None s'il n'y en a pas,
+    et dist n'a alors de sens que dans ce cas).
+    """
+    n = len(adj)
+    dist = [inf] * n
+    pred = [None] * n
+    dist[source] = 0
+
+    file = deque([source])
+    dans_file = [False] * n
+    dans_file[source] = True
+    relachements = 0
+
+    while file:
+        u = file.popleft()
+        dans_file[u] = False
+        du = dist[u]
+        for v, w in adj[u]:
+            if du + w < dist[v]:
+                dist[v] = du + w
+                pred[v] = u
+                relachements += 1
+                if relachements % n == 0:
+                    cycle = _cycle_in_predecessors(pred, v)
+                    if cycle is not None:
+                        return dist, pred, cycle
+                if not dans_file[v]:
+                    file.append(v)
+                    dans_file[v] = True
+
+    # pred[source] reste None pendant le calcul : sinon il formerait un faux circuit
+    pred[source] = source
+    return dist, pred, None
+
+
+def _cycle_in_predecessors(pred, debut=None):
+    """
+    Cherche un circuit dans le graphe des prédécesseurs (pred[v] -> v).
+    Si debut est fourni, on regarde d'abord la chaîne qui part de ce sommet.
+    Retourne les sommets du circuit dans le sens des arcs, ou None.
+    """
+    n = len(pred)
+    # etat : 0 = non visité, 1 = sur la chaîne courante, 2 = déjà traité
+    etat = [0] * n
+    departs = range(n) if debut is None else [debut] + list(range(n))
+
+    for depart in departs:
+        if etat[depart]:
+            continue
+        chaine = []
+        v = depart
+        while v is not None and etat[v] == 0:
+            etat[v] = 1
+            chaine.append(v)
+            v = pred[v]
+        if v is not None and etat[v] == 1:
+            # On est revenu sur la chaîne courante : circuit trouvé
+            cycle = chaine[chaine.index(v):]
+            cycle.reverse()
+            return cycle
+        for x in chaine:
+            etat[x] = 2
+
+    return None
+
+
+def dijkstra(adj, source, potentials=None):
+    """
+    Algorithme de Dijkstra avec un tas binaire (heapq).
+
+    Si potentials (h) est fourni, on travaille sur les poids repondérés
+    w + h[u] - h[v] (tous >= 0) et on restitue les vraies distances à la fin.
+
+    Retourne (dist, pred) :
+    - dist[v] : distance de source à v (inf si v est inaccessible)
+    - pred[v] : prédécesseur de v sur un plus court chemin (None si inaccessible),
+      avec pred[source] = source
+    """
+    n = len(adj)
+    h = potentials
+    dist = [inf] * n
+    pred = [None] * n
+    dist[source] = 0
+    pred[source] = source
+
+    tas = [(0, source)]
+    while tas:
+        d, u = heapq.heappop(tas)
+        if d > dist[u]:
+            continue  # entrée périmée
+        for v, w in adj[u]:
+            if h is not None:
+                w = w + h[u] - h[v]
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(tas, (nd, v))
+
+    if h is not None:
+        hs = h[source]
+        dist = [d if d == inf else d - hs + h[v] for v, d in enumerate(dist)]
+    return dist, pred
@@ -0,0 +1,93 @@
+# test_dynamic.py
+# Tests de non-régression des mises à jour incrémentales (dynamic.py) :
+# après une modification, L doit être celle d'un Floyd-Warshall complet
+# Usage : python -m unittest test_dynamic
+
+import os
+import random
+import tempfile
+import unittest
+
+from graph import Graph, SparseGraph
+from loader import load_graph_from_file
+from floyd import floyd_warshall, NUMPY_AVAILABLE
+from dynamic import DynamicShortestPaths
+from result_file import save_results, open_results
+
+if NUMPY_AVAILABLE:
+    import numpy as np
+
+GRAPH_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "graphs", "g14_application.txt")
+
+
+def full_recompute(dyn):
+    """Floyd-Warshall complet sur les arcs courants de dyn."""
+    g = Graph(dyn.n)
+    g.add_arcs((u, v, w) for u in range(dyn.n) for v, w in dyn.weights[u].items())
+    L, _, _ = floyd_warshall(g.L, g.P, verbose=False)
+    return L
+
+
+class DynamicFromSolvedResultTest(unittest.TestCase):
+
+    def setUp(self):
+        self.arcs = list(load_graph_from_file(GRAPH_FILE, SparseGraph).arcs())
+        self.n = load_graph_from_file(GRAPH_FILE, SparseGraph).n
+
+    def sparse_graph(self):
+        g = SparseGraph(self.n)
+        g.add_arcs(self.arcs)
+        return g
+
+    def dense_graph(self):
+        g = Graph(self.n)
+        g.add_arcs(self.arcs)
+        return g
+
+    def check_removals(self, dyn):
+        self.assertEqual(sum(len(s) for s in dyn.weights), len(self.arcs))
+        rng = random.Random(0)
+        for u, v, _ in rng.sample(self.arcs, 10):
+            dyn.remove_arc(u, v)
+            self.assertEqual(dyn.L, full_recompute(dyn))
+
+    def test_solved_graph_matrices_are_rejected(self):
+        g = self.dense_graph()
+        L, P, _ = floyd_warshall(g.L, g.P, verbose=False)
+        with self.assertRaises(ValueError):
+            DynamicShortestPaths(g, L, P)
+
+    def test_sparse_graph_solved_in_place(self):
+        # Les arcs d'un SparseGraph restent lisibles après floyd_warshall(g.L, g.P)
+        g = self.sparse_graph()
+        L, P, _ = floyd_warshall(g.L, g.P, verbose=False)
+        self.check_removals(DynamicShortestPaths(g, [list(l) for l in L], [list(p) for p in P]))
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "NumPy n'est pas installé")
+    def test_numpy_result(self):
+        g = self.dense_graph()
+        Ln = np.array(g.L, dtype=np.float64)
+        Pn = np.array([[-1 if p is None else p for p in ligne] for ligne in g.P], dtype=np.int64)
+        Ln, Pn, _ = floyd_warshall(Ln, Pn, verbose=False, engine="numpy")
+        self.check_removals(DynamicShortestPaths(g, Ln, Pn))
+
+    def test_saved_result(self):
+        g = self.sparse_graph()
+        L, P, cycle = floyd_warshall(g.L, g.P, verbose=False)
+        fd, path = tempfile.mkstemp(suffix=".fwr")
+        os.close(fd)
+        try:
+            save_results(path, L, P, cycle)
+            saved = open_results(path)
+            dyn = DynamicShortestPaths(g, saved.L, saved.P)
+            saved.close()
+            u, v, w = self.arcs[0]
+            dyn.decrease_arc(u, v, w - 1)
+            self.assertEqual(dyn.L, full_recompute(dyn))
+            self.check_removals(dyn)
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# test_graph.py
+# Tests des trois représentations de graphe (graph.py)
+# Usage : python -m unittest test_graph
+
+import unittest
+
+from graph import Graph, CompactGraph, SparseGraph
+
+GRAPH_CLASSES = (Graph, CompactGraph, SparseGraph)
+
+
+class VertexRangeTest(unittest.TestCase):
+
+    def test_sparse_graph_rejects_out_of_range_vertices(self):
+        for u, v in ((-1, 0), (0, -1), (3, 0), (0, 3)):
+            with self.subTest(u=u, v=v):
+                g = SparseGraph(3)
+                with self.assertRaises(IndexError):
+                    g.add_arc(u, v, 1)
+                with self.assertRaises(IndexError):
+                    g.add_arcs([(u, v, 1)])
+                self.assertEqual(g.arc_count(), 0)
+
+    def test_compact_and_sparse_agree_on_negative_source(self):
+        for classe in (CompactGraph, SparseGraph):
+            with self.subTest(classe=classe.__name__):
+                with self.assertRaises(IndexError):
+                    classe(3).add_arc(-1, 2, 5)
+
+
+class ZeroWeightLoopTest(unittest.TestCase):
+    """Une boucle de poids nul n'est un arc pour aucune des trois représentations."""
+
+    ARCS = [(0, 1, 4), (1, 1, 0), (2, 2, 3), (1, 2, -1), (0, 0, 7), (0, 0, 0)]
+
+    def build(self, classe, par_lot):
+        g = classe(3)
+        if par_lot:
+            g.add_arcs(self.ARCS)
+        else:
+            for u, v, w in self.ARCS:
+                g.add_arc(u, v, w)
+        return g
+
+    def test_same_arcs_for_every_class(self):
+        attendus = {(0, 1, 4), (2, 2, 3), (1, 2, -1)}
+        for classe in GRAPH_CLASSES:
+            for par_lot in (False, True):
+                with self.subTest(classe=classe.__name__, par_lot=par_lot):
+                    g = self.build(classe, par_lot)
+                    self.assertEqual(set(g.arcs()), attendus)
+                    self.assertEqual(g.arc_count(), len(attendus))
+                    self.assertEqual(sorted(g.neighbors(1)), [(2, -1)])
+                    self.assertEqual(sorted(g.neighbors(0)), [(1, 4)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+# tracing.py
+# Observateurs (hooks) pour suivre le déroulement de Floyd-Warshall
+# floyd_warshall appelle on_start, puis on_iteration(k, L, P) après chaque k, puis on_finish
+
+import sys
+from output import write_matrices, format_value
+
+class FloydObserver:
+    """
+    Interface d'un observateur de Floyd-Warshall. Toutes les méthodes sont
+    facultatives : la classe de base ne fait rien.
+    """
+
+    def on_start(self, L, P):
+        """Appelée une fois avant la première itération, avec les matrices initiales."""
+
+    def wants_iteration(self, k):
+        """
+        Indique si on_iteration doit être appelée pour k. Permet au moteur NumPy
+        de ne pas convertir les matrices pour les itérations ignorées.
+        """
+        return True
+
+    def on_iteration(self, k, L, P):
+        """Appelée après l'itération k (sommet k autorisé comme intermédiaire)."""
+
+    def on_early_stop(self, k, i):
+        """Appelée si le calcul s'arrête à l'itération k parce que L[i][i] < 0."""
+
+    def on_finish(self, L, P, cycle_negatif):
+        """Appelée une fois à la fin du calcul."""
+
+
+class TextTraceObserver(FloydObserver):
+    """
+    Trace texte complète (même contenu que l'affichage historique de floyd_warshall).
+    Les matrices sont écrites ligne par ligne à travers un tampon (output.write_matrices) :
+    peu d'appels à write, et jamais toute une matrice en mémoire sous forme de texte.
+    """
+
+    def __init__(self, stream=None, show_initial=True, columns=None, rows=None):
+        """
+        stream : objet fichier où écrire (sys.stdout par défaut)
+        show_initial : si True, écrit aussi les matrices initiales
+        columns / rows : fenêtre (début, fin) d'indices à afficher (par défaut, tout)
+        """
+        self.stream = stream
+        self.show_initial = show_initial
+        self.columns = columns
+        self.rows = rows
+
+    def _write(self, texte):
+        (self.stream or sys.stdout).write(texte)
+
+    def _write_matrices(self, L, P, step_desc):
+        write_matrices(L, P, self.stream or sys.stdout, step_desc, self.columns, self.rows)
+
+    def on_start(self, L, P):
+        if self.show_initial:
+            self._write_matrices(L, P, "Initialisation")
+
+    def on_iteration(self, k, L, P):
+        self._write(f"=== Début de l'itération k = {k} ===\n")
+        self._write_matrices(L, P, f"Après k = {k}")
+
+    def on_early_stop(self, k, i):
+        self._write(f"Arrêt anticipé à l'itération k = {k} : L[{i}][{i}] < 0.\n")
+
+    def on_finish(self, L, P, cycle_negatif):
+        if cycle_negatif:
+            self._write("!  Cycle absorbant détecté (cycle de poids négatif).\n")
+        else:
+            self._write("Aucun cycle absorbant détecté.\n")
+
+
+class SampledObserver(FloydObserver):
+    """
+    Transmet à un autre observateur une itération sur `every` (ainsi que la dernière).
+    Les appels on_start, on_early_stop et on_finish sont toujours transmis.
+    """
+
+    def __init__(self, inner, every=10):
+        if every < 1:
+            raise ValueError("every doit être un entier strictement positif.")
+        self.inner = inner
+        self.every = every
+        self.n = None
+
+    def on_start(self, L, P):
+        self.n = len(L)
+        self.inner.on_start(L, P)
+
+    def wants_iteration(self, k):
+        return (k % self.every == 0 or k == self.n - 1) and self.inner.wants_iteration(k)
+
+    def on_iteration(self, k, L, P):
+        if self.wants_iteration(k):
+            self.inner.on_iteration(k, L, P)
+
+    def on_early_stop(self, k, i):
+        self.inner.on_early_stop(k, i)
+
+    def on_finish(self, L, P, cycle_negatif):
+        self.inner.on_finish(L, P, cycle_negatif)
+
+
+class DiffObserver(TextTraceObserver):
+    """
+    N'écrit que les cases de L et P modifiées par chaque itération,
+    au lieu des deux matrices complètes.
+    """
+
+    def on_start(self, L, P):
+        super().on_start(L, P)
+        # Copie de l'état précédent, pour comparer après chaque itération
+        self.L = [list(ligne) for ligne in L]
+        self.P = [list(ligne) for ligne in P]
+
+    def on_iteration(self, k, L, P):
+        lignes = []
+        for i in range(len(L)):
+            ancien_L, ancien_P = self.L[i], self.P[i]
+            nouveau_L, nouveau_P = list(L[i]), list(P[i])
+            if nouveau_L == ancien_L and nouveau_P == ancien_P:
+                continue
+            for j, (l, p) in enumerate(zip(nouveau_L, nouveau_P)):
+                if l != ancien_L[j] or p != ancien_P[j]:
+                    lignes.append(f"  ({i}, {j}) : L {format_value(ancien_L[j])} -> {format_value(l)}, "
+                                  f"P {format_value(ancien_P[j])} -> {format_value(p)}\n")
+            self.L[i], self.P[i] = nouveau_L, nouveau_P
+
+        self._write(f"=== Itération k = {k} : {len(lignes)} case(s) modifiée(s) ===\n" + "".join(lignes))
@@ -1,6 +1,5 @@
 # visualizer.py
 
-from math import inf
 import os
 
 try:
@@ -146,43 +145,43 @@ def visualize_graph(graph, output_file="graph_visualization.html", show_weights=
                 font={"size": font_size, "color": "#000000", "face": "Arial", "bold": True}
             )
         
-        # Ajouter les arcs (extraits de la matrice L)
+        # Ajouter les arcs (les m arcs réels du graphe, sans parcourir la matrice L)
         arc_count = 0
-        for i in range(graph.n):
-            for j in range(graph.n):
-                if i != j and graph.L[i][j] != inf:
-                    weight = graph.L[i][j]
-                    arc_count += 1
-                    
-                    # Couleur de l'arc selon le poids
-                    if weight < 0:
-                        edge_color = "#ff6b6b"  # Rouge pour poids négatif
-                    elif weight == 0:
-                        edge_color = "#95e1d3"  # Vert clair pour poids nul
-                    else:
-                        edge_color = "#4ecdc4"  # Turquoise pour poids positif
-                    
-                    # Label de l'arc
-                    if show_weights:
-                        edge_label = str(weight)
-                    else:
-                        edge_label = ""
-                    
-                    # Titre de l'arc avec noms de villes si disponibles
-                    if node_labels and i in node_labels and j in node_labels:
-                        edge_title = f"{node_labels[i]} → {node_labels[j]} (poids: {weight})"
-                    else:
-                        edge_title = f"Arc {i} → {j} (poids: {weight})"
-                    
-                    net.add_edge(
-                        i,
-                        j,
-                        label=edge_label,
-                        title=edge_title,
-                        color=edge_color,
-                        width=2
-                    )
-        
+        for i, j, weight in graph.arcs():
+            # Les boucles i -> i ne sont pas dessinées
+            if i == j:
+                continue
+            arc_count += 1
+            
+            # Couleur de l'arc selon le poids
+            if weight < 0:
+                edge_color = "#ff6b6b"  # Rouge pour poids négatif
+            elif weight == 0:
+                edge_color = "#95e1d3"  # Vert clair pour poids nul
+            else:
+                edge_color = "#4ecdc4"  # Turquoise pour poids positif
+            
+            # Label de l'arc
+            if show_weights:
+                edge_label = str(weight)
+            else:
+                edge_label = ""
+            
+            # Titre de l'arc avec noms de villes si disponibles
+            if node_labels and i in node_labels and j in node_labels:
+                edge_title = f"{node_labels[i]} → {node_labels[j]} (poids: {weight})"
+            else:
+                edge_title = f"Arc {i} → {j} (poids: {weight})"
+            
+            net.add_edge(
+                i,
+                j,
+                label=edge_label,
+                title=edge_title,
+                color=edge_color,
+                width=2
+            )
+
         # Sauvegarder le fichier HTML
         net.save_graph(output_file)
         